@@ -12,15 +12,17 @@ from typing import Optional, Dict, Any, List
 
 # Import key components for external use - use absolute imports
 from .analyzer import AIAnalysis
-from .errors import AIAnalysisError, DatabaseError, APIError, RateLimitError
+from .errors import (AIAnalysisError, DatabaseError, APIError, RateLimitError,
+                     ErrorCode)
 from .config import AIAnalysisConfig
-from .utils import TokenCounter
+from .utils import TokenCounter, get_token_counter, count_tokens
 from .models import LegislationAnalysisResult
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Import database session if available
@@ -197,9 +199,12 @@ __all__ = [
     'DatabaseError',
     'APIError',
     'RateLimitError',
+    'ErrorCode',
     'AIAnalysisConfig',
     'LegislationAnalysisResult',
     'TokenCounter',
+    'get_token_counter',
+    'count_tokens',
     'analyze_legislation',
     'analyze_bill',
     'analyze_legislation_async',
@@ -17,15 +17,15 @@ from pydantic import ValidationError
 
 from .errors import (AIAnalysisError, TokenLimitError, APIError,
                                     DatabaseError)
-from .models import LegislationAnalysisResult
+from .models import LegislationAnalysisResult, warm_up_models
 from .config import AIAnalysisConfig
 from .openai_client import OpenAIClient
 from .chunking import TextChunker
-from .utils import (TokenCounter, create_analysis_instructions,
+from .utils import (get_token_counter, create_analysis_instructions,
                                    get_analysis_json_schema,
                                    create_user_prompt, merge_analyses,
                                    create_chunk_prompt,
-                                   calculate_priority_scores)
+                                   compute_priority_scores)
 
 # Import required models
 import sys
@@ -44,6 +44,21 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Analyses are requested deterministically so repeated requests are served by
+# OpenAIClient's response caches, which skip requests with temperature > 0
+_ANALYSIS_TEMPERATURE = 0.0
+
+
+def _parse_analysis_content(content: str) -> Dict[str, Any]:
+    """
+    Decode and validate a raw analysis response in one pass.
+
+    Passed to OpenAIClient as parse_result, so the response text goes straight
+    to LegislationAnalysisResult.from_llm_bytes instead of json.loads followed
+    by model validation.
+    """
+    return LegislationAnalysisResult.from_llm_bytes(content).model_dump()
+
 
 class AIAnalysis:
     """
@@ -81,18 +96,22 @@ class AIAnalysis:
             raise ValueError("Database session is required")
         self.db_session = db_session
 
-        self.token_counter = TokenCounter(model_name=self.config.model_name)
+        self.token_counter = get_token_counter(self.config.model_name)
         self.text_chunker = TextChunker(token_counter=self.token_counter)
         self.openai_client = OpenAIClient(
             api_key=self.config.openai_api_key,
             model_name=self.config.model_name,
             max_retries=self.config.max_retries,
-            retry_base_delay=self.config.retry_base_delay)
+            retry_base_delay=self.config.retry_base_delay,
+            retry_delays=self.config.retry_delays)
 
         self._analysis_cache: Dict[int, Tuple[datetime,
                                               LegislationAnalysis]] = {}
         self._cache_lock = Lock()
 
+        # Build the deferred result-model schemas before the first response
+        warm_up_models()
+
         logger.info(
             f"AIAnalysis initialized with model {self.config.model_name}")
 
@@ -237,13 +256,10 @@ class AIAnalysis:
             "content": user_message
         }]
         analysis_data = self.openai_client.call_structured_analysis(
-            messages=messages, json_schema=json_schema)
-        if analysis_data is not None:
-            try:
-                validated_data = LegislationAnalysisResult(**analysis_data)
-                return validated_data.model_dump()
-            except ValidationError as e:
-                logger.error(f"Response validation failed: {e}")
+            messages=messages,
+            json_schema=json_schema,
+            temperature=_ANALYSIS_TEMPERATURE,
+            parse_result=_parse_analysis_content)
         return analysis_data or {}
 
     def _analyze_in_chunks(self, chunks: List[str], structured: bool,
@@ -446,8 +462,8 @@ class AIAnalysis:
         with self._db_transaction():
             try:
                 # Calculate priority data from the analysis
-                priority_data = calculate_priority_scores(
-                    analysis_dict, legislation_id)
+                scores = compute_priority_scores(analysis_dict,
+                                                 legislation_id)
 
                 priority = self.db_session.query(
                     LegislationPriority).filter_by(
@@ -457,12 +473,9 @@ class AIAnalysis:
                     # Only update if it hasn't been manually reviewed
                     if not bool(priority.manually_reviewed):  # Convert to bool
                         # Use setattr for type safety or explicit type conversion
-                        health_relevance = int(
-                            priority_data.get("public_health_relevance") or 0)
-                        local_relevance = int(
-                            priority_data.get("local_govt_relevance") or 0)
-                        overall = int(
-                            priority_data.get("overall_priority") or 0)
+                        health_relevance = scores.public_health_relevance
+                        local_relevance = scores.local_govt_relevance
+                        overall = scores.overall_priority
 
                         # Option 1: Use setattr
                         setattr(priority, "public_health_relevance",
@@ -472,7 +485,7 @@ class AIAnalysis:
                         setattr(priority, "overall_priority", overall)
                         setattr(priority, "auto_categorized", True)
                         setattr(priority, "auto_categories",
-                                priority_data.get("auto_categories", {}))
+                                scores.auto_categories())
 
                         # Option 2: Alternative approach with explicit casts
                         # from sqlalchemy import Integer, Boolean, JSON
@@ -483,29 +496,24 @@ class AIAnalysis:
                         # priority.overall_priority = sql_cast(overall, Integer)
                         # priority.auto_categorized = sql_cast(True, Boolean)
                         # if hasattr(priority, "auto_categories"):
-                        #     priority.auto_categories = priority_data.get("auto_categories", {})
+                        #     priority.auto_categories = scores.auto_categories()
                 else:
                     # New priority creation
                     # This part might still need type fixing depending on the model
                     new_priority = LegislationPriority(
                         legislation_id=legislation_id,
-                        public_health_relevance=int(
-                            priority_data.get("public_health_relevance") or 0),
-                        local_govt_relevance=int(
-                            priority_data.get("local_govt_relevance") or 0),
-                        overall_priority=int(
-                            priority_data.get("overall_priority") or 0),
-                        auto_categorized=bool(
-                            priority_data.get("auto_categorized", False)),
-                        auto_categories=priority_data.get(
-                            "auto_categories", {}))
+                        public_health_relevance=scores.public_health_relevance,
+                        local_govt_relevance=scores.local_govt_relevance,
+                        overall_priority=scores.overall_priority,
+                        auto_categorized=True,
+                        auto_categories=scores.auto_categories())
                     self.db_session.add(new_priority)
 
                 logger.info(
                     f"Updated priority for legislation {legislation_id}: "
-                    f"health={priority_data.get('public_health_relevance')}, "
-                    f"local_govt={priority_data.get('local_govt_relevance')}, "
-                    f"overall={priority_data.get('overall_priority')}")
+                    f"health={scores.public_health_relevance}, "
+                    f"local_govt={scores.local_govt_relevance}, "
+                    f"overall={scores.overall_priority}")
 
             except SQLAlchemyError as e:
                 error_msg = (
@@ -783,13 +791,9 @@ class AIAnalysis:
             analysis_data = await self.openai_client.call_structured_analysis_async(
                 messages=messages,
                 json_schema=json_schema,
-                transaction_ctx=transaction_ctx)
-            if analysis_data is not None:
-                try:
-                    validated_data = LegislationAnalysisResult(**analysis_data)
-                    return validated_data.model_dump()
-                except ValidationError as e:
-                    logger.error(f"Response validation failed: {e}")
+                temperature=_ANALYSIS_TEMPERATURE,
+                transaction_ctx=transaction_ctx,
+                parse_result=_parse_analysis_content)
             return analysis_data or {}
         except Exception as e:
             logger.error(f"Error in async structured analysis: {e}")
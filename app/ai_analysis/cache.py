@@ -0,0 +1,268 @@
+"""
+Response caching for OpenAI structured analysis calls.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHE_SIZE = 1000
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_SIMILARITY_THRESHOLD = 0.97
+
+
+def canonical_digest(payload: Any) -> str:
+    """
+    Hash a JSON-serializable payload independently of dict key order.
+
+    Args:
+        payload: JSON-serializable object
+
+    Returns:
+        Hex BLAKE2b digest (128-bit) of the canonical JSON encoding
+    """
+    if HAS_ORJSON:
+        canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+# Digests of schema objects already hashed, keyed by id(). The schema is
+# kept alongside so a reused id() cannot match a different schema.
+_schema_digests: Dict[int, Tuple[Dict[str, Any], str]] = {}
+
+
+def _schema_digest(json_schema: Dict[str, Any]) -> str:
+    """
+    Return canonical_digest(json_schema), serializing each schema object once.
+
+    Schemas are treated as immutable, as with get_analysis_json_schema().
+    """
+    cached = _schema_digests.get(id(json_schema))
+    if cached is not None and cached[0] is json_schema:
+        return cached[1]
+    digest = canonical_digest(json_schema)
+    _schema_digests[id(json_schema)] = (json_schema, digest)
+    return digest
+
+
+def make_cache_key(model_name: str,
+                   messages: List[Dict[str, str]],
+                   json_schema: Dict[str, Any],
+                   temperature: float,
+                   reasoning_effort: Optional[str] = None,
+                   max_completion_tokens: Optional[int] = None) -> str:
+    """
+    Build a deterministic cache key for a structured analysis request.
+
+    Args:
+        model_name: Name of the model
+        messages: List of message objects for the API call
+        json_schema: JSON schema for structured output
+        temperature: Sampling temperature
+        reasoning_effort: Optional reasoning effort setting
+        max_completion_tokens: Optional completion token cap
+
+    Returns:
+        Hex digest identifying the request
+    """
+    return canonical_digest({
+        "model": model_name,
+        "messages": messages,
+        "schema": _schema_digest(json_schema),
+        "temp": temperature,
+        "reasoning": reasoning_effort,
+        "max_completion_tokens": max_completion_tokens
+    })
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of structured analysis responses with a TTL.
+
+    Other backends (SQLite, Redis, ...) can subclass this and override
+    lookup() and update().
+    """
+
+    def __init__(self,
+                 max_size: int = MAX_CACHE_SIZE,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached responses
+            ttl_seconds: Time in seconds before an entry expires
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict())
+        self._lock = Lock()
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the cached response for a key, or None if missing or
+        expired. A copy is returned so callers that merge results in place
+        cannot alter the cached entry.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Cached response dictionary or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def update(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a response, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key from make_cache_key()
+            value: Response dictionary to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a single cached response, if present.
+
+        Args:
+            key: Cache key to remove
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SemanticResponseCache:
+    """
+    Near-miss cache that matches requests by embedding cosine similarity.
+
+    Entries are grouped by a namespace (model, schema, system prompt and
+    sampling settings) so only otherwise-identical requests are compared.
+    Embeddings are L2-normalized on insert, so a lookup is a single
+    matrix-vector product.
+    """
+
+    def __init__(self,
+                 threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                 max_size: int = MAX_CACHE_SIZE):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_size: Maximum number of entries per namespace
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if not HAS_NUMPY:
+            raise ImportError(
+                "numpy is required for the semantic response cache")
+        self.threshold = threshold
+        self.max_size = max_size
+        self._vectors: Dict[str, Any] = {}
+        self._responses: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Any:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, namespace: str,
+               embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the most similar cached response above the threshold.
+
+        Args:
+            namespace: Namespace key for the request
+            embedding: Embedding of the request's user content
+
+        Returns:
+            Cached response dictionary or None
+        """
+        query = self._normalize(embedding)
+        with self._lock:
+            matrix = self._vectors.get(namespace)
+            if matrix is None or matrix.shape[1] != query.shape[0]:
+                return None
+            sims = matrix @ query
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+            value = self._responses[namespace][best]
+        logger.debug("Semantic cache hit (similarity=%.3f)", sims[best])
+        return copy.deepcopy(value)
+
+    def update(self, namespace: str, embedding: List[float],
+               value: Dict[str, Any]) -> None:
+        """
+        Store a response with its embedding, dropping the oldest when full.
+
+        Args:
+            namespace: Namespace key for the request
+            embedding: Embedding of the request's user content
+            value: Response dictionary to cache
+        """
+        row = self._normalize(embedding)[np.newaxis, :]
+        with self._lock:
+            matrix = self._vectors.get(namespace)
+            responses = self._responses.setdefault(namespace, [])
+            if matrix is None or matrix.shape[1] != row.shape[1]:
+                matrix = row
+                responses.clear()
+            else:
+                matrix = np.vstack((matrix, row))
+            responses.append(copy.deepcopy(value))
+            if len(responses) > self.max_size:
+                matrix = matrix[1:]
+                del responses[0]
+            self._vectors[namespace] = matrix
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._vectors.clear()
+            self._responses.clear()
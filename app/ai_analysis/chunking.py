@@ -46,7 +46,7 @@ class TextChunker:
 
         try:
             # If text fits in one chunk, return it directly
-            if self.token_counter.count_tokens(text) <= max_tokens:
+            if self.token_counter.fits(text, max_tokens):
                 return ([text], False)
 
             # Look for section markers that indicate document structure
@@ -96,10 +96,10 @@ class TextChunker:
             logger.info(
                 f"Split text into {len(chunks)} chunks, has_structure={has_structure}"
             )
-            for i, chunk in enumerate(chunks):
-                logger.debug(
-                    f"Chunk {i+1}: ~{self.token_counter.count_tokens(chunk)} tokens"
-                )
+            if logger.isEnabledFor(logging.DEBUG):
+                chunk_tokens = self.token_counter.count_tokens_batch(chunks)
+                for i, tokens in enumerate(chunk_tokens):
+                    logger.debug("Chunk %d: ~%d tokens", i + 1, tokens)
 
             return (chunks, has_structure)
 
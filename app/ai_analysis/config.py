@@ -4,15 +4,26 @@ Configuration settings for the AI Analysis module.
 
 import os
 import logging
+from functools import cached_property
 from pydantic import BaseModel, field_validator
-from typing import Optional
+from typing import Optional, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Allowed values for AIAnalysisConfig.log_level
+_VALID_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+_VALID_LOG_LEVELS_MSG = (
+    "log_level must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL")
+
+# OPENAI_API_KEY read once at import; call refresh_env_cache() if it changes
+_ENV_OPENAI_API_KEY: Optional[str] = os.environ.get("OPENAI_API_KEY")
+
+
+def refresh_env_cache() -> None:
+    """Re-read the cached environment values used by config validation."""
+    global _ENV_OPENAI_API_KEY
+    _ENV_OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
+
 
 class AIAnalysisConfig(BaseModel):
     """Configuration parameters for the AIAnalysis class."""
@@ -25,6 +36,12 @@ class AIAnalysisConfig(BaseModel):
     cache_ttl_minutes: int = 30
     log_level: str = "INFO"
 
+    @cached_property
+    def retry_delays(self) -> Tuple[float, ...]:
+        """Exponential backoff delay for each retry attempt."""
+        return tuple(self.retry_base_delay * (2**i)
+                     for i in range(self.max_retries))
+
     @field_validator('max_context_tokens')
     @classmethod
     def validate_max_context_tokens(cls, v):
@@ -62,17 +79,15 @@ class AIAnalysisConfig(BaseModel):
     @field_validator('log_level')
     @classmethod
     def validate_log_level(cls, v):
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v not in valid_levels:
-            raise ValueError(
-                f"log_level must be one of: {', '.join(valid_levels)}")
+        if v not in _VALID_LOG_LEVELS:
+            raise ValueError(_VALID_LOG_LEVELS_MSG)
         return v
 
     @field_validator('openai_api_key')
     @classmethod
     def validate_api_key(cls, v, info):
         # This validator needs to check the environment variable if v is None
-        if v is None and not os.environ.get("OPENAI_API_KEY"):
+        if v is None and not _ENV_OPENAI_API_KEY:
             raise ValueError(
                 "OpenAI API key must be provided or set in OPENAI_API_KEY environment variable"
             )
@@ -82,6 +97,10 @@ class AIAnalysisConfig(BaseModel):
 # Set up logger level based on environment
 def configure_logging(level_name="INFO"):
     """Configure logging level from string name."""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     level = getattr(logging, level_name)
     logger.setLevel(level)
 
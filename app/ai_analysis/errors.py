@@ -2,32 +2,44 @@
 Custom exceptions for AI analysis error handling.
 """
 
+from enum import IntEnum
+
+
+class ErrorCode(IntEnum):
+    """Integer codes identifying each AI analysis error type."""
+    AI_ANALYSIS = 0
+    TOKEN_LIMIT = 1
+    API = 2
+    RATE_LIMIT = 3
+    CONTENT_PROCESSING = 4
+    DATABASE = 5
+
 
 class AIAnalysisError(Exception):
     """Base exception class for AI analysis errors."""
-    pass
+    CODE = ErrorCode.AI_ANALYSIS
 
 
 class TokenLimitError(AIAnalysisError):
     """Raised when content exceeds token limits."""
-    pass
+    CODE = ErrorCode.TOKEN_LIMIT
 
 
 class APIError(AIAnalysisError):
     """Raised when OpenAI API returns an error."""
-    pass
+    CODE = ErrorCode.API
 
 
 class RateLimitError(APIError):
     """Raised when OpenAI rate limits are hit."""
-    pass
+    CODE = ErrorCode.RATE_LIMIT
 
 
 class ContentProcessingError(AIAnalysisError):
     """Raised when content processing (splitting, merging) fails."""
-    pass
+    CODE = ErrorCode.CONTENT_PROCESSING
 
 
 class DatabaseError(AIAnalysisError):
     """Raised when database operations fail."""
-    pass
+    CODE = ErrorCode.DATABASE
@@ -1,64 +1,199 @@
 """
 Pydantic models for structured validation of AI analysis results.
+
+Fresh model output should be validated from the raw JSON text with
+LegislationAnalysisResult.from_llm_bytes (or parse_result_json) rather than
+json.loads followed by model_validate.
 """
 
-from typing import Dict, List, Any, Literal
-from pydantic import BaseModel, Field, model_validator
+import sys
+from functools import lru_cache
+from typing import Union
+from pydantic import BaseModel, Field, field_validator
+# pydantic requires typing_extensions.TypedDict before Python 3.12
+from typing_extensions import TypedDict
+
+# Allowed values for the enumerated string fields
+_IMPACT_TYPES = frozenset(("positive", "negative", "neutral"))
+_PRIMARY_CATEGORIES = frozenset(("public_health", "local_gov", "economic",
+                                 "environmental", "education",
+                                 "infrastructure"))
+_IMPACT_LEVELS = frozenset(("low", "moderate", "high", "critical"))
+_TEXAS_RELEVANCE_LEVELS = frozenset(("low", "moderate", "high"))
+
+_IMPACT_TYPE_MSG = "impact_type must be one of: positive, negative, neutral"
+_PRIMARY_CATEGORY_MSG = (
+    "primary_category must be one of: public_health, local_gov, economic, "
+    "environmental, education, infrastructure")
+_IMPACT_LEVEL_MSG = "impact_level must be one of: low, moderate, high, critical"
+_TEXAS_RELEVANCE_MSG = "relevance_to_texas must be one of: low, moderate, high"
+
+# Interned copy of every allowed value, so validated instances share one string
+# object per value instead of each holding its own copy
+_INTERNED = {
+    value: sys.intern(value)
+    for value in (_IMPACT_TYPES | _PRIMARY_CATEGORIES | _IMPACT_LEVELS
+                  | _TEXAS_RELEVANCE_LEVELS)
+}
 
 
 class KeyPoint(BaseModel):
     """Model representing a key point in the legislation analysis."""
     point: str = Field(..., description="The text of the bullet point")
-    impact_type: Literal["positive", "negative", "neutral"] = Field(
+    impact_type: str = Field(
         ..., description="The overall tone or impact of this point")
 
+    model_config = {
+        "frozen": True,
+        "extra": "forbid",
+        "defer_build": True,
+        "validate_assignment": False,
+    }
+
+    @field_validator('impact_type')
+    @classmethod
+    def validate_impact_type(cls, v):
+        if v not in _IMPACT_TYPES:
+            raise ValueError(_IMPACT_TYPE_MSG)
+        return _INTERNED[v]
+
 
-class PublicHealthImpacts(BaseModel):
-    """Model representing public health impacts of the legislation."""
-    direct_effects: List[str] = Field(default_factory=list)
-    indirect_effects: List[str] = Field(default_factory=list)
-    funding_impact: List[str] = Field(default_factory=list)
-    vulnerable_populations: List[str] = Field(default_factory=list)
+# The impact containers are plain lists of strings with no invariants of their
+# own, so they are TypedDicts validated as part of LegislationAnalysisResult
+# rather than separate nested models.
+class PublicHealthImpacts(TypedDict, total=False):
+    """Public health impacts of the legislation."""
+    direct_effects: list[str]
+    indirect_effects: list[str]
+    funding_impact: list[str]
+    vulnerable_populations: list[str]
 
 
-class LocalGovernmentImpacts(BaseModel):
-    """Model representing local government impacts of the legislation."""
-    administrative: List[str] = Field(default_factory=list)
-    fiscal: List[str] = Field(default_factory=list)
-    implementation: List[str] = Field(default_factory=list)
+class LocalGovernmentImpacts(TypedDict, total=False):
+    """Local government impacts of the legislation."""
+    administrative: list[str]
+    fiscal: list[str]
+    implementation: list[str]
 
 
-class EconomicImpacts(BaseModel):
-    """Model representing economic impacts of the legislation."""
-    direct_costs: List[str] = Field(default_factory=list)
-    economic_effects: List[str] = Field(default_factory=list)
-    benefits: List[str] = Field(default_factory=list)
-    long_term_impact: List[str] = Field(default_factory=list)
+class EconomicImpacts(TypedDict, total=False):
+    """Economic impacts of the legislation."""
+    direct_costs: list[str]
+    economic_effects: list[str]
+    benefits: list[str]
+    long_term_impact: list[str]
 
 
 class ImpactSummary(BaseModel):
     """Model representing the overall impact summary."""
-    primary_category: Literal["public_health", "local_gov", "economic",
-                              "environmental", "education", "infrastructure"]
-    impact_level: Literal["low", "moderate", "high", "critical"]
-    relevance_to_texas: Literal["low", "moderate", "high"]
+    primary_category: str
+    impact_level: str
+    relevance_to_texas: str
+
+    model_config = {
+        "frozen": True,
+        "extra": "forbid",
+        "defer_build": True,
+        "validate_assignment": False,
+    }
+
+    @field_validator('primary_category')
+    @classmethod
+    def validate_primary_category(cls, v):
+        if v not in _PRIMARY_CATEGORIES:
+            raise ValueError(_PRIMARY_CATEGORY_MSG)
+        return _INTERNED[v]
+
+    @field_validator('impact_level')
+    @classmethod
+    def validate_impact_level(cls, v):
+        if v not in _IMPACT_LEVELS:
+            raise ValueError(_IMPACT_LEVEL_MSG)
+        return _INTERNED[v]
+
+    @field_validator('relevance_to_texas')
+    @classmethod
+    def validate_relevance_to_texas(cls, v):
+        if v not in _TEXAS_RELEVANCE_LEVELS:
+            raise ValueError(_TEXAS_RELEVANCE_MSG)
+        return _INTERNED[v]
 
 
 class LegislationAnalysisResult(BaseModel):
-    """Complete model for structured analysis results from the AI model."""
+    """
+    Complete model for structured analysis results from the AI model.
+
+    Every field is listed as required in the structured-output schema sent to
+    OpenAI, so the list fields carry no default factories.
+    """
     summary: str
-    key_points: List[KeyPoint]
+    key_points: list[KeyPoint]
     public_health_impacts: PublicHealthImpacts
     local_government_impacts: LocalGovernmentImpacts
     economic_impacts: EconomicImpacts
-    environmental_impacts: List[str] = Field(default_factory=list)
-    education_impacts: List[str] = Field(default_factory=list)
-    infrastructure_impacts: List[str] = Field(default_factory=list)
-    recommended_actions: List[str] = Field(default_factory=list)
-    immediate_actions: List[str] = Field(default_factory=list)
-    resource_needs: List[str] = Field(default_factory=list)
+    environmental_impacts: list[str]
+    education_impacts: list[str]
+    infrastructure_impacts: list[str]
+    recommended_actions: list[str]
+    immediate_actions: list[str]
+    resource_needs: list[str]
     impact_summary: ImpactSummary
 
     model_config = {
         "extra": "forbid",  # Prevent extra fields
+        "defer_build": True,  # Build the core schema on first use
+        "validate_assignment": False,
     }
+
+    @classmethod
+    def from_llm_bytes(
+            cls, raw: Union[str, bytes]) -> "LegislationAnalysisResult":
+        """
+        Validate a raw model response into a LegislationAnalysisResult.
+
+        Callers should pass the response text or bytes as received, not a dict
+        produced by json.loads; pydantic-core parses the JSON directly, which
+        avoids building and then re-walking an intermediate dict.
+
+        Args:
+            raw: JSON text or bytes returned by the model
+
+        Returns:
+            Validated LegislationAnalysisResult
+        """
+        return parse_result_json(raw)
+
+
+def warm_up_models() -> None:
+    """
+    Build the deferred validation schemas for the analysis result models.
+
+    The models use defer_build so importing this module stays cheap; call this
+    once from the analysis pipeline's setup to pay the build cost up front.
+    """
+    for model in (KeyPoint, ImpactSummary, LegislationAnalysisResult):
+        model.model_rebuild()
+
+
+@lru_cache(maxsize=8)
+def _result_adapter():
+    """Build the TypeAdapter for LegislationAnalysisResult once and reuse it."""
+    from pydantic import TypeAdapter
+    return TypeAdapter(LegislationAnalysisResult)
+
+
+def parse_result_json(raw: Union[str, bytes]) -> LegislationAnalysisResult:
+    """
+    Validate a raw JSON document into a LegislationAnalysisResult.
+
+    The JSON is parsed directly by pydantic-core, without building an
+    intermediate dict with json.loads.
+
+    Args:
+        raw: JSON text or bytes
+
+    Returns:
+        Validated LegislationAnalysisResult
+    """
+    return _result_adapter().validate_json(raw)
+
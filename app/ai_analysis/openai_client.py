@@ -1,13 +1,16 @@
 """ OpenAI client interface for making API calls with appropriate error handling. """
 
 import os
+import copy
 import json
 import time
 import logging
 import re
 import asyncio
-from typing import Dict, List, Any, Optional
-from contextlib import contextmanager
+import random
+from typing import Dict, List, Any, Optional, Tuple, AsyncIterator, Callable
+from contextlib import contextmanager, nullcontext
+from threading import Lock
 
 # Import OpenAI with version checking
 try:
@@ -20,6 +23,47 @@ except ImportError:
         "Failed to import OpenAI package. Please install with: pip install openai"
     )
 
+# httpx is installed with the new SDK; HTTP/2 additionally needs the h2 package
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+# Typed SDK exceptions for retry classification (openai>=1.0)
+if HAS_NEW_OPENAI:
+    from openai import (RateLimitError as OpenAIRateLimitError,
+                        APITimeoutError, APIConnectionError,
+                        InternalServerError)
+    from openai import (AuthenticationError, BadRequestError,
+                        PermissionDeniedError, NotFoundError,
+                        UnprocessableEntityError)
+    # APITimeoutError subclasses APIConnectionError, so it is checked first
+    _RETRYABLE_ERROR_CLASSES = ((OpenAIRateLimitError, "Rate limit"),
+                                (APITimeoutError, "Timeout"),
+                                (InternalServerError, "Server"),
+                                (APIConnectionError, "Connection"))
+    # Errors that retrying cannot fix; these fail immediately
+    _NON_RETRYABLE_ERROR_CLASSES = (AuthenticationError, BadRequestError,
+                                    PermissionDeniedError, NotFoundError,
+                                    UnprocessableEntityError)
+else:
+    _RETRYABLE_ERROR_CLASSES = ()
+    _NON_RETRYABLE_ERROR_CLASSES = ()
+
+# Prefer orjson for parsing responses when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 try:
     from sqlalchemy.orm import Session
     from sqlalchemy.exc import SQLAlchemyError
@@ -28,9 +72,199 @@ except ImportError:
     HAS_SQLALCHEMY = False
 
 from .errors import APIError, RateLimitError, AIAnalysisError, DatabaseError
+from .utils import get_token_counter
+from .cache import (ResponseCache, SemanticResponseCache, canonical_digest,
+                    make_cache_key, DEFAULT_SIMILARITY_THRESHOLD)
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by _safe_json_load to recover JSON from non-JSON responses
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+_JSON_OBJ_RE = re.compile(r"(\{[\s\S]*\})")
+
+# Retryable error keywords, mapped to the error type they indicate
+_ERROR_KEYWORD_RE = re.compile(r"rate[_ ]limit|timeout|server error|5xx|connection",
+                               re.IGNORECASE)
+_ERROR_KEYWORD_TYPES = {
+    "rate limit": "Rate limit",
+    "rate_limit": "Rate limit",
+    "timeout": "Timeout",
+    "server error": "Server",
+    "5xx": "Server",
+    "connection": "Connection"
+}
+# Precedence when a message mentions more than one error type
+_RETRYABLE_ERROR_TYPES = ("Rate limit", "Timeout", "Server", "Connection")
+
+
+def _classify_error_message(error_msg: str) -> Tuple[str, bool, bool]:
+    """
+    Classify an API error from its message.
+
+    Args:
+        error_msg: The exception message
+
+    Returns:
+        Tuple of (error type label, whether to retry, whether it is a rate limit)
+    """
+    found = {
+        _ERROR_KEYWORD_TYPES[match.lower()]
+        for match in _ERROR_KEYWORD_RE.findall(error_msg)
+    }
+    for error_type in _RETRYABLE_ERROR_TYPES:
+        if error_type in found:
+            return error_type, True, error_type == "Rate limit"
+    return "API", False, False
+
+
+def _classify_error(error: Exception) -> Tuple[str, bool, bool]:
+    """
+    Classify an exception raised by an API call.
+
+    The new SDK raises typed exceptions, so those are matched by class; the
+    message is only inspected for the legacy SDK.
+
+    Args:
+        error: The raised exception
+
+    Returns:
+        Tuple of (error type label, whether to retry, whether it is a rate limit)
+    """
+    if not HAS_NEW_OPENAI:
+        return _classify_error_message(str(error))
+    for error_class, error_type in _RETRYABLE_ERROR_CLASSES:
+        if isinstance(error, error_class):
+            return error_type, True, error_type == "Rate limit"
+    return "API", False, False
+
+
+# Upper bound on a single backoff delay, in seconds
+_MAX_RETRY_DELAY = 60.0
+
+# Retries for responses with empty content, separate from API error retries
+_MAX_EMPTY_RETRIES = 2
+_EMPTY_RETRY_BASE_DELAY = 0.2
+
+# Requests with more user content than this are not embedded, so the semantic
+# cache never matches on a truncated prefix of a long bill
+_MAX_EMBEDDING_CHARS = 30_000
+
+
+# Per-message overhead of the chat format, in tokens
+_TOKENS_PER_MESSAGE = 4
+
+
+def _estimate_message_tokens(messages: List[Dict[str, str]],
+                             model_name: str) -> int:
+    """
+    Estimate the prompt tokens of a message list.
+
+    Uses the shared TokenCounter for the model, whose cache is keyed by a
+    digest of the text, so repeated prompts are encoded once without keeping
+    large bill texts alive.
+    """
+    count_tokens = get_token_counter(model_name).count_tokens
+    return sum(count_tokens(m.get("content", ""))
+               for m in messages) + _TOKENS_PER_MESSAGE * len(messages)
+
+
+class _TokenBucket:
+    """
+    Paces requests to stay under per-minute request and token limits.
+
+    Both buckets refill continuously; acquire() waits until there is capacity
+    for one request and its estimated tokens. A limit of None is unlimited.
+    """
+
+    def __init__(self, requests_per_minute: Optional[int],
+                 tokens_per_minute: Optional[int]):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self.request_tokens = float(requests_per_minute or 0)
+        self.token_tokens = float(tokens_per_minute or 0)
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.last
+        self.last = now
+        if self.rpm:
+            self.request_tokens = min(self.rpm,
+                                      self.request_tokens + elapsed * self.rpm / 60)
+        if self.tpm:
+            self.token_tokens = min(self.tpm,
+                                    self.token_tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """
+        Wait until a request with the given token estimate fits the limits.
+
+        Args:
+            estimated_tokens: Estimated tokens the request will consume
+        """
+        if self.tpm:
+            # A single request larger than the whole budget waits for a full bucket
+            estimated_tokens = min(estimated_tokens, self.tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = 0.0
+                if self.rpm and self.request_tokens < 1:
+                    wait = (1 - self.request_tokens) * 60 / self.rpm
+                if self.tpm and self.token_tokens < estimated_tokens:
+                    wait = max(wait, (estimated_tokens - self.token_tokens) *
+                               60 / self.tpm)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.rpm:
+                self.request_tokens -= 1
+            if self.tpm:
+                self.token_tokens -= estimated_tokens
+
+
+# HTTP connection pool shared by every OpenAIClient's async client; created
+# on first use and closed with close_shared_http_client() at shutdown
+_shared_http_client: Optional[Any] = None
+_shared_http_client_lock = Lock()
+
+
+def _get_shared_http_client() -> Optional[Any]:
+    """
+    Return the process-wide HTTP client for async requests, creating it once
+    with a connection pool sized for concurrent batch calls.
+
+    Returns:
+        httpx.AsyncClient, or None if httpx is unavailable
+    """
+    global _shared_http_client
+    if not HAS_HTTPX:
+        return None
+    with _shared_http_client_lock:
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            _shared_http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=200,
+                                    max_keepalive_connections=50),
+                timeout=httpx.Timeout(600.0, connect=10.0),
+                http2=HAS_HTTP2)
+        return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client and its connection pool, if created."""
+    global _shared_http_client
+    with _shared_http_client_lock:
+        client, _shared_http_client = _shared_http_client, None
+    if client is not None:
+        await client.aclose()
+
+
+# Response cache shared by every OpenAIClient that is not given its own.
+# AIAnalysis (and so OpenAIClient) is created per API request, so a
+# per-instance cache would never be hit by a later request.
+_shared_response_cache = ResponseCache()
+
 
 class OpenAIClient:
     """ Wrapper for OpenAI API client with retry logic and error handling. """
@@ -42,6 +276,15 @@ class OpenAIClient:
         max_retries: int = 3,
         retry_base_delay: float = 1.0,
         db_session: Optional[Any] = None,
+        retry_delays: Optional[Tuple[float, ...]] = None,
+        response_cache: Optional[ResponseCache] = None,
+        enable_cache: bool = True,
+        enable_semantic_cache: bool = False,
+        semantic_cache_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        embedding_model: str = "text-embedding-3-small",
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        stream_responses: bool = False,
     ):
         """
         Initialize the OpenAI client.
@@ -52,6 +295,23 @@ class OpenAIClient:
             max_retries: Maximum number of retry attempts
             retry_base_delay: Base delay for exponential backoff
             db_session: Optional SQLAlchemy session for transaction support
+            retry_delays: Precomputed backoff delay per attempt; derived from
+                retry_base_delay when omitted
+            response_cache: Cache backend for responses; the process-wide
+                in-memory LRU cache is used when omitted
+            enable_cache: Whether to cache responses at all
+            enable_semantic_cache: Whether to also match cached responses by
+                embedding similarity when the exact cache misses
+            semantic_cache_threshold: Minimum cosine similarity for a
+                semantic cache hit
+            embedding_model: Model used to embed requests for the semantic
+                cache
+            requests_per_minute: Account request limit used to pace batch
+                requests; unlimited when None
+            tokens_per_minute: Account token limit used to pace batch
+                requests; unlimited when None
+            stream_responses: Whether to stream completions, so output starts
+                arriving before generation finishes
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY", "")
         if not self.api_key:
@@ -62,13 +322,35 @@ class OpenAIClient:
         self.model_name = model_name
         self.max_retries = max_retries
         self.retry_base_delay = retry_base_delay
+        self.retry_delays = retry_delays or tuple(
+            retry_base_delay * (2**i) for i in range(max_retries))
         self.db_session = db_session
+        self._response_formats: Dict[int, Tuple[Dict[str, Any],
+                                                Dict[str, Any]]] = {}
+        if enable_cache:
+            self.response_cache = response_cache or _shared_response_cache
+        else:
+            self.response_cache = None
+        self.embedding_model = embedding_model
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.stream_responses = stream_responses
+        if enable_cache and enable_semantic_cache and HAS_NEW_OPENAI:
+            self.semantic_cache = SemanticResponseCache(
+                threshold=semantic_cache_threshold)
+        else:
+            self.semantic_cache = None
 
         # Initialize client based on OpenAI SDK version
         if HAS_NEW_OPENAI:
             self.client = OpenAI(api_key=self.api_key)
             if HAS_ASYNC_OPENAI:
-                self.async_client = AsyncOpenAI(api_key=self.api_key)
+                self._http_client = _get_shared_http_client()
+                if self._http_client is not None:
+                    self.async_client = AsyncOpenAI(
+                        api_key=self.api_key, http_client=self._http_client)
+                else:
+                    self.async_client = AsyncOpenAI(api_key=self.api_key)
             else:
                 self.async_client = None
         else:
@@ -85,42 +367,232 @@ class OpenAIClient:
         """
         self.db_session = db_session
 
-    @contextmanager
     def transaction(self):
         """
         Provides a transaction context if a database session is available.
-        If no session is available, yields a null context.
+        If no session is available, returns a null context.
 
         Usage:
             with client.transaction() as transaction:
                 # operations inside a transaction
 
-        Yields:
-            SQLAlchemy transaction context or null context
+        Returns:
+            Context manager yielding the SQLAlchemy transaction, or None
         """
         if HAS_SQLALCHEMY and self.db_session:
-            transaction = self.db_session.begin_nested()
-            try:
-                yield transaction
-            except Exception as e:
-                logger.error(f"Error in transaction: {e}")
+            return self._db_transaction()
+        return nullcontext(None)
 
-                if transaction.is_active:  # Make sure transaction is active before rollback
-                    transaction.rollback()
+    @contextmanager
+    def _db_transaction(self):
+        """
+        Wraps operations in a nested transaction on the database session.
 
-                raise
-            finally:
-                # Ensure transaction is closed properly if not committed
-                if transaction.is_active:
-                    transaction.commit()
+        Yields:
+            SQLAlchemy transaction context
+        """
+        transaction = self.db_session.begin_nested()
+        try:
+            yield transaction
+        except Exception as e:
+            logger.error("Error in transaction: %s", e)
 
-        else:
-            # Null context if no session available
-            try:
-                yield None
-            except Exception as e:
-                logger.error(f"Error in null transaction context: {e}")
-                raise
+            if transaction.is_active:  # Make sure transaction is active before rollback
+                transaction.rollback()
+
+            raise
+        finally:
+            # Ensure transaction is closed properly if not committed
+            if transaction.is_active:
+                transaction.commit()
+
+    @staticmethod
+    def _collect_stream(stream: Any) -> str:
+        """
+        Collect the content deltas of a streamed chat completion.
+
+        Args:
+            stream: Iterator of completion chunks
+
+        Returns:
+            The full response content
+        """
+        parts = []
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
+    @staticmethod
+    async def _collect_stream_async(stream: Any) -> str:
+        """
+        Async version of _collect_stream.
+
+        Args:
+            stream: Async iterator of completion chunks
+
+        Returns:
+            The full response content
+        """
+        parts = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """
+        Compute the backoff before the next retry.
+
+        Honors the server's Retry-After header when present; otherwise uses
+        capped exponential backoff with full jitter so concurrent workers do
+        not retry in lockstep.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            error: The exception raised by the attempt
+
+        Returns:
+            Delay in seconds
+        """
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after:
+                try:
+                    return min(float(retry_after), _MAX_RETRY_DELAY)
+                except ValueError:
+                    pass
+        return random.uniform(
+            0, min(self.retry_delays[attempt], _MAX_RETRY_DELAY))
+
+    def _get_response_format(self, json_schema: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the response_format wrapper for a schema, reusing the same dict
+        for repeated calls with the same schema object.
+
+        Args:
+            json_schema: JSON schema for structured output
+
+        Returns:
+            response_format parameter for the chat completions API
+        """
+        cached = self._response_formats.get(id(json_schema))
+        # The schema is kept alongside so a reused id() cannot match a new schema
+        if cached is not None and cached[0] is json_schema:
+            return cached[1]
+        response_format = {"type": "json_schema", "json_schema": json_schema}
+        self._response_formats[id(json_schema)] = (json_schema,
+                                                   response_format)
+        return response_format
+
+    def _build_params(self, messages: List[Dict[str, str]],
+                      json_schema: Dict[str, Any], temperature: float,
+                      reasoning_effort: Optional[str],
+                      max_completion_tokens: Optional[int],
+                      store: bool) -> Dict[str, Any]:
+        """
+        Build the chat completions parameters for a structured analysis call.
+        """
+        params = {
+            "model": self.model_name,
+            "messages": messages,
+            "temperature": temperature,
+            "response_format": self._get_response_format(json_schema),
+            "max_tokens":
+            8000,  # Legacy parameter but keeping for compatibility
+            "store": store
+        }
+
+        # Add optional parameters if provided
+        if reasoning_effort is not None:
+            params["reasoning_effort"] = reasoning_effort
+        if max_completion_tokens is not None:
+            params["max_completion_tokens"] = max_completion_tokens
+        return params
+
+    def _response_cache_key(self, messages: List[Dict[str, str]],
+                            json_schema: Dict[str, Any], temperature: float,
+                            reasoning_effort: Optional[str],
+                            max_completion_tokens: Optional[int],
+                            store: bool) -> Optional[str]:
+        """
+        Return the cache key for a request, or None if it should not be cached.
+
+        Only deterministic requests (temperature of 0) are cached, and requests
+        with store=False are never cached since they may contain sensitive data.
+        """
+        if self.response_cache is None or not store or temperature > 0:
+            return None
+        return make_cache_key(self.model_name, messages, json_schema,
+                              temperature, reasoning_effort,
+                              max_completion_tokens)
+
+    def _semantic_namespace(self, messages: List[Dict[str, str]],
+                            json_schema: Dict[str, Any], temperature: float,
+                            reasoning_effort: Optional[str],
+                            max_completion_tokens: Optional[int]) -> str:
+        """
+        Return the semantic cache namespace for a request: everything except
+        the user content, which is compared by embedding instead.
+        """
+        system_messages = [m for m in messages if m.get("role") == "system"]
+        return make_cache_key(self.model_name, system_messages, json_schema,
+                              temperature, reasoning_effort,
+                              max_completion_tokens)
+
+    @staticmethod
+    def _embedding_input(messages: List[Dict[str, str]]) -> Optional[str]:
+        """
+        Concatenate the user content of a request for embedding.
+
+        Returns:
+            The text to embed, or None if it is too long to embed whole
+        """
+        text = "\n".join(m.get("content", "") for m in messages
+                         if m.get("role") == "user")
+        if len(text) > _MAX_EMBEDDING_CHARS:
+            return None
+        return text
+
+    def _embed(self, messages: List[Dict[str, str]]) -> Optional[List[float]]:
+        """
+        Embed the user content of a request for the semantic cache.
+
+        Returns:
+            Embedding vector, or None if the content is too long to embed
+            or the embedding call failed
+        """
+        text = self._embedding_input(messages)
+        if text is None:
+            return None
+        try:
+            response = self.client.embeddings.create(
+                model=self.embedding_model, input=text)
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning("Semantic cache embedding failed: %s", e)
+            return None
+
+    async def _embed_async(
+            self, messages: List[Dict[str, str]]) -> Optional[List[float]]:
+        """
+        Async version of _embed.
+
+        Returns:
+            Embedding vector, or None if the content is too long to embed
+            or the embedding call failed
+        """
+        text = self._embedding_input(messages)
+        if text is None:
+            return None
+        try:
+            response = await self.async_client.embeddings.create(
+                model=self.embedding_model, input=text)
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning("Semantic cache embedding failed: %s", e)
+            return None
 
     def call_structured_analysis(
             self,
@@ -130,7 +602,9 @@ class OpenAIClient:
             reasoning_effort: Optional[str] = None,
             max_completion_tokens: Optional[int] = None,
             store: bool = True,
-            transaction_ctx: Optional[Any] = None) -> Dict[str, Any]:
+            transaction_ctx: Optional[Any] = None,
+            parse_result: Optional[Callable[[str], Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Call OpenAI API with retry logic and structured output validation.
 
@@ -142,6 +616,8 @@ class OpenAIClient:
             max_completion_tokens: Cap on total tokens (reasoning + visible output)
             store: Whether to store completions (set false for sensitive data)
             transaction_ctx: Optional transaction context from self.transaction()
+            parse_result: Optional parser that validates the raw response
+                content directly; see _parse_content()
 
         Returns:
             Structured analysis as a dictionary
@@ -150,35 +626,51 @@ class OpenAIClient:
             APIError: On unrecoverable API errors
             RateLimitError: On API rate limit errors
         """
-        for attempt in range(self.max_retries + 1):
+        cache_key = self._response_cache_key(messages, json_schema,
+                                             temperature, reasoning_effort,
+                                             max_completion_tokens, store)
+        if cache_key is not None:
+            cached = self.response_cache.lookup(cache_key)
+            if cached is not None:
+                logger.debug("Using cached structured analysis response")
+                return cached
+
+        semantic_namespace = embedding = None
+        if cache_key is not None and self.semantic_cache is not None:
+            semantic_namespace = self._semantic_namespace(
+                messages, json_schema, temperature, reasoning_effort,
+                max_completion_tokens)
+            embedding = self._embed(messages)
+            if embedding is not None:
+                cached = self.semantic_cache.lookup(semantic_namespace,
+                                                    embedding)
+                if cached is not None:
+                    return cached
+
+        if HAS_NEW_OPENAI:
+            params = self._build_params(messages, json_schema, temperature,
+                                        reasoning_effort,
+                                        max_completion_tokens, store)
+
+        attempt = 0
+        empty_retries = 0
+        while attempt <= self.max_retries:
             try:
                 # Make the API call
-                start_time = time.time()
+                start_time = (time.perf_counter()
+                              if logger.isEnabledFor(logging.DEBUG) else None)
 
                 # Handle new vs old OpenAI API
                 if HAS_NEW_OPENAI:
-                    params = {
-                        "model": self.model_name,
-                        "messages": messages,
-                        "temperature": temperature,
-                        "response_format": {
-                            "type": "json_schema",
-                            "json_schema": json_schema
-                        },
-                        "max_tokens":
-                        8000,  # Legacy parameter but keeping for compatibility
-                        "store": store
-                    }
-
-                    # Add optional parameters if provided
-                    if reasoning_effort is not None:
-                        params["reasoning_effort"] = reasoning_effort
-                    if max_completion_tokens is not None:
-                        params["max_completion_tokens"] = max_completion_tokens
-
-                    response = self.client.chat.completions.create(**params)
-                    response_message = response.choices[0].message
-                    content = response_message.content or ""
+                    if self.stream_responses:
+                        content = self._collect_stream(
+                            self.client.chat.completions.create(
+                                **params, stream=True))
+                    else:
+                        response = self.client.chat.completions.create(
+                            **params)
+                        response_message = response.choices[0].message
+                        content = response_message.content or ""
                 else:
                     # Legacy OpenAI API - deprecated but keeping for compatibility
                     response = self.client.ChatCompletion.create(
@@ -192,18 +684,23 @@ class OpenAIClient:
                     content = response_message.get("content", "")
 
                 # Calculate and log API call time
-                elapsed_time = time.time() - start_time
-                logger.debug(f"API call completed in {elapsed_time:.2f}s")
+                if start_time is not None:
+                    logger.debug("API call completed in %.2fs",
+                                 time.perf_counter() - start_time)
 
-                # Check for empty response
+                # Check for empty response; these have their own retry budget
+                # so they do not use up the retries for API errors
                 if not content:
                     logger.error("OpenAI returned empty content")
-                    if attempt < self.max_retries:
+                    if empty_retries < _MAX_EMPTY_RETRIES:
+                        empty_retries += 1
+                        time.sleep(_EMPTY_RETRY_BASE_DELAY *
+                                   (2**empty_retries))
                         continue
                     return {}
 
                 # Parse the JSON response
-                result = self._safe_json_load(content)
+                result = self._parse_content(content, parse_result)
 
                 # If we're using a transaction and inside a database operation, we could
                 # record the API call here if needed
@@ -215,50 +712,39 @@ class OpenAIClient:
                         pass
                     except Exception as e:
                         logger.error(
-                            f"Failed to record API call in database: {e}")
+                            "Failed to record API call in database: %s", e)
                         # We don't raise here because the API call itself succeeded
 
+                if cache_key is not None and result:
+                    self.response_cache.update(cache_key, result)
+                if embedding is not None and result:
+                    self.semantic_cache.update(semantic_namespace, embedding,
+                                               result)
+
                 return result
 
             except Exception as e:
+                if isinstance(e, _NON_RETRYABLE_ERROR_CLASSES):
+                    logger.error("Non-retryable API error: %s", e)
+                    raise APIError(
+                        f"OpenAI API error after {attempt} attempts: {str(e)}"
+                    ) from e
+
                 # Handle retry logic based on error type
-                should_retry = False
-                error_msg = str(e)
-
-                # Check for rate limit errors
-                if "rate limit" in error_msg.lower(
-                ) or "rate_limit" in error_msg.lower():
-                    error_type = "Rate limit"
-                    should_retry = True
-                # Check for timeout errors
-                elif "timeout" in error_msg.lower():
-                    error_type = "Timeout"
-                    should_retry = True
-                # Check for server errors
-                elif "server error" in error_msg.lower(
-                ) or "5xx" in error_msg.lower():
-                    error_type = "Server"
-                    should_retry = True
-                # Check for connection errors
-                elif "connection" in error_msg.lower():
-                    error_type = "Connection"
-                    should_retry = True
-                else:
-                    error_type = "API"
+                error_type, should_retry, is_rate_limit = _classify_error(e)
 
                 if should_retry and attempt < self.max_retries:
-                    delay = self.retry_base_delay * (2**attempt
-                                                     )  # Exponential backoff
+                    delay = self._retry_delay(attempt, e)
                     logger.warning(
-                        f"{error_type} error: {e}. Retrying in {delay:.2f}s (attempt {attempt+1}/{self.max_retries})"
-                    )
+                        "%s error: %s. Retrying in %.2fs (attempt %d/%d)",
+                        error_type, e, delay, attempt + 1, self.max_retries)
                     time.sleep(delay)
+                    attempt += 1
                 else:
-                    logger.error(
-                        f"{error_type} error after {attempt} attempts: {e}")
+                    logger.error("%s error after %d attempts: %s",
+                                 error_type, attempt, e)
 
-                    if "rate limit" in error_msg.lower(
-                    ) or "rate_limit" in error_msg.lower():
+                    if is_rate_limit:
                         raise RateLimitError(
                             f"OpenAI rate limit exceeded after {attempt} attempts: {str(e)}"
                         ) from e
@@ -279,7 +765,9 @@ class OpenAIClient:
             reasoning_effort: Optional[str] = None,
             max_completion_tokens: Optional[int] = None,
             store: bool = True,
-            transaction_ctx: Optional[Any] = None) -> Dict[str, Any]:
+            transaction_ctx: Optional[Any] = None,
+            parse_result: Optional[Callable[[str], Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Async version of call_structured_analysis. Call OpenAI API with retry logic and structured output validation.
 
@@ -291,6 +779,8 @@ class OpenAIClient:
             max_completion_tokens: Cap on total tokens (reasoning + visible output)
             store: Whether to store completions (set false for sensitive data)
             transaction_ctx: Optional transaction context from self.transaction()
+            parse_result: Optional parser that validates the raw response
+                content directly; see _parse_content()
 
         Returns:
             Structured analysis as a dictionary
@@ -305,49 +795,67 @@ class OpenAIClient:
                 "Async OpenAI client not available. Please update your openai package."
             )
 
-        for attempt in range(self.max_retries + 1):
+        cache_key = self._response_cache_key(messages, json_schema,
+                                             temperature, reasoning_effort,
+                                             max_completion_tokens, store)
+        if cache_key is not None:
+            cached = self.response_cache.lookup(cache_key)
+            if cached is not None:
+                logger.debug("Using cached structured analysis response")
+                return cached
+
+        semantic_namespace = embedding = None
+        if cache_key is not None and self.semantic_cache is not None:
+            semantic_namespace = self._semantic_namespace(
+                messages, json_schema, temperature, reasoning_effort,
+                max_completion_tokens)
+            embedding = await self._embed_async(messages)
+            if embedding is not None:
+                cached = self.semantic_cache.lookup(semantic_namespace,
+                                                    embedding)
+                if cached is not None:
+                    return cached
+
+        params = self._build_params(messages, json_schema, temperature,
+                                    reasoning_effort, max_completion_tokens,
+                                    store)
+
+        attempt = 0
+        empty_retries = 0
+        while attempt <= self.max_retries:
             try:
                 # Make the API call
-                start_time = time.time()
-
-                params = {
-                    "model": self.model_name,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "response_format": {
-                        "type": "json_schema",
-                        "json_schema": json_schema
-                    },
-                    "max_tokens":
-                    8000,  # Legacy parameter but keeping for compatibility
-                    "store": store
-                }
-
-                # Add optional parameters if provided
-                if reasoning_effort is not None:
-                    params["reasoning_effort"] = reasoning_effort
-                if max_completion_tokens is not None:
-                    params["max_completion_tokens"] = max_completion_tokens
-
-                response = await self.async_client.chat.completions.create(
-                    **params)
-                response_message = response.choices[0].message
-                content = response_message.content or ""
+                start_time = (time.perf_counter()
+                              if logger.isEnabledFor(logging.DEBUG) else None)
+
+                if self.stream_responses:
+                    content = await self._collect_stream_async(
+                        await self.async_client.chat.completions.create(
+                            **params, stream=True))
+                else:
+                    response = await self.async_client.chat.completions.create(
+                        **params)
+                    response_message = response.choices[0].message
+                    content = response_message.content or ""
 
                 # Calculate and log API call time
-                elapsed_time = time.time() - start_time
-                logger.debug(
-                    f"Async API call completed in {elapsed_time:.2f}s")
+                if start_time is not None:
+                    logger.debug("Async API call completed in %.2fs",
+                                 time.perf_counter() - start_time)
 
-                # Check for empty response
+                # Check for empty response; these have their own retry budget
+                # so they do not use up the retries for API errors
                 if not content:
                     logger.error("OpenAI returned empty content")
-                    if attempt < self.max_retries:
+                    if empty_retries < _MAX_EMPTY_RETRIES:
+                        empty_retries += 1
+                        await asyncio.sleep(_EMPTY_RETRY_BASE_DELAY *
+                                            (2**empty_retries))
                         continue
                     return {}
 
                 # Parse the JSON response
-                result = self._safe_json_load(content)
+                result = self._parse_content(content, parse_result)
 
                 # If we're using a transaction and inside a database operation, we could
                 # record the API call here if needed
@@ -359,50 +867,39 @@ class OpenAIClient:
                         pass
                     except Exception as e:
                         logger.error(
-                            f"Failed to record API call in database: {e}")
+                            "Failed to record API call in database: %s", e)
                         # We don't raise here because the API call itself succeeded
 
+                if cache_key is not None and result:
+                    self.response_cache.update(cache_key, result)
+                if embedding is not None and result:
+                    self.semantic_cache.update(semantic_namespace, embedding,
+                                               result)
+
                 return result
 
             except Exception as e:
+                if isinstance(e, _NON_RETRYABLE_ERROR_CLASSES):
+                    logger.error("Non-retryable API error: %s", e)
+                    raise APIError(
+                        f"OpenAI API error after {attempt} attempts: {str(e)}"
+                    ) from e
+
                 # Handle retry logic based on error type
-                should_retry = False
-                error_msg = str(e)
-
-                # Check for rate limit errors
-                if "rate limit" in error_msg.lower(
-                ) or "rate_limit" in error_msg.lower():
-                    error_type = "Rate limit"
-                    should_retry = True
-                # Check for timeout errors
-                elif "timeout" in error_msg.lower():
-                    error_type = "Timeout"
-                    should_retry = True
-                # Check for server errors
-                elif "server error" in error_msg.lower(
-                ) or "5xx" in error_msg.lower():
-                    error_type = "Server"
-                    should_retry = True
-                # Check for connection errors
-                elif "connection" in error_msg.lower():
-                    error_type = "Connection"
-                    should_retry = True
-                else:
-                    error_type = "API"
+                error_type, should_retry, is_rate_limit = _classify_error(e)
 
                 if should_retry and attempt < self.max_retries:
-                    delay = self.retry_base_delay * (2**attempt
-                                                     )  # Exponential backoff
+                    delay = self._retry_delay(attempt, e)
                     logger.warning(
-                        f"{error_type} error: {e}. Retrying in {delay:.2f}s (attempt {attempt+1}/{self.max_retries})"
-                    )
+                        "%s error: %s. Retrying in %.2fs (attempt %d/%d)",
+                        error_type, e, delay, attempt + 1, self.max_retries)
                     await asyncio.sleep(delay)
+                    attempt += 1
                 else:
-                    logger.error(
-                        f"{error_type} error after {attempt} attempts: {e}")
+                    logger.error("%s error after %d attempts: %s",
+                                 error_type, attempt, e)
 
-                    if "rate limit" in error_msg.lower(
-                    ) or "rate_limit" in error_msg.lower():
+                    if is_rate_limit:
                         raise RateLimitError(
                             f"OpenAI rate limit exceeded after {attempt} attempts: {str(e)}"
                         ) from e
@@ -424,11 +921,14 @@ class OpenAIClient:
             max_completion_tokens: Optional[int] = None,
             store: bool = True,
             max_concurrent: int = 5,
-            use_transaction: bool = True) -> List[Dict[str, Any]]:
+            use_transaction: bool = True,
+            use_batch_api: bool = False) -> List[Dict[str, Any]]:
         """
         Process multiple structured analysis requests concurrently.
         If use_transaction is True and a database session is available, all operations
         are wrapped in a single transaction.
+        If use_batch_api is True the requests are submitted through OpenAI's Batch
+        API instead, which is cheaper but may take up to 24 hours.
 
         Args:
             batch_messages: List of message lists for each API call
@@ -439,6 +939,7 @@ class OpenAIClient:
             store: Whether to store completions
             max_concurrent: Maximum number of concurrent requests
             use_transaction: Whether to use a database transaction for all operations
+            use_batch_api: Whether to submit through the Batch API
 
         Returns:
             List of structured analysis dictionaries in the same order as input messages
@@ -451,6 +952,11 @@ class OpenAIClient:
                 "Async OpenAI client not available. Please update your openai package."
             )
 
+        if use_batch_api:
+            return await self.batch_via_batch_api(batch_messages, json_schema,
+                                                  temperature, reasoning_effort,
+                                                  max_completion_tokens, store)
+
         # If using a transaction and we have a database session
         if use_transaction and HAS_SQLALCHEMY and self.db_session:
             with self.transaction() as transaction:
@@ -465,6 +971,211 @@ class OpenAIClient:
                 max_completion_tokens, store, max_concurrent, None)
             return results
 
+    async def batch_via_batch_api(
+            self,
+            batch_messages: List[List[Dict[str, str]]],
+            json_schema: Dict[str, Any],
+            temperature: float = 0.2,
+            reasoning_effort: Optional[str] = None,
+            max_completion_tokens: Optional[int] = None,
+            store: bool = True,
+            poll_interval: float = 30.0) -> List[Dict[str, Any]]:
+        """
+        Run structured analysis requests through OpenAI's Batch API.
+
+        All requests are uploaded as one JSONL file and processed within the
+        24 hour completion window at reduced cost. This call polls until the
+        batch finishes, so it is only suitable for non-interactive work.
+
+        Args:
+            batch_messages: List of message lists for each API call
+            json_schema: JSON schema for structured output
+            temperature: Controls randomness (0-1)
+            reasoning_effort: For o-series models, control reasoning depth
+            max_completion_tokens: Cap on total tokens
+            store: Whether to store completions
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            List of structured analysis dictionaries in the same order as input
+            messages; failed requests are dictionaries with error info
+
+        Raises:
+            ValueError: If async client is not available
+            APIError: If the batch fails, expires or is cancelled
+        """
+        if not HAS_ASYNC_OPENAI or not self.async_client:
+            raise ValueError(
+                "Async OpenAI client not available. Please update your openai package."
+            )
+
+        lines = []
+        for i, messages in enumerate(batch_messages):
+            body = self._build_params(messages, json_schema, temperature,
+                                      reasoning_effort, max_completion_tokens,
+                                      store)
+            lines.append(
+                json.dumps({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body
+                }))
+        jsonl_bytes = ("\n".join(lines) + "\n").encode("utf-8")
+
+        try:
+            batch_file = await self.async_client.files.create(
+                file=("batch_requests.jsonl", jsonl_bytes), purpose="batch")
+            batch = await self.async_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h")
+            logger.info(
+                "Submitted batch %s with %d requests", batch.id,
+                len(batch_messages))
+
+            while batch.status not in ("completed", "failed", "expired",
+                                       "cancelled"):
+                await asyncio.sleep(poll_interval)
+                batch = await self.async_client.batches.retrieve(batch.id)
+        except Exception as e:
+            raise APIError(f"OpenAI Batch API error: {str(e)}") from e
+
+        if batch.status != "completed":
+            raise APIError(f"OpenAI batch {batch.id} ended with status "
+                           f"{batch.status}")
+
+        results: List[Dict[str, Any]] = [{
+            "error": "No result returned by batch",
+            "error_type": "APIError"
+        } for _ in batch_messages]
+
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            file_content = await self.async_client.files.content(file_id)
+            for line in file_content.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                index = int(record["custom_id"])
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    error = record.get("error") or response.get("body", {})
+                    results[index] = {
+                        "error": str(error),
+                        "error_type": "APIError"
+                    }
+                    continue
+                content = (response["body"]["choices"][0]["message"].get(
+                    "content") or "")
+                results[index] = self._safe_json_load(content)
+
+        return results
+
+    async def iter_batch_results(
+            self,
+            batch_messages: List[List[Dict[str, str]]],
+            json_schema: Dict[str, Any],
+            temperature: float = 0.2,
+            reasoning_effort: Optional[str] = None,
+            max_completion_tokens: Optional[int] = None,
+            store: bool = True,
+            max_concurrent: int = 5
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Process multiple structured analysis requests concurrently, yielding
+        each result as soon as it completes rather than after the whole batch.
+
+        Args:
+            batch_messages: List of message lists for each API call
+            json_schema: JSON schema for structured output
+            temperature: Controls randomness (0-1)
+            reasoning_effort: For o-series models, control reasoning depth
+            max_completion_tokens: Cap on total tokens
+            store: Whether to store completions
+            max_concurrent: Maximum number of concurrent requests
+
+        Yields:
+            Tuples of (index in batch_messages, result dictionary) in completion
+            order; failed requests yield a dictionary with error info
+
+        Raises:
+            ValueError: If async client is not available
+        """
+        if not HAS_ASYNC_OPENAI or not self.async_client:
+            raise ValueError(
+                "Async OpenAI client not available. Please update your openai package."
+            )
+
+        async for item in self._iter_batch_requests(
+                batch_messages, json_schema, temperature, reasoning_effort,
+                max_completion_tokens, store, max_concurrent, None):
+            yield item
+
+    async def _iter_batch_requests(
+            self, batch_messages: List[List[Dict[str, str]]],
+            json_schema: Dict[str, Any], temperature: float,
+            reasoning_effort: Optional[str],
+            max_completion_tokens: Optional[int], store: bool,
+            max_concurrent: int, transaction: Optional[Any]
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Run a batch of requests with concurrency control and yield
+        (index, result) pairs in completion order. Identical message lists are
+        only sent once.
+
+        Exceptions are converted to dictionaries with error info.
+        """
+        # Create a semaphore to limit concurrent requests
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        # Pace requests under the account limits instead of reacting to 429s
+        bucket = None
+        if self.requests_per_minute or self.tokens_per_minute:
+            bucket = _TokenBucket(self.requests_per_minute,
+                                  self.tokens_per_minute)
+
+        async def process_with_semaphore(index, messages):
+            try:
+                async with semaphore:
+                    if bucket is not None:
+                        await bucket.acquire(
+                            _estimate_message_tokens(messages,
+                                                     self.model_name))
+                    result = await self.call_structured_analysis_async(
+                        messages=messages,
+                        json_schema=json_schema,
+                        temperature=temperature,
+                        reasoning_effort=reasoning_effort,
+                        max_completion_tokens=max_completion_tokens,
+                        store=store,
+                        transaction_ctx=transaction)
+            except Exception as e:
+                logger.error("Error in batch request %d: %s", index, e)
+                result = {"error": str(e), "error_type": type(e).__name__}
+            return index, result
+
+        # Send identical message lists once and fan the result out
+        groups: Dict[str, List[int]] = {}
+        for i, messages in enumerate(batch_messages):
+            groups.setdefault(canonical_digest(messages), []).append(i)
+        duplicates = {
+            indices[0]: indices[1:]
+            for indices in groups.values() if len(indices) > 1
+        }
+
+        tasks = [
+            process_with_semaphore(indices[0], batch_messages[indices[0]])
+            for indices in groups.values()
+        ]
+        for next_done in asyncio.as_completed(tasks):
+            index, result = await next_done
+            yield index, result
+            for duplicate_index in duplicates.get(index, ()):
+                # Copy so callers that mutate one result do not affect others
+                yield duplicate_index, copy.deepcopy(result)
+
     async def _execute_batch_requests(
             self, batch_messages: List[List[Dict[str, str]]],
             json_schema: Dict[str, Any], temperature: float,
@@ -488,41 +1199,39 @@ class OpenAIClient:
         Returns:
             List of results in the same order as input messages
         """
-        # Create a semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(max_concurrent)
+        results: List[Dict[str, Any]] = [{}] * len(batch_messages)
+        async for index, result in self._iter_batch_requests(
+                batch_messages, json_schema, temperature, reasoning_effort,
+                max_completion_tokens, store, max_concurrent, transaction):
+            results[index] = result
+        return results
+
+    def _parse_content(
+            self, content: str,
+            parse_result: Optional[Callable[[str], Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Parse a response, validating the raw content with parse_result when given.
 
-        async def process_with_semaphore(messages):
-            async with semaphore:
-                return await self.call_structured_analysis_async(
-                    messages=messages,
-                    json_schema=json_schema,
-                    temperature=temperature,
-                    reasoning_effort=reasoning_effort,
-                    max_completion_tokens=max_completion_tokens,
-                    store=store,
-                    transaction_ctx=transaction)
-
-        # Create tasks for all message sets
-        tasks = [
-            process_with_semaphore(messages) for messages in batch_messages
-        ]
+        parse_result receives the content as returned by the API, so a
+        well-formed response is decoded and validated in one pass. If it raises
+        ValueError (malformed JSON or a schema mismatch, including pydantic's
+        ValidationError), the content is recovered with _safe_json_load and
+        returned unvalidated.
 
-        # Execute all tasks concurrently and gather results
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results, converting exceptions to empty dictionaries with error info
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Error in batch request {i}: {str(result)}")
-                processed_results.append({
-                    "error": str(result),
-                    "error_type": type(result).__name__
-                })
-            else:
-                processed_results.append(result)
+        Args:
+            content: Response content from the API
+            parse_result: Optional parser for the raw content
 
-        return processed_results
+        Returns:
+            Parsed response as a dictionary, or empty dict on error
+        """
+        if parse_result is not None:
+            try:
+                return parse_result(content)
+            except ValueError as e:
+                logger.error("Response validation failed: %s", e)
+        return self._safe_json_load(content)
 
     def _safe_json_load(self, content: str) -> Dict[str, Any]:
         """
@@ -539,34 +1248,38 @@ class OpenAIClient:
                 "Empty or non-string content provided to JSON parser")
             return {}
 
+        content = content.strip()
+
         try:
             # First, try direct JSON parsing
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return _loads(content)
+        except ValueError:  # also covers orjson.JSONDecodeError
             pass
 
         # If that fails, try to extract JSON from markdown code blocks
         # Look for ```json ... ``` or just ``` ... ``` patterns
-        json_pattern = r"```(?:json)?\s*([\s\S]*?)\s*```"
-        matches = re.findall(json_pattern, content)
-
-        if matches:
+        if "```" in content:
             # Try each match until we find valid JSON
-            for match in matches:
+            for match in _JSON_BLOCK_RE.findall(content):
                 try:
-                    return json.loads(match.strip())
-                except json.JSONDecodeError:
+                    return _loads(match.strip())
+                except ValueError:
                     continue
 
         # Last-ditch effort: look for anything that resembles a JSON object
-        object_pattern = r"(\{[\s\S]*\})"
-        matches = re.findall(object_pattern, content)
+        if "{" not in content:
+            logger.error("Failed to parse JSON from content: %s...",
+                         content[:100])
+            return {}
 
-        for match in matches:
+        # The greedy pattern spans from the first "{" to the last "}", so the
+        # match needs no further stripping
+        for match in _JSON_OBJ_RE.findall(content):
             try:
-                return json.loads(match.strip())
-            except json.JSONDecodeError:
+                return _loads(match)
+            except ValueError:
                 continue
 
-        logger.error(f"Failed to parse JSON from content: {content[:100]}...")
+        logger.error("Failed to parse JSON from content: %s...",
+                     content[:100])
         return {}
@@ -3,12 +3,34 @@ Utility functions for the AI analysis module.
 """
 
 import tiktoken
+import hashlib
+import itertools
 import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+# System instructions, built once at import
+_BASE_INSTRUCTIONS = (
+    "You are a legislative analysis AI specializing in Texas public health and local government impacts. "
+    "Provide a comprehensive, objective analysis of the bill text following the structured format exactly. "
+    "Focus especially on impacts to Texas public health agencies and local governments. "
+    "If information is insufficient for any field, provide reasonable, conservative assessments. "
+    "Use only facts present in the text - do not add external information or assumptions."
+)
+_CHUNK_INSTRUCTIONS = _BASE_INSTRUCTIONS + (
+    " You are analyzing a portion of a larger document, so focus on extracting key information "
+    "from this specific section while considering how it fits into a broader bill context."
+)
+
+
 def create_analysis_instructions(is_chunk: bool = False) -> str:
     """
     Create system instructions for analysis prompt.
@@ -19,243 +41,236 @@ def create_analysis_instructions(is_chunk: bool = False) -> str:
     Returns:
         System message content
     """
-    base_instructions = (
-        "You are a legislative analysis AI specializing in Texas public health and local government impacts. "
-        "Provide a comprehensive, objective analysis of the bill text following the structured format exactly. "
-        "Focus especially on impacts to Texas public health agencies and local governments. "
-        "If information is insufficient for any field, provide reasonable, conservative assessments. "
-        "Use only facts present in the text - do not add external information or assumptions."
-    )
-
-    if is_chunk:
-        return base_instructions + (
-            " You are analyzing a portion of a larger document, so focus on extracting key information "
-            "from this specific section while considering how it fits into a broader bill context."
-        )
-
-    return base_instructions
-
-
-def get_analysis_json_schema() -> Dict[str, Any]:
-    """
-    Return the JSON schema for structured analysis output for OpenAI's structured outputs.
-
-    This schema is wrapped with the required keys 'name' and 'strict' so that it conforms
-    to the API's expected format:
-
-        {
-          "name": "<your_schema_name>",
-          "strict": True,
-          "schema": { ... your original schema ... }
-        }
-    """
-    base_schema = {
-        "type":
-        "object",
-        "properties": {
-            "summary": {
-                "type": "string",
-                "description": "A concise summary of the bill"
-            },
-            "key_points": {
-                "type": "array",
-                "description": "List of key bullet points in the legislation",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "point": {
-                            "type": "string",
-                            "description": "The text of the bullet point"
-                        },
-                        "impact_type": {
-                            "type":
-                            "string",
-                            "enum": ["positive", "negative", "neutral"],
-                            "description":
-                            "The overall tone or impact of this point"
-                        }
-                    },
-                    "required": ["point", "impact_type"],
-                    "additionalProperties": False
-                }
-            },
-            "public_health_impacts": {
-                "type":
-                "object",
-                "properties": {
-                    "direct_effects": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
-                    },
-                    "indirect_effects": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
-                    },
-                    "funding_impact": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
-                    },
-                    "vulnerable_populations": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
-                    }
-                },
-                "required": [
-                    "direct_effects", "indirect_effects", "funding_impact",
-                    "vulnerable_populations"
-                ],
-                "additionalProperties":
-                False
-            },
-            "local_government_impacts": {
+    return _CHUNK_INSTRUCTIONS if is_chunk else _BASE_INSTRUCTIONS
+
+
+# Structured output schema, built once at import. get_analysis_json_schema()
+# returns this shared object, so callers must not mutate it.
+_ANALYSIS_BASE_SCHEMA = {
+    "type":
+    "object",
+    "properties": {
+        "summary": {
+            "type": "string",
+            "description": "A concise summary of the bill"
+        },
+        "key_points": {
+            "type": "array",
+            "description": "List of key bullet points in the legislation",
+            "items": {
                 "type": "object",
                 "properties": {
-                    "administrative": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
-                    },
-                    "fiscal": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
+                    "point": {
+                        "type": "string",
+                        "description": "The text of the bullet point"
                     },
-                    "implementation": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
+                    "impact_type": {
+                        "type":
+                        "string",
+                        "enum": ["positive", "negative", "neutral"],
+                        "description":
+                        "The overall tone or impact of this point"
                     }
                 },
-                "required": ["administrative", "fiscal", "implementation"],
+                "required": ["point", "impact_type"],
                 "additionalProperties": False
-            },
-            "economic_impacts": {
-                "type":
-                "object",
-                "properties": {
-                    "direct_costs": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
-                    },
-                    "economic_effects": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
-                    },
-                    "benefits": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
-                    },
-                    "long_term_impact": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        }
+            }
+        },
+        "public_health_impacts": {
+            "type":
+            "object",
+            "properties": {
+                "direct_effects": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
                     }
                 },
-                "required": [
-                    "direct_costs", "economic_effects", "benefits",
-                    "long_term_impact"
-                ],
-                "additionalProperties":
-                False
-            },
-            "environmental_impacts": {
-                "type": "array",
-                "items": {
-                    "type": "string"
-                }
-            },
-            "education_impacts": {
-                "type": "array",
-                "items": {
-                    "type": "string"
-                }
-            },
-            "infrastructure_impacts": {
-                "type": "array",
-                "items": {
-                    "type": "string"
-                }
-            },
-            "recommended_actions": {
-                "type": "array",
-                "items": {
-                    "type": "string"
-                }
-            },
-            "immediate_actions": {
-                "type": "array",
-                "items": {
-                    "type": "string"
+                "indirect_effects": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
+                },
+                "funding_impact": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
+                },
+                "vulnerable_populations": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
                 }
             },
-            "resource_needs": {
-                "type": "array",
-                "items": {
-                    "type": "string"
+            "required": [
+                "direct_effects", "indirect_effects", "funding_impact",
+                "vulnerable_populations"
+            ],
+            "additionalProperties":
+            False
+        },
+        "local_government_impacts": {
+            "type": "object",
+            "properties": {
+                "administrative": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
+                },
+                "fiscal": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
+                },
+                "implementation": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
                 }
             },
-            "impact_summary": {
-                "type":
-                "object",
-                "properties": {
-                    "primary_category": {
-                        "type":
-                        "string",
-                        "enum": [
-                            "public_health", "local_gov", "economic",
-                            "environmental", "education", "infrastructure"
-                        ]
-                    },
-                    "impact_level": {
-                        "type": "string",
-                        "enum": ["low", "moderate", "high", "critical"]
-                    },
-                    "relevance_to_texas": {
-                        "type": "string",
-                        "enum": ["low", "moderate", "high"]
+            "required": ["administrative", "fiscal", "implementation"],
+            "additionalProperties": False
+        },
+        "economic_impacts": {
+            "type":
+            "object",
+            "properties": {
+                "direct_costs": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
                     }
                 },
-                "required":
-                ["primary_category", "impact_level", "relevance_to_texas"],
-                "additionalProperties":
-                False
+                "economic_effects": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
+                },
+                "benefits": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
+                },
+                "long_term_impact": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    }
+                }
+            },
+            "required": [
+                "direct_costs", "economic_effects", "benefits",
+                "long_term_impact"
+            ],
+            "additionalProperties":
+            False
+        },
+        "environmental_impacts": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            }
+        },
+        "education_impacts": {
+            "type": "array",
+            "items": {
+                "type": "string"
             }
         },
-        "required": [
-            "summary", "key_points", "public_health_impacts",
-            "local_government_impacts", "economic_impacts",
-            "environmental_impacts", "education_impacts",
-            "infrastructure_impacts", "recommended_actions",
-            "immediate_actions", "resource_needs", "impact_summary"
-        ],
-        "additionalProperties":
-        False
-    }
-
-    # Wrap the schema with the required outer object
-    return {
-        "name": "bill_analysis_schema",  # a unique schema name
-        "strict": True,
-        "schema": base_schema
-    }
+        "infrastructure_impacts": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            }
+        },
+        "recommended_actions": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            }
+        },
+        "immediate_actions": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            }
+        },
+        "resource_needs": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            }
+        },
+        "impact_summary": {
+            "type":
+            "object",
+            "properties": {
+                "primary_category": {
+                    "type":
+                    "string",
+                    "enum": [
+                        "public_health", "local_gov", "economic",
+                        "environmental", "education", "infrastructure"
+                    ]
+                },
+                "impact_level": {
+                    "type": "string",
+                    "enum": ["low", "moderate", "high", "critical"]
+                },
+                "relevance_to_texas": {
+                    "type": "string",
+                    "enum": ["low", "moderate", "high"]
+                }
+            },
+            "required":
+            ["primary_category", "impact_level", "relevance_to_texas"],
+            "additionalProperties":
+            False
+        }
+    },
+    "required": [
+        "summary", "key_points", "public_health_impacts",
+        "local_government_impacts", "economic_impacts",
+        "environmental_impacts", "education_impacts",
+        "infrastructure_impacts", "recommended_actions",
+        "immediate_actions", "resource_needs", "impact_summary"
+    ],
+    "additionalProperties":
+    False
+}
+
+# Wrap the schema with the required outer object
+_ANALYSIS_SCHEMA = {
+    "name": "bill_analysis_schema",  # a unique schema name
+    "strict": True,
+    "schema": _ANALYSIS_BASE_SCHEMA
+}
+
+
+def get_analysis_json_schema() -> Dict[str, Any]:
+    """
+    Return the JSON schema for structured analysis output for OpenAI's structured outputs.
+
+    This schema is wrapped with the required keys 'name' and 'strict' so that it conforms
+    to the API's expected format:
+
+        {
+          "name": "<your_schema_name>",
+          "strict": True,
+          "schema": { ... your original schema ... }
+        }
+
+    The same dictionary is returned on every call; treat it as read-only.
+    """
+    return _ANALYSIS_SCHEMA
 
 
 def create_user_prompt(text: str, is_chunk: bool = False) -> str:
@@ -285,6 +300,37 @@ def create_user_prompt(text: str, is_chunk: bool = False) -> str:
         "5. Overall impact assessment for Texas stakeholders")
 
 
+# Token counts for repeated texts, keyed by (encoding name, BLAKE2b digest) so
+# the cache does not keep large bill texts alive. Short texts are cheaper to
+# encode than to hash and are not cached.
+_TOKEN_COUNT_CACHE_SIZE = 4096
+_MIN_CACHED_TEXT_LEN = 256
+_token_count_cache: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+_token_count_lock = Lock()
+
+
+# TokenCounter.fits() rejects ASCII text without encoding when the typical
+# length/4 estimate is well above the limit
+_FIT_ESTIMATE_HIGH = 1.2
+
+
+@lru_cache(maxsize=4)
+def _get_encoder(encoding_name: str) -> tiktoken.Encoding:
+    """
+    Return the shared tiktoken encoder for an encoding name.
+
+    Loading the BPE ranks is expensive, so every TokenCounter using the same
+    encoding shares one encoder instance.
+
+    Args:
+        encoding_name: Name of the tiktoken encoding
+
+    Returns:
+        Tiktoken encoder
+    """
+    return tiktoken.get_encoding(encoding_name)
+
+
 class TokenCounter:
     """Token counting utilities for OpenAI models."""
 
@@ -318,7 +364,7 @@ class TokenCounter:
                     f"No specific encoding found for {self.model_name}, using default encoding"
                 )
 
-            return tiktoken.get_encoding(encoding_name)
+            return _get_encoder(encoding_name)
 
         except Exception as e:
             logger.error(f"Failed to initialize token encoder: {e}")
@@ -339,11 +385,88 @@ class TokenCounter:
 
         if self.encoder:
             # Use tiktoken for accurate counting
-            return len(self.encoder.encode(text))
+            if len(text) < _MIN_CACHED_TEXT_LEN:
+                return len(self.encoder.encode(text))
+            return self._count_tokens_cached(text)
         else:
             # Fallback to approximate counting
             return self._approx_tokens(text)
 
+    def fits(self, text: str, limit: int) -> bool:
+        """
+        Check whether a text is within a token limit, counting exactly only
+        when a cheap estimate is close to the limit.
+
+        ASCII text no longer than the limit in characters is accepted, and
+        ASCII text whose length/4 estimate is well above the limit is
+        rejected, both without BPE encoding. Everything in between, and all
+        non-ASCII text, is counted exactly.
+
+        Args:
+            text: Text to check
+            limit: Maximum number of tokens
+
+        Returns:
+            True if the text is within the limit
+        """
+        if text.isascii():
+            # Every ASCII character encodes to at most one token
+            if len(text) <= limit:
+                return True
+            if len(text) >> 2 > limit * _FIT_ESTIMATE_HIGH:
+                return False
+
+        return self.count_tokens(text) <= limit
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count the tokens in several texts in one call.
+
+        tiktoken encodes the batch on native threads, so this is faster than
+        calling count_tokens() in a loop when many texts are counted at once.
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Number of tokens for each text, in the same order
+        """
+        if not texts:
+            return []
+
+        if self.encoder:
+            return [
+                len(tokens) for tokens in self.encoder.encode_ordinary_batch(
+                    texts, num_threads=os.cpu_count() or 4)
+            ]
+        return [self._approx_tokens(text) for text in texts]
+
+    def _count_tokens_cached(self, text: str) -> int:
+        """
+        Count tokens with tiktoken, reusing the result for repeated texts.
+
+        Args:
+            text: Text to count tokens for
+
+        Returns:
+            Number of tokens
+        """
+        digest = hashlib.blake2b(text.encode("utf-8"),
+                                 digest_size=16).digest()
+        key = (self.encoder.name, digest)
+        with _token_count_lock:
+            count = _token_count_cache.get(key)
+            if count is not None:
+                _token_count_cache.move_to_end(key)
+                return count
+
+        count = len(self.encoder.encode(text))
+        with _token_count_lock:
+            _token_count_cache[key] = count
+            if len(_token_count_cache) > _TOKEN_COUNT_CACHE_SIZE:
+                _token_count_cache.popitem(last=False)
+        return count
+
     def _approx_tokens(self, text: str) -> int:
         """
         Approximate token count for when tiktoken is unavailable.
@@ -354,14 +477,105 @@ class TokenCounter:
         Returns:
             Estimated token count
         """
-        if not text:
-            return 0
         # This approximation assumes ~4 characters per token on average
-        return len(text) // 4
+        return len(text) >> 2
+
 
+# Shared TokenCounter instances by model name, see get_token_counter()
+_token_counters: Dict[str, TokenCounter] = {}
+_token_counters_lock = Lock()
 
-def calculate_priority_scores(analysis_dict: Dict[str, Any],
-                              legislation_id: int) -> Dict[str, Any]:
+
+def get_token_counter(model_name: str = "gpt-4o-2024-08-06") -> TokenCounter:
+    """
+    Return the shared TokenCounter for a model, creating it on first use.
+
+    The counter is created lazily rather than at import so that importing this
+    module does not load the tiktoken encoding.
+
+    Args:
+        model_name: Name of the model to use for tokenization
+
+    Returns:
+        Shared TokenCounter instance
+    """
+    counter = _token_counters.get(model_name)
+    if counter is None:
+        with _token_counters_lock:
+            counter = _token_counters.get(model_name)
+            if counter is None:
+                counter = TokenCounter(model_name)
+                _token_counters[model_name] = counter
+    return counter
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the number of tokens in a text with the default TokenCounter.
+
+    Args:
+        text: Text to count tokens for
+
+    Returns:
+        Number of tokens
+    """
+    return get_token_counter().count_tokens(text)
+
+
+# Convert relevance categories to numeric scores (0-100)
+_RELEVANCE_SCORES = MappingProxyType({
+    "low": 25,
+    "moderate": 50,
+    "high": 75,
+    "critical": 100
+})
+
+# Score multiplier by relevance to Texas
+_TEXAS_MULTIPLIERS = MappingProxyType({
+    "low": 0.7,
+    "moderate": 0.85,
+    "high": 1.0
+})
+
+# (health, local government) score weights by primary impact category
+_CATEGORY_WEIGHTS = MappingProxyType({
+    "public_health": (1.5, 0.8),
+    "local_gov": (0.8, 1.5)
+})
+
+# Impact level priority (higher = more severe)
+_IMPACT_PRIORITY = MappingProxyType({
+    "low": 1,
+    "moderate": 2,
+    "high": 3,
+    "critical": 4
+})
+
+
+@dataclass(frozen=True, slots=True)
+class PriorityScores:
+    """Priority scores calculated from an analysis."""
+    legislation_id: int
+    public_health_relevance: int
+    local_govt_relevance: int
+    overall_priority: int
+    impact_category: Optional[str]
+    impact_level: Optional[str]
+    texas_relevance: Optional[str]
+
+    def auto_categories(self) -> Dict[str, Any]:
+        """Return the auto_categories JSON stored on LegislationPriority."""
+        return {
+            "health_impacts": self.public_health_relevance > 50,
+            "local_govt_impacts": self.local_govt_relevance > 50,
+            "impact_category": self.impact_category,
+            "impact_level": self.impact_level,
+            "texas_relevance": self.texas_relevance
+        }
+
+
+def compute_priority_scores(analysis_dict: Dict[str, Any],
+                            legislation_id: int) -> PriorityScores:
     """
     Calculate priority scores based on analysis results.
 
@@ -370,49 +584,28 @@ def calculate_priority_scores(analysis_dict: Dict[str, Any],
         legislation_id: ID of the legislation
 
     Returns:
-        Dictionary with priority scores
+        PriorityScores for the legislation
     """
-    # Default medium scores
-    health_relevance = 50
-    local_govt_relevance = 50
-
     # Extract impact summary information
     impact_summary = analysis_dict.get("impact_summary", {})
     impact_category_str = impact_summary.get("primary_category")
     impact_level_str = impact_summary.get("impact_level")
     relevance_to_texas_str = impact_summary.get("relevance_to_texas")
 
-    # Convert relevance categories to numeric scores (0-100)
-    relevance_mapping = {
-        "low": 25,
-        "moderate": 50,
-        "high": 75,
-        "critical": 100
-    }
-
     # Calculate base score from impact level
-    base_score = relevance_mapping.get(impact_level_str, 50)
+    base_score = _RELEVANCE_SCORES.get(impact_level_str, 50)
 
     # Adjust based on relevance to Texas
-    texas_multiplier = {
-        "low": 0.7,
-        "moderate": 0.85,
-        "high": 1.0
-    }.get(relevance_to_texas_str, 0.85)
-
-    # Adjust scores based on impact category
-    if impact_category_str == "public_health":
-        health_relevance = min(100, int(base_score * 1.5 * texas_multiplier))
-        local_govt_relevance = min(100,
-                                   int(base_score * 0.8 * texas_multiplier))
-    elif impact_category_str == "local_gov":
-        health_relevance = min(100, int(base_score * 0.8 * texas_multiplier))
-        local_govt_relevance = min(100,
-                                   int(base_score * 1.5 * texas_multiplier))
-    else:
-        # For other categories, calculate based on impact level and Texas relevance
-        health_relevance = min(100, int(base_score * texas_multiplier))
-        local_govt_relevance = min(100, int(base_score * texas_multiplier))
+    texas_multiplier = _TEXAS_MULTIPLIERS.get(relevance_to_texas_str, 0.85)
+
+    # Adjust scores based on impact category; other categories are weighted
+    # by impact level and Texas relevance alone
+    health_weight, local_govt_weight = _CATEGORY_WEIGHTS.get(
+        impact_category_str, (1.0, 1.0))
+    health_relevance = min(100,
+                           int(base_score * health_weight * texas_multiplier))
+    local_govt_relevance = min(
+        100, int(base_score * local_govt_weight * texas_multiplier))
 
     # Check if we have health impacts detailed
     ph_impacts = analysis_dict.get("public_health_impacts", {})
@@ -432,20 +625,28 @@ def calculate_priority_scores(analysis_dict: Dict[str, Any],
     # Calculate overall priority as weighted average
     overall_priority = (health_relevance + local_govt_relevance) // 2
 
-    return {
-        "legislation_id": legislation_id,
-        "public_health_relevance": health_relevance,
-        "local_govt_relevance": local_govt_relevance,
-        "overall_priority": overall_priority,
-        "auto_categorized": True,
-        "auto_categories": {
-            "health_impacts": health_relevance > 50,
-            "local_govt_impacts": local_govt_relevance > 50,
-            "impact_category": impact_category_str,
-            "impact_level": impact_level_str,
-            "texas_relevance": relevance_to_texas_str
-        }
-    }
+    return PriorityScores(legislation_id=legislation_id,
+                          public_health_relevance=health_relevance,
+                          local_govt_relevance=local_govt_relevance,
+                          overall_priority=overall_priority,
+                          impact_category=impact_category_str,
+                          impact_level=impact_level_str,
+                          texas_relevance=relevance_to_texas_str)
+
+
+# List fields merged by merge_analyses(), with the number of items to keep
+_MERGED_LIST_LIMITS = (
+    ("environmental_impacts", 10),
+    ("education_impacts", 10),
+    ("infrastructure_impacts", 10),
+    ("recommended_actions", 8),
+    ("immediate_actions", 5),
+    ("resource_needs", 5),
+)
+
+# Impact fields holding a dict of category -> list of items
+_STRUCTURED_IMPACT_FIELDS = ("public_health_impacts",
+                             "local_government_impacts", "economic_impacts")
 
 
 def merge_analyses(base: Dict[str, Any], new: Dict[str,
@@ -460,77 +661,74 @@ def merge_analyses(base: Dict[str, Any], new: Dict[str,
     Returns:
         Merged analysis dictionary
     """
+    # Shallow copy for scalar fields; every list or dict that gets extended
+    # below is rebuilt so the merge never mutates base's inner containers
     merged = base.copy()
 
     # Merge summary with combination
     if "summary" in new:
-        merged["summary"] = (base.get("summary", "") + " " + new["summary"])
-        # Trim if it's getting too long
-        if len(merged["summary"]) > 2000:
-            merged["summary"] = merged["summary"][:1997] + "..."
+        base_summary = base.get("summary", "")
+        new_summary = new["summary"]
+        if len(base_summary) + 1 + len(new_summary) <= 2000:
+            merged["summary"] = base_summary + " " + new_summary
+        else:
+            # Trim before concatenating so a huge new summary is never copied
+            take = max(0, 1997 - len(base_summary) - 1)
+            merged["summary"] = (base_summary + " " +
+                                 new_summary[:take])[:1997] + "..."
 
     # Merge key points (avoid duplicates)
     if "key_points" in new and "key_points" in base:
-        existing_points = {point["point"] for point in base["key_points"]}
+        key_points = base["key_points"]
+        seen_points = {point["point"] for point in key_points}
+        added_points = []
+        # Keep reasonable number of points
+        room = 15 - len(key_points)
         for point in new["key_points"]:
-            if point["point"] not in existing_points:
-                merged["key_points"].append(point)
-                # Keep reasonable number of points
-                if len(merged["key_points"]) >= 15:
-                    break
-
-    # Merge impact lists (take most significant from both)
-    for impact_type in [
-            "environmental_impacts", "education_impacts",
-            "infrastructure_impacts"
-    ]:
-        if impact_type in new and impact_type in base:
-            # Get unique impacts
-            all_impacts = set(base[impact_type])
-            for impact in new[impact_type]:
-                all_impacts.add(impact)
-            merged[impact_type] = list(
-                all_impacts)[:10]  # Limit to 10 most important
+            if len(added_points) >= room:
+                break
+            if point["point"] in seen_points:
+                continue
+            seen_points.add(point["point"])
+            added_points.append(point)
+        merged["key_points"] = key_points + added_points
+
+    # Merge impact and action lists (take most significant from both)
+    for list_field, limit in _MERGED_LIST_LIMITS:
+        if list_field in new and list_field in base:
+            # Combine and deduplicate, keeping the original order
+            all_items = dict.fromkeys(
+                itertools.chain(base[list_field], new[list_field]))
+            merged[list_field] = list(all_items)[:limit]
 
     # Merge structured impact dictionaries
-    for impact_dict in [
-            "public_health_impacts", "local_government_impacts",
-            "economic_impacts"
-    ]:
+    for impact_dict in _STRUCTURED_IMPACT_FIELDS:
         if impact_dict in new and impact_dict in base:
+            merged_dict = dict(base[impact_dict])
             for category, items in new[impact_dict].items():
-                if category in base[impact_dict]:
+                if category in merged_dict:
                     # Add any new items that don't duplicate existing ones
-                    existing_items = set(base[impact_dict][category])
+                    base_items = merged_dict[category]
+                    seen_items = set(base_items)
+                    added_items = []
+                    # Keep reasonable number of items
+                    room = 8 - len(base_items)
                     for item in items:
-                        if item not in existing_items:
-                            merged[impact_dict][category].append(item)
-                            # Keep reasonable number of items
-                            if len(merged[impact_dict][category]) >= 8:
-                                break
-
-    # For actions, get the most relevant from both
-    for action_type in [
-            "recommended_actions", "immediate_actions", "resource_needs"
-    ]:
-        if action_type in new and action_type in base:
-            # Combine and deduplicate
-            all_actions = set(base[action_type])
-            for action in new[action_type]:
-                all_actions.add(action)
-            # Set a reasonable limit based on action type
-            limit = 8 if action_type == "recommended_actions" else 5
-            merged[action_type] = list(all_actions)[:limit]
+                        if len(added_items) >= room:
+                            break
+                        if item in seen_items:
+                            continue
+                        seen_items.add(item)
+                        added_items.append(item)
+                    merged_dict[category] = base_items + added_items
+            merged[impact_dict] = merged_dict
 
     # For impact_summary, keep the most severe assessment
     if "impact_summary" in new and "impact_summary" in base:
-        # Impact level priority (higher = more severe)
-        impact_priority = {"low": 1, "moderate": 2, "high": 3, "critical": 4}
-
-        base_level = impact_priority.get(
+        base_level = _IMPACT_PRIORITY.get(
             base["impact_summary"]["impact_level"], 0)
-        new_level = impact_priority.get(new["impact_summary"]["impact_level"],
-                                        0)
+        new_level = _IMPACT_PRIORITY.get(new["impact_summary"]["impact_level"],
+                                         0)
 
         # Keep the more severe impact assessment
         if new_level > base_level:
@@ -539,6 +737,48 @@ def merge_analyses(base: Dict[str, Any], new: Dict[str,
     return merged
 
 
+# Bill metadata lines at the top of the chunk prompt context
+_BILL_CONTEXT_TEMPLATE = ("Bill Number: {bill_number}\n"
+                          "Title: {title}\n"
+                          "Description: {description}\n"
+                          "Government Type: {govt_type}\n"
+                          "Source: {govt_source}\n"
+                          "Status: {status}")
+
+# Chunk prompt instructions by chunk position
+_CHUNK_POSITION_INSTRUCTIONS = {
+    "first":
+    ("You are analyzing PART 1 OF {total} of a large legislative bill. "
+     "Focus on the sections provided while considering the bill's overall context."
+     ),
+    "last":
+    ("You are analyzing THE FINAL PART ({part} OF {total}) of a large legislative bill. "
+     "Use the summaries of previous sections to inform your analysis and provide a comprehensive conclusion."
+     ),
+    "middle":
+    ("You are analyzing PART {part} OF {total} of a large legislative bill. "
+     "Consider the context from previous parts while focusing on the new content in this section."
+     )
+}
+
+# Additional guidance for structured vs. unstructured documents
+_CHUNK_STRUCTURE_INSTRUCTIONS = {
+    True:
+    (" This document has structured sections. Pay attention to section headers and "
+     "how they relate to previous parts of the bill."),
+    False:
+    (" This document was split by content size rather than by natural sections. "
+     "Be aware that some concepts might span across chunks.")
+}
+
+# Complete instruction templates keyed by (position, is_structured)
+_CHUNK_PROMPT_INSTRUCTIONS = MappingProxyType({
+    (position, structured): position_text + structure_text
+    for position, position_text in _CHUNK_POSITION_INSTRUCTIONS.items()
+    for structured, structure_text in _CHUNK_STRUCTURE_INSTRUCTIONS.items()
+})
+
+
 def create_chunk_prompt(chunk: str, chunk_index: int, total_chunks: int,
                         prev_summaries: List[str],
                         legislation_metadata: Dict[str, str],
@@ -558,55 +798,30 @@ def create_chunk_prompt(chunk: str, chunk_index: int, total_chunks: int,
         Customized prompt for this chunk
     """
     # Prepare context section
-    context_sections = [
-        f"Bill Number: {legislation_metadata['bill_number']}",
-        f"Title: {legislation_metadata['title']}",
-        f"Description: {legislation_metadata['description']}",
-        f"Government Type: {legislation_metadata['govt_type']}",
-        f"Source: {legislation_metadata['govt_source']}",
-        f"Status: {legislation_metadata['status']}"
-    ]
+    context_sections = [_BILL_CONTEXT_TEMPLATE.format_map(legislation_metadata)]
 
     # Add summaries from previous chunks if available
     if prev_summaries:
         context_sections.append("\nSUMMARIES FROM PREVIOUS SECTIONS:")
         context_sections.extend(prev_summaries)
 
-    context_text = "\n".join(context_sections)
-
-    # Create appropriate instructions based on which chunk we're processing
+    # Pick the instructions for this chunk's position and document structure
     if chunk_index == 0:
-        # First chunk
-        instructions = (
-            f"You are analyzing PART 1 OF {total_chunks} of a large legislative bill. "
-            f"Focus on the sections provided while considering the bill's overall context."
-        )
+        position = "first"
     elif chunk_index == total_chunks - 1:
-        # Last chunk
-        instructions = (
-            f"You are analyzing THE FINAL PART ({chunk_index+1} OF {total_chunks}) of a large legislative bill. "
-            f"Use the summaries of previous sections to inform your analysis and provide a comprehensive conclusion."
-        )
-    else:
-        # Middle chunk
-        instructions = (
-            f"You are analyzing PART {chunk_index+1} OF {total_chunks} of a large legislative bill. "
-            f"Consider the context from previous parts while focusing on the new content in this section."
-        )
-
-    # Additional guidance for structured vs. unstructured documents
-    if is_structured:
-        instructions += (
-            " This document has structured sections. Pay attention to section headers and "
-            "how they relate to previous parts of the bill.")
+        position = "last"
     else:
-        instructions += (
-            " This document was split by content size rather than by natural sections. "
-            "Be aware that some concepts might span across chunks.")
-
-    # Full prompt assembly
-    full_prompt = (f"{instructions}\n\n"
-                   f"BILL CONTEXT:\n{context_text}\n\n"
-                   f"CURRENT SECTION TEXT TO ANALYZE:\n{chunk}")
-
-    return full_prompt
+        position = "middle"
+    instructions = _CHUNK_PROMPT_INSTRUCTIONS[position, bool(
+        is_structured)].format(part=chunk_index + 1, total=total_chunks)
+
+    # Full prompt assembly in a single join, so the (possibly very large)
+    # chunk text is copied only once
+    parts = [instructions, "\n\nBILL CONTEXT:\n", context_sections[0]]
+    for section in itertools.islice(context_sections, 1, None):
+        parts.append("\n")
+        parts.append(section)
+    parts.append("\n\nCURRENT SECTION TEXT TO ANALYZE:\n")
+    parts.append(chunk)
+
+    return "".join(parts)
@@ -24,33 +24,62 @@ Run:
 """
 
 import os
+import re
+import json
+import time
+import inspect
+import itertools
 import logging
-import traceback
 import asyncio
-from typing import Optional, List, Dict, Any, Type, Union, Callable, TypeVar, cast, AsyncGenerator
-from datetime import datetime, timedelta, timezone
-from contextlib import contextmanager
+from typing import Annotated, Literal, Optional, List, Dict, Any, Tuple, Type, Union, Callable, TypeVar, cast, AsyncGenerator
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
 from functools import wraps
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request, Response, status, Query
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request, Response, status, Query, Path
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
-from pydantic import BaseModel, Field, EmailStr, HttpUrl, field_validator, model_validator, constr, conint, confloat, AnyUrl
+from starlette.concurrency import run_in_threadpool
+from pydantic import AfterValidator, BaseModel, Field, EmailStr, HttpUrl, field_validator, model_validator, constr, conint, confloat, AnyUrl
 from pydantic import ValidationError as PydanticValidationError
 from contextlib import asynccontextmanager
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Default response class; ORJSONResponse needs orjson at render time
+DefaultJSONResponse = ORJSONResponse if HAS_ORJSON else JSONResponse
 
 # 1) Import your custom modules
-from app.data_store import DataStore, ConnectionError, ValidationError, DatabaseOperationError, BillStore
+from app.data_store import DataStore, ConnectionError, ValidationError, NotFoundError, DatabaseOperationError, BillStore, fetch_legislation_details, ASYNC_DB_ERRORS
 from app.ai_analysis.analyzer import AIAnalysis # Changed import statement
+from app.ai_analysis.cache import ResponseCache
+from app.ai_analysis.errors import AIAnalysisError, ErrorCode
+from app.ai_analysis.openai_client import close_shared_http_client
+from app.tasks import HAS_CELERY, analyze_bill, get_task_state
+from app.response_cache import cached_response, http_cache, invalidate_tags, single_flight
 from app.legiscan_api import LegiScanAPI
 from app.models import (
+    init_async_db,
     BillStatusEnum,
     ImpactLevelEnum,
     ImpactCategoryEnum,
     DataSourceEnum,
     GovtTypeEnum,
-    Legislation
+    Legislation,
+    LegislationAnalysis
 )
 
 # 2) Set up logging
@@ -61,17 +90,79 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+
+def _enum_values(enum_cls: Type[Enum]) -> Tuple[frozenset, str]:
+    """
+    Return an enum's values as a lookup set and as a display string.
+
+    Args:
+        enum_cls: Enum class to read
+
+    Returns:
+        Tuple of (frozenset of values, comma-separated values in declaration order)
+    """
+    values = [member.value for member in enum_cls]
+    return frozenset(values), ", ".join(values)
+
+
+# Allowed values for request validation, computed once at import. The *_STR
+# versions keep declaration order for error messages.
+_VALID_BILL_STATUSES, _VALID_BILL_STATUSES_STR = _enum_values(BillStatusEnum)
+_VALID_IMPACT_CATEGORIES, _VALID_IMPACT_CATEGORIES_STR = _enum_values(ImpactCategoryEnum)
+_VALID_IMPACT_LEVELS, _VALID_IMPACT_LEVELS_STR = _enum_values(ImpactLevelEnum)
+_VALID_GOVT_TYPES, _VALID_GOVT_TYPES_STR = _enum_values(GovtTypeEnum)
+
+_VALID_MODEL_PREFIXES = ("gpt-4o", "gpt-4o-2024-08-06", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo")
+_VALID_MODELS = frozenset(_VALID_MODEL_PREFIXES)
+
+_VALID_FOCUS_AREAS = frozenset(("public health", "local government", "economic", "environmental", "healthcare",
+                                "social services", "education", "infrastructure", "justice"))
+_VALID_SORT_FIELDS = ("relevance", "date", "updated", "status", "title", "priority")
+_VALID_SORT_FIELDS_SET = frozenset(_VALID_SORT_FIELDS)
+_VALID_SORT_DIRS = frozenset(("asc", "desc"))
+
+# Query parameters with a fixed set of values, validated by FastAPI
+MunicipalityType = Literal["city", "county", "school", "special"]
+ImpactType = Literal["public_health", "local_gov", "economic", "environmental", "education"]
+TimePeriod = Literal["current", "past_month", "past_year", "all"]
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
+def _check_model_name(v: Optional[str]) -> Optional[str]:
+    """Validate that the model name is a recognized model."""
+    if v is not None and v not in _VALID_MODELS and not v.startswith(_VALID_MODEL_PREFIXES):
+        raise ValueError(f"Model name '{v}' is not a recognized model. Valid options include: {', '.join(_VALID_MODEL_PREFIXES)}")
+    return v
+
+
+# Optional model name validated by one shared validator
+ModelName = Annotated[Optional[str], AfterValidator(_check_model_name)]
+
+
 # -----------------------------------------------------------------------------
 # Application Lifecycle Handler
 # -----------------------------------------------------------------------------
 
 
+def _warn_on_lazy_load(orm_execute_state) -> None:
+    """
+    Session event hook that logs lazy relationship loads.
+
+    A lazy load inside a loop over query results is the N+1 pattern; the fix
+    is an eager-loading option (selectinload/joinedload) on the query.
+    """
+    state = orm_execute_state.lazy_loaded_from
+    if state is not None:
+        logger.warning("Lazy load from %s (possible N+1 query): %s",
+                       state.class_.__name__, orm_execute_state.statement)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Lifecycle event handler for setup and teardown of application resources.
     """
-    global data_store, ai_analyzer, legiscan_api, bill_store
+    global data_store, ai_analyzer, legiscan_api, bill_store, async_session_factory
 
     # Startup: Initialize resources
     try:
@@ -83,6 +174,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # ai_analyzer = AIAnalysis(db_session=data_store.db_session)  Commented out to make AIAnalysis on-demand
         legiscan_api = LegiScanAPI(db_session=data_store.db_session, api_key=os.getenv("LEGISCAN_API_KEY"))
         bill_store = BillStore(data_store.db_session)
+
+        # Flag lazy relationship loads (N+1 queries) in development logs
+        if os.getenv("ENV") == "dev":
+            event.listen(data_store.db_session, "do_orm_execute", _warn_on_lazy_load)
+
+        # Async sessions for endpoints that query on the event loop. Optional:
+        # without the asyncpg driver those endpoints fall back to the sync
+        # DataStore through the threadpool.
+        try:
+            async_session_factory = init_async_db()
+        except ImportError as e:
+            logger.warning(f"Async database access disabled: {e}")
+
+        # Build the OpenAPI document now rather than on the first /docs hit
+        _get_openapi_bytes()
+
         logger.info("Services initialized on startup.")
     except Exception as e:
         logger.critical(f"Failed to initialize services: {e}", exc_info=True)
@@ -99,10 +206,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.error(f"Error closing DataStore: {e}", exc_info=True)
 
+    if async_session_factory is not None:
+        await async_session_factory.kw["bind"].dispose()
+
+    await close_shared_http_client()
+
     # Set global variables to None
     data_store = None
     ai_analyzer = None
     legiscan_api = None
+    async_session_factory = None
 
 # 3) Prepare the FastAPI application
 app = FastAPI(
@@ -112,26 +225,64 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=DefaultJSONResponse,
     lifespan=lifespan
 )
 
-# Add CORS middleware to allow frontend requests
+# Add CORS middleware to allow frontend requests. Production sets
+# CORS_ALLOWED_ORIGINS (comma-separated) and/or CORS_ORIGIN_REGEX, e.g.
+#   CORS_ORIGIN_REGEX=^https://(app|admin)\.policypulse\.org$
+# With neither set (development) any origin is allowed, without credentials.
+_CORS_ALLOWED_ORIGINS = [o.strip() for o in os.getenv("CORS_ALLOWED_ORIGINS", "").split(",") if o.strip()]
+_CORS_ORIGIN_REGEX = os.getenv("CORS_ORIGIN_REGEX") or None
+_CORS_RESTRICTED = bool(_CORS_ALLOWED_ORIGINS or _CORS_ORIGIN_REGEX)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # For development, in production specify actual origins
-    allow_credentials=True,
+    allow_origins=_CORS_ALLOWED_ORIGINS if _CORS_RESTRICTED else ["*"],
+    allow_origin_regex=_CORS_ORIGIN_REGEX,
+    allow_credentials=_CORS_RESTRICTED,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Serve /openapi.json from bytes encoded once. FastAPI caches the schema dict
+# but re-encodes it on every request, so its route is replaced with ours.
+_openapi_bytes: Optional[bytes] = None
+
+
+def _get_openapi_bytes() -> bytes:
+    """Return the encoded OpenAPI document, generating it on first use."""
+    global _openapi_bytes
+    if _openapi_bytes is None:
+        schema = app.openapi()
+        _openapi_bytes = orjson.dumps(schema) if HAS_ORJSON else json.dumps(schema).encode("utf-8")
+    return _openapi_bytes
+
+
+app.router.routes[:] = [r for r in app.router.routes if getattr(r, "path", None) != app.openapi_url]
+
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_json() -> Response:
+    return Response(content=_get_openapi_bytes(), media_type="application/json")
+
+
 # 5) Provide service instances for the whole app
 data_store: Optional[DataStore] = None
 ai_analyzer: Optional[AIAnalysis] = None
 legiscan_api: Optional[LegiScanAPI] = None
+async_session_factory: Optional[async_sessionmaker] = None
 
 # Initialize data store - will be properly initialized when data_store is ready
 bill_store = None
 
+# Short-lived per-process cache of user preferences, keyed by email. Writes
+# through this process invalidate the entry; other workers see changes within
+# the TTL.
+_PREFS_CACHE_TTL_SECONDS = 60
+_prefs_cache = ResponseCache(max_size=10_000, ttl_seconds=_PREFS_CACHE_TTL_SECONDS)
+
 def get_bill_store():
     """
     Dependency that yields the bill_store with the global data_store.
@@ -193,7 +344,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "type": error["type"]
         })
 
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "status": "error",
@@ -203,6 +354,68 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+def _data_store_error_handler(status_code: int) -> Callable:
+    """
+    Build an exception handler that maps a DataStore error to a status code.
+
+    Args:
+        status_code: HTTP status code for the error
+
+    Returns:
+        Exception handler returning {"detail": str(exc)}
+    """
+    async def handler(request: Request, exc: Exception):
+        if status_code >= 500:
+            logger.error("Error processing %s %s: %s", request.method, request.url.path, exc, exc_info=exc)
+        else:
+            logger.warning("Error processing %s %s: %s", request.method, request.url.path, exc)
+        return DefaultJSONResponse(status_code=status_code, content={"detail": str(exc)})
+
+    return handler
+
+
+# Starlette picks the handler for the most specific class in the exception's MRO,
+# so NotFoundError takes precedence over its ValidationError base.
+app.add_exception_handler(ValidationError, _data_store_error_handler(status.HTTP_400_BAD_REQUEST))
+app.add_exception_handler(NotFoundError, _data_store_error_handler(status.HTTP_404_NOT_FOUND))
+app.add_exception_handler(ConnectionError, _data_store_error_handler(status.HTTP_503_SERVICE_UNAVAILABLE))
+app.add_exception_handler(DatabaseOperationError, _data_store_error_handler(status.HTTP_500_INTERNAL_SERVER_ERROR))
+
+
+# HTTP status for each AI analysis error code
+_AI_ERROR_STATUS: Dict[ErrorCode, int] = {
+    ErrorCode.AI_ANALYSIS: status.HTTP_500_INTERNAL_SERVER_ERROR,
+    ErrorCode.TOKEN_LIMIT: status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    ErrorCode.API: status.HTTP_502_BAD_GATEWAY,
+    ErrorCode.RATE_LIMIT: status.HTTP_429_TOO_MANY_REQUESTS,
+    ErrorCode.CONTENT_PROCESSING: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ErrorCode.DATABASE: status.HTTP_500_INTERNAL_SERVER_ERROR,
+}
+
+
+@app.exception_handler(AIAnalysisError)
+async def ai_analysis_exception_handler(request: Request, exc: AIAnalysisError):
+    """
+    Map an AI analysis error to an HTTP status by its error code.
+
+    Args:
+        request: The request that caused the exception
+        exc: The AI analysis error
+
+    Returns:
+        JSONResponse with the error detail and code
+    """
+    status_code = _AI_ERROR_STATUS.get(exc.CODE, status.HTTP_500_INTERNAL_SERVER_ERROR)
+    if status_code >= 500:
+        logger.error("AI analysis error processing %s %s: %s", request.method, request.url.path, exc, exc_info=exc)
+    else:
+        logger.warning("AI analysis error processing %s %s: %s", request.method, request.url.path, exc)
+    return DefaultJSONResponse(
+        status_code=status_code,
+        content={"detail": str(exc), "error_code": exc.CODE.name}
+    )
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """
@@ -215,12 +428,11 @@ async def general_exception_handler(request: Request, exc: Exception):
     Returns:
         JSONResponse with error details
     """
-    # Log the error with traceback
-    logger.error(f"Unhandled exception processing {request.method} {request.url}: {exc}")
-    logger.error(traceback.format_exc())
+    # Log the error with traceback; logging renders it only if a handler emits
+    logger.error("Unhandled exception processing %s %s: %s", request.method, request.url, exc, exc_info=exc)
 
     # Return a standard error response
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "status": "error",
@@ -232,105 +444,131 @@ async def general_exception_handler(request: Request, exc: Exception):
 # -----------------------------------------------------------------------------
 # Utility Functions and Decorators
 # -----------------------------------------------------------------------------
-def log_api_call(func: Callable):
+def _find_request_param(func: Callable) -> Optional[Tuple[int, str]]:
     """
-    Decorator to log API calls with timing information.
+    Locate the Request parameter of an endpoint function.
 
     Args:
-        func: The API endpoint function to wrap
+        func: The endpoint function
 
     Returns:
-        Wrapped function with logging
+        (position, name) of the parameter annotated as Request, or None
     """
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        # Get request from args or kwargs
-        request = kwargs.get('request')
-        if request is None:
-            for arg in args:
-                if isinstance(arg, Request):
-                    request = arg
-                    break
-        
-        # For endpoints without request parameter (like health check)
-        func_name = func.__name__
-        
-        # Log info based on what we have
-        if request is not None:
-            client_ip = request.client.host if hasattr(request, 'client') and request.client is not None else 'unknown'
-            endpoint = f"{request.method} {request.url.path}"
-            logger.info(f"API call from {client_ip}: {endpoint}")
-        else:
-            logger.info(f"API call to function: {func_name}")
+    params = inspect.signature(func).parameters.items()
+    return next(((i, name) for i, (name, p) in enumerate(params) if p.annotation is Request), None)
 
-        # Track timing
-        start_time = datetime.now()
-        try:
-            # Execute the endpoint function
-            response = await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
-            # Log successful completion with timing
-            elapsed = (datetime.now() - start_time).total_seconds() * 1000
-            endpoint_name = endpoint if request else func_name
-            logger.info(f"API call completed: {endpoint_name} ({elapsed:.2f}ms)")
-            return response
-        except Exception as e:
-            # Log exception with timing
-            elapsed = (datetime.now() - start_time).total_seconds() * 1000
-            endpoint_name = endpoint if request else func_name
-            logger.error(f"API call failed: {endpoint_name} ({elapsed:.2f}ms) - {str(e)}")
-            raise
 
-    return wrapper
+# API call logging: completed calls are logged 1 in _API_LOG_SAMPLE_EVERY,
+# plus every call slower than _API_LOG_SLOW_MS. Failures are always logged.
+_API_LOG_SAMPLE_EVERY = max(1, int(os.getenv("API_LOG_SAMPLE", "10")))
+_API_LOG_SLOW_MS = float(os.getenv("API_LOG_SLOW_MS", "1000"))
+_api_call_counter = itertools.count()
 
 
-@contextmanager
-def error_handler(operation_name: str, error_map: Optional[Dict[Type[Exception], int]] = None):
+def _endpoint_label(func: Callable, request_param: Optional[Tuple[int, str]],
+                    args: tuple, kwargs: dict) -> str:
     """
-    Context manager for consistent error handling in API endpoints.
+    Describe an API call for log messages.
 
     Args:
-        operation_name: Name of the operation for logging
-        error_map: Mapping of exception types to HTTP status codes
+        func: The wrapped endpoint function
+        request_param: Location of func's Request parameter from _find_request_param()
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
 
-    Yields:
-        Control to the wrapped code block
+    Returns:
+        "METHOD /path from client" when the request is available, otherwise
+        the function name
+    """
+    request = None
+    if request_param is not None:
+        index, name = request_param
+        request = kwargs.get(name)
+        if request is None and index < len(args):
+            request = args[index]
 
-    Raises:
-        HTTPException: With the appropriate status code and detail message
-    """
-    # Default error mapping if none provided
-    if error_map is None:
-        error_map = {
-            ValidationError: status.HTTP_400_BAD_REQUEST,
-            ConnectionError: status.HTTP_503_SERVICE_UNAVAILABLE,
-            DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-            Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-        }
+    if request is None:
+        # For endpoints without request parameter (like health check)
+        return func.__name__
+    client_ip = request.client.host if request.client is not None else 'unknown'
+    return f"{request.method} {request.url.path} from {client_ip}"
 
-    try:
-        yield
-    except tuple(error_map.keys()) as e:
-        # Get the exception type
-        exc_type = type(e)
 
-        # Find the most specific matching exception type in the error map
-        matching_types = [t for t in error_map.keys() if issubclass(exc_type, t)]
-        most_specific_type = min(matching_types, key=lambda t: len(t.__mro__))
+def _log_call_end(func: Callable, request_param: Optional[Tuple[int, str]],
+                  args: tuple, kwargs: dict, start_ns: int,
+                  error: Optional[Exception] = None) -> None:
+    """
+    Log a finished API call with its timing, subject to sampling.
 
-        # Get the status code for this exception type
-        status_code = error_map[most_specific_type]
+    Args:
+        func: The wrapped endpoint function
+        request_param: Location of func's Request parameter from _find_request_param()
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        start_ns: perf_counter_ns() value taken when the call started
+        error: Exception raised by the call, if any
+    """
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000.0
+    if error is not None:
+        logger.error("API call failed: %s (%.2fms) - %s",
+                     _endpoint_label(func, request_param, args, kwargs), elapsed_ms, error)
+        return
+    sampled = next(_api_call_counter) % _API_LOG_SAMPLE_EVERY == 0
+    if (sampled or elapsed_ms >= _API_LOG_SLOW_MS) and logger.isEnabledFor(logging.INFO):
+        logger.info("API call completed: %s (%.2fms)",
+                    _endpoint_label(func, request_param, args, kwargs), elapsed_ms)
 
-        # Log the error with appropriate severity
-        if status_code >= 500:
-            logger.error(f"Error in {operation_name}: {e}", exc_info=True)
-        else:
-            logger.warning(f"Error in {operation_name}: {e}")
 
-        # Raise HTTPException with appropriate status code and detail
-        raise HTTPException(
-            status_code=status_code,
-            detail=f"{operation_name} failed: {str(e)}"
-        )
+def log_api_call(func: Callable):
+    """
+    Decorator to log API calls with timing information.
+
+    Successful calls are sampled (see _API_LOG_SAMPLE_EVERY) and slow or
+    failed calls are always logged. A sync or async wrapper is chosen once at
+    decoration time to match func, so FastAPI still runs sync endpoints in
+    its threadpool. Sync endpoints run concurrently on different threads, so
+    each uses its thread's own DataStore session, which the sync wrapper
+    releases when the call returns.
+
+    Args:
+        func: The API endpoint function to wrap
+
+    Returns:
+        Wrapped function with logging
+    """
+    # FastAPI passes endpoint arguments by name, so the Request (if declared)
+    # is found with one lookup instead of scanning args on every call
+    request_param = _find_request_param(func)
+
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            start_ns = time.perf_counter_ns()
+            try:
+                response = await func(*args, **kwargs)
+            except Exception as e:
+                _log_call_end(func, request_param, args, kwargs, start_ns, e)
+                raise
+            _log_call_end(func, request_param, args, kwargs, start_ns)
+            return response
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start_ns = time.perf_counter_ns()
+            try:
+                response = func(*args, **kwargs)
+            except Exception as e:
+                _log_call_end(func, request_param, args, kwargs, start_ns, e)
+                raise
+            finally:
+                # Runs on the endpoint's threadpool thread, so this releases
+                # the session the endpoint used
+                if data_store is not None:
+                    data_store.release_session()
+            _log_call_end(func, request_param, args, kwargs, start_ns)
+            return response
+
+    return wrapper
 
 
 def run_in_background(func):
@@ -367,7 +605,23 @@ def run_in_background(func):
 # -----------------------------------------------------------------------------
 # Pydantic Models for request/response bodies
 # -----------------------------------------------------------------------------
-class UserPrefsPayload(BaseModel):
+class RequestModel(BaseModel):
+    """
+    Base class for request bodies.
+
+    Request models are immutable once validated, reject unknown fields, and
+    strip surrounding whitespace from every string (including list items).
+    Subclass model_config dicts are merged with this one.
+    """
+    model_config = {
+        "extra": "forbid",
+        "frozen": True,
+        "populate_by_name": True,
+        "str_strip_whitespace": True
+    }
+
+
+class UserPrefsPayload(RequestModel):
     """Request model for user preferences."""
     keywords: List[str] = Field(default_factory=list, description="User-defined keywords for tracking legislation")
     health_focus: List[str] = Field(default_factory=list, description="Health department focus areas")
@@ -377,12 +631,13 @@ class UserPrefsPayload(BaseModel):
     @field_validator('keywords', 'health_focus', 'local_govt_focus', 'regions')
     def validate_string_lists(cls, v):
         """Validate that list items are non-empty strings."""
-        if not all(isinstance(item, str) and item.strip() for item in v):
+        # Items are already stripped (str_strip_whitespace)
+        if not all(v):
             raise ValueError("All list items must be non-empty strings")
-        return [item.strip() for item in v]
+        return v
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "keywords": ["healthcare", "funding", "education"],
                 "health_focus": ["mental health", "preventative care"],
@@ -390,76 +645,59 @@ class UserPrefsPayload(BaseModel):
                 "regions": ["Central Texas", "Gulf Coast"]
             }
         }
+    }
 
 
-class UserSearchPayload(BaseModel):
+class UserSearchPayload(RequestModel):
     """Request/response model for search history."""
     query: str = Field(..., min_length=1, description="Search query string")
     results: Dict[str, Any] = Field(default_factory=dict, description="Search result metadata")
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "query": "healthcare funding",
                 "results": {"total_hits": 42, "search_time_ms": 156}
             }
         }
+    }
 
 
-class AIAnalysisPayload(BaseModel):
+class AIAnalysisPayload(RequestModel):
     """Request model for AI analysis options."""
-    model_name: Optional[str] = Field(None, description="Name of the AI model to use for analysis")
+    model_name: ModelName = Field(None, description="Name of the AI model to use for analysis")
     focus_areas: Optional[List[str]] = Field(None, description="Specific areas to focus the analysis on")
     force_refresh: bool = Field(False, description="Whether to force a refresh of existing analysis")
 
-    @field_validator('model_name')
-    def validate_model_name(cls, v):
-        """Validate that the model name is a recognized model."""
-        if v is not None:
-            valid_models = ["gpt-4o", "gpt-4o-2024-08-06", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo"]
-            if v not in valid_models and not v.startswith(tuple(valid_models)):
-                raise ValueError(f"Model name '{v}' is not a recognized model. Valid options include: {', '.join(valid_models)}")
-        return v
-
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "model_name": "gpt-4o",
                 "focus_areas": ["public health", "local government"],
                 "force_refresh": False
             }
         }
+    }
 
 
-class AnalysisOptions(BaseModel):
+class AnalysisOptions(RequestModel):
     """Options for controlling analysis behavior."""
     deep_analysis: bool = Field(False, description="Whether to perform a more thorough analysis")
     texas_focus: bool = Field(True, description="Whether to focus analysis on Texas impacts")
     focus_areas: Optional[List[str]] = Field(None, description="Specific areas to focus the analysis on")
-    model_name: Optional[str] = Field(None, description="Name of the AI model to use for analysis")
+    model_name: ModelName = Field(None, description="Name of the AI model to use for analysis")
 
     @field_validator('focus_areas')
     def validate_focus_areas(cls, v):
         """Validate that focus areas are valid."""
         if v is not None:
-            valid_areas = ["public health", "local government", "economic", "environmental", "healthcare", 
-                           "social services", "education", "infrastructure", "justice"]
             for area in v:
-                if area.lower() not in valid_areas:
+                if area.lower() not in _VALID_FOCUS_AREAS:
                     raise ValueError(f"'{area}' is not a recognized focus area")
         return v
 
-    @field_validator('model_name')
-    def validate_model_name(cls, v):
-        """Validate that the model name is a recognized model."""
-        if v is not None:
-            valid_models = ["gpt-4o", "gpt-4o-2024-08-06", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo"]
-            if v not in valid_models and not v.startswith(tuple(valid_models)):
-                raise ValueError(f"Model name '{v}' is not a recognized model. Valid options include: {', '.join(valid_models)}")
-        return v
-
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "deep_analysis": True,
                 "texas_focus": True,
@@ -467,31 +705,38 @@ class AnalysisOptions(BaseModel):
                 "model_name": "gpt-4o"
             }
         }
+    }
 
 
-class DateRange(BaseModel):
+class DateRange(RequestModel):
     """Model representing a date range for filtering."""
-    start_date: str = Field(..., pattern="^\\d{4}-\\d{2}-\\d{2}$", description="Start date in YYYY-MM-DD format")
-    end_date: str = Field(..., pattern="^\\d{4}-\\d{2}-\\d{2}$", description="End date in YYYY-MM-DD format")
-
-    @field_validator('end_date')
-    def end_date_must_be_after_start_date(cls, v, values):
-        """Validate that end date is after start date."""
-        if 'start_date' in values and v < values['start_date']:
-            raise ValueError('end_date must be after start_date')
-        return v
+    start_date: str = Field(..., description="Start date in YYYY-MM-DD format")
+    end_date: str = Field(..., description="End date in YYYY-MM-DD format")
 
     @field_validator('start_date', 'end_date')
     def validate_date_format(cls, v):
-        """Validate that dates are in a valid format."""
+        """Validate that dates are real calendar dates in YYYY-MM-DD format."""
+        # date.fromisoformat also accepts YYYYMMDD and week dates, so check
+        # the shape with two index lookups before parsing
+        if len(v) != 10 or v[4] != "-" or v[7] != "-":
+            raise ValueError(f"Invalid date format: {v}. Expected YYYY-MM-DD")
         try:
-            datetime.fromisoformat(v)
-            return v
+            date.fromisoformat(v)
         except ValueError:
             raise ValueError(f"Invalid date format: {v}. Expected YYYY-MM-DD")
+        return v
 
+    @field_validator('end_date')
+    def end_date_must_be_after_start_date(cls, v, info):
+        """Validate that end date is after start date."""
+        # ISO dates compare correctly as strings
+        start_date = info.data.get('start_date')
+        if start_date is not None and v < start_date:
+            raise ValueError('end_date must be after start_date')
+        return v
 
-class BillSearchFilters(BaseModel):
+
+class BillSearchFilters(RequestModel):
     """Model for search filters."""
     bill_status: Optional[List[str]] = Field(None, description="Filter by bill status values")
     impact_category: Optional[List[str]] = Field(None, description="Filter by impact category")
@@ -500,51 +745,54 @@ class BillSearchFilters(BaseModel):
     date_range: Optional[DateRange] = Field(None, description="Filter by date range")
     reviewed_only: Optional[bool] = Field(None, description="Filter to only include reviewed legislation")
 
+    # Frozen (via RequestModel) so the shared empty default below can never
+    # be mutated, and so Pydantic uses it as a default without copying
+
     @field_validator('bill_status')
     def validate_bill_status(cls, v):
         """Validate bill status values."""
         if v is not None:
-            valid_statuses = [status.value for status in BillStatusEnum]
-            for status in v:
-                if status not in valid_statuses:
-                    raise ValueError(f"Invalid bill_status: {status}. Valid values: {', '.join(valid_statuses)}")
+            bad = [x for x in v if x not in _VALID_BILL_STATUSES]
+            if bad:
+                raise ValueError(f"Invalid bill_status: {bad[0]}. Valid values: {_VALID_BILL_STATUSES_STR}")
         return v
 
     @field_validator('impact_category')
     def validate_impact_category(cls, v):
         """Validate impact category values."""
         if v is not None:
-            valid_categories = [cat.value for cat in ImpactCategoryEnum]
-            for category in v:
-                if category not in valid_categories:
-                    raise ValueError(f"Invalid impact_category: {category}. Valid values: {', '.join(valid_categories)}")
+            bad = [x for x in v if x not in _VALID_IMPACT_CATEGORIES]
+            if bad:
+                raise ValueError(f"Invalid impact_category: {bad[0]}. Valid values: {_VALID_IMPACT_CATEGORIES_STR}")
         return v
 
     @field_validator('impact_level')
     def validate_impact_level(cls, v):
         """Validate impact level values."""
         if v is not None:
-            valid_levels = [level.value for level in ImpactLevelEnum]
-            for level in v:
-                if level not in valid_levels:
-                    raise ValueError(f"Invalid impact_level: {level}. Valid values: {', '.join(valid_levels)}")
+            bad = [x for x in v if x not in _VALID_IMPACT_LEVELS]
+            if bad:
+                raise ValueError(f"Invalid impact_level: {bad[0]}. Valid values: {_VALID_IMPACT_LEVELS_STR}")
         return v
 
     @field_validator('govt_type')
     def validate_govt_type(cls, v):
         """Validate government type values."""
         if v is not None:
-            valid_types = [gtype.value for gtype in GovtTypeEnum]
-            for gtype in v:
-                if gtype not in valid_types:
-                    raise ValueError(f"Invalid govt_type: {gtype}. Valid values: {', '.join(valid_types)}")
+            bad = [x for x in v if x not in _VALID_GOVT_TYPES]
+            if bad:
+                raise ValueError(f"Invalid govt_type: {bad[0]}. Valid values: {_VALID_GOVT_TYPES_STR}")
         return v
 
 
-class BillSearchQuery(BaseModel):
+# Shared default for BillSearchQuery.filters
+_EMPTY_FILTERS = BillSearchFilters()
+
+
+class BillSearchQuery(RequestModel):
     """Advanced search parameters."""
     query: str = Field("", description="Search query string")
-    filters: BillSearchFilters = Field(default_factory=lambda: BillSearchFilters(), description="Search filters")
+    filters: BillSearchFilters = Field(_EMPTY_FILTERS, description="Search filters")
     sort_by: str = Field("relevance", description="Field to sort results by")
     sort_dir: str = Field("desc", description="Sort direction (asc or desc)")
     limit: int = Field(50, description="Maximum number of results to return", ge=1, le=100)
@@ -553,20 +801,19 @@ class BillSearchQuery(BaseModel):
     @field_validator('sort_by')
     def validate_sort_by(cls, v):
         """Validate sort field is supported."""
-        valid_sort_fields = ["relevance", "date", "updated", "status", "title", "priority"]
-        if v not in valid_sort_fields:
-            raise ValueError(f"sort_by must be one of: {', '.join(valid_sort_fields)}")
+        if v not in _VALID_SORT_FIELDS_SET:
+            raise ValueError(f"sort_by must be one of: {', '.join(_VALID_SORT_FIELDS)}")
         return v
 
     @field_validator('sort_dir')
     def validate_sort_dir(cls, v):
         """Ensure sort direction is valid."""
-        if v not in ['asc', 'desc']:
+        if v not in _VALID_SORT_DIRS:
             raise ValueError('sort_dir must be either "asc" or "desc"')
         return v
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "query": "healthcare funding",
                 "filters": {
@@ -586,9 +833,10 @@ class BillSearchQuery(BaseModel):
                 "offset": 0
             }
         }
+    }
 
 
-class SetPriorityPayload(BaseModel):
+class SetPriorityPayload(RequestModel):
     """Manual priority setting payload."""
     public_health_relevance: Optional[int] = Field(
         None, description="Public health relevance score (0-100)", ge=0, le=100
@@ -608,8 +856,8 @@ class SetPriorityPayload(BaseModel):
             raise ValueError('At least one field must be provided')
         return self
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "public_health_relevance": 85,
                 "local_govt_relevance": 70,
@@ -617,6 +865,7 @@ class SetPriorityPayload(BaseModel):
                 "notes": "Significant impact on local health departments' funding"
             }
         }
+    }
 
 
 # Response models
@@ -655,6 +904,13 @@ class AnalysisStatusResponse(BaseModel):
     analysis_id: Optional[int] = Field(None, description="Analysis ID if completed")
     analysis_version: Optional[str] = Field(None, description="Analysis version if completed")
     analysis_date: Optional[str] = Field(None, description="Analysis date if completed")
+    task_id: Optional[str] = Field(None, description="Task queue ID if the analysis was queued")
+
+
+class TaskStatusResponse(BaseModel):
+    """Response model for queued task status."""
+    task_id: str = Field(..., description="Task queue ID")
+    state: str = Field(..., description="Task state (PENDING, STARTED, SUCCESS, FAILURE, ...)")
 
 
 class AnalysisHistoryResponse(BaseModel):
@@ -677,9 +933,117 @@ class SyncStatusResponse(BaseModel):
     count: int = Field(..., description="Number of sync records")
 
 
+# msgspec mirrors of the read-only response models. These are only ever
+# encoded, so hot list endpoints return them as pre-encoded JSON instead of
+# going through FastAPI's Pydantic serialization. The Pydantic models above
+# remain the response_model for OpenAPI documentation.
+if HAS_MSGSPEC:
+    class BillSummaryStruct(msgspec.Struct):
+        bill_id: int
+        state: str
+        bill_number: str
+        title: str
+        description: str
+        status: str
+        last_action: Optional[str] = None
+        last_action_date: Optional[str] = None
+
+    class BillDetailStruct(BillSummaryStruct):
+        text: Optional[str] = None
+        sponsors: List[str] = []
+        history: List[dict] = []
+        votes: List[dict] = []
+
+    class LegislationListStruct(msgspec.Struct):
+        count: int
+        items: List[Dict[str, Any]]
+        page_info: Dict[str, Any] = {}
+        facets: Optional[Dict[str, Any]] = None
+
+    class AnalysisHistoryStruct(msgspec.Struct):
+        legislation_id: int
+        analysis_count: int
+        analyses: List[Dict[str, Any]]
+
+    _JSON_ENCODER = msgspec.json.Encoder()
+else:
+    BillSummaryStruct = BillDetailStruct = None
+    LegislationListStruct = AnalysisHistoryStruct = None
+
+
+def msgspec_response(struct_type: Any, data: Any) -> Any:
+    """
+    Encode an endpoint result with msgspec and return it as a JSON response.
+
+    The data is converted to struct_type first, which drops unknown keys and
+    checks the shape the same way response_model would. If msgspec is not
+    installed, data is returned unchanged for FastAPI to serialize.
+
+    Args:
+        struct_type: msgspec Struct type (or list of one) describing the response
+        data: Endpoint result as built for the Pydantic response_model
+
+    Returns:
+        Response with the encoded JSON body, or data if msgspec is unavailable
+    """
+    if not HAS_MSGSPEC:
+        return data
+    obj = msgspec.convert(data, struct_type, strict=False)
+    return Response(content=_JSON_ENCODER.encode(obj), media_type="application/json")
+
+
+def orjson_response(data: Any) -> Any:
+    """
+    Return a JSON-safe endpoint result as an ORJSONResponse.
+
+    This skips FastAPI's jsonable_encoder pass, for endpoints without a
+    response_model whose data is already plain dicts, lists and datetimes.
+    If orjson is not installed, data is returned unchanged for FastAPI to
+    serialize.
+
+    Args:
+        data: Endpoint result
+
+    Returns:
+        ORJSONResponse with the encoded body, or data if orjson is unavailable
+    """
+    if not HAS_ORJSON:
+        return data
+    return ORJSONResponse(content=data)
+
+
 # -----------------------------------------------------------------------------
 # Dependencies
 # -----------------------------------------------------------------------------
+async def _validated_email(email: str = Path(..., description="User's email address")) -> str:
+    """
+    Check the shape of an email path parameter before the endpoint runs.
+
+    Uses the same pattern as DataStore._validate_email, so bad addresses are
+    rejected before any cache lookup or threadpool hop. Declared async so
+    FastAPI runs it inline rather than in the threadpool.
+
+    Args:
+        email: Email address from the URL path
+
+    Returns:
+        The email address, unchanged
+
+    Raises:
+        HTTPException: If the address is not a valid email format
+    """
+    if not _EMAIL_RE.match(email):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid email format: {email}"
+        )
+    return email
+
+
+# Email path parameter checked by _validated_email
+ValidEmail = Annotated[str, Depends(_validated_email)]
+
+
 def get_data_store() -> DataStore:
     """
     Dependency that yields the global data_store.
@@ -699,6 +1063,44 @@ def get_data_store() -> DataStore:
     return data_store
 
 
+def _call_store(method: Callable, *args: Any) -> Any:
+    """
+    Run a DataStore method, then release the calling thread's session.
+
+    For async endpoints that hop to the threadpool with run_in_threadpool();
+    the session must be released on the thread that used it.
+
+    Args:
+        method: Bound DataStore method
+        *args: Positional arguments for the method
+
+    Returns:
+        The method's return value
+    """
+    try:
+        return method(*args)
+    finally:
+        method.__self__.release_session()
+
+
+async def get_async_session() -> AsyncGenerator[Optional[AsyncSession], None]:
+    """
+    Dependency that yields an AsyncSession for the duration of a request.
+
+    asyncpg is optional, so endpoints must fall back to the sync DataStore
+    when this yields None.
+
+    Returns:
+        AsyncSession bound to the async engine, or None if async database
+        access is not initialized
+    """
+    if async_session_factory is None:
+        yield None
+        return
+    async with async_session_factory() as session:
+        yield session
+
+
 def get_ai_analyzer() -> AIAnalysis:
     """
     Dependency that yields the global ai_analyzer.
@@ -740,9 +1142,18 @@ def get_legiscan_api() -> LegiScanAPI:
 # -----------------------------------------------------------------------------
 # Health Check
 # -----------------------------------------------------------------------------
-@app.get("/health", tags=["Utility"], response_model=HealthResponse)
+# The health response never changes, so it is encoded once
+_HEALTH_PAYLOAD = {
+    "status": "ok",
+    "message": "PolicyPulse API up and running",
+    "version": "2.0.0"
+}
+_HEALTH_BYTES = orjson.dumps(_HEALTH_PAYLOAD) if HAS_ORJSON else json.dumps(_HEALTH_PAYLOAD).encode("utf-8")
+
+
+@app.get("/health", tags=["Utility"], response_class=Response, responses={200: {"model": HealthResponse}})
 @log_api_call
-def health_check(request: Request = None):
+async def health_check(request: Request = None):
     """
     Basic health endpoint to verify the API is alive.
 
@@ -750,13 +1161,9 @@ def health_check(request: Request = None):
         request: FastAPI request object (optional)
     
     Returns:
-        Health status information
+        Pre-encoded health status information
     """
-    return {
-        "status": "ok", 
-        "message": "PolicyPulse API up and running", 
-        "version": "2.0.0"
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 # -----------------------------------------------------------------------------
@@ -764,8 +1171,8 @@ def health_check(request: Request = None):
 # -----------------------------------------------------------------------------
 @app.post("/users/{email}/preferences", tags=["User"], response_model=Dict[str, str])
 @log_api_call
-def update_user_preferences(
-    email: str,
+async def update_user_preferences(
+    email: ValidEmail,
     prefs: UserPrefsPayload,
     store: DataStore = Depends(get_data_store)
 ):
@@ -785,33 +1192,29 @@ def update_user_preferences(
     Raises:
         HTTPException: If email is invalid or preferences cannot be saved
     """
-    with error_handler("Update user preferences", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        ConnectionError: status.HTTP_503_SERVICE_UNAVAILABLE,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Convert payload to dict for storage
-        prefs_dict = prefs.dict(exclude_unset=True)
+    # Convert payload to dict for storage
+    prefs_dict = prefs.model_dump(exclude_unset=True)
 
-        # Save preferences
-        success = store.save_user_preferences(email, prefs_dict)
+    # Save preferences
+    success = await run_in_threadpool(_call_store, store.save_user_preferences, email, prefs_dict)
+    _prefs_cache.invalidate(email)
 
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update preferences."
-            )
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update preferences."
+        )
 
-        return {
-            "status": "success", 
-            "message": f"Preferences updated for {email}"
-        }
+    return {
+        "status": "success", 
+        "message": f"Preferences updated for {email}"
+    }
 
 
 @app.get("/users/{email}/preferences", tags=["User"], response_model=UserPreferencesResponse)
 @log_api_call
-def get_user_preferences(
-    email: str,
+async def get_user_preferences(
+    email: ValidEmail,
     store: DataStore = Depends(get_data_store)
 ):
     """
@@ -828,11 +1231,11 @@ def get_user_preferences(
     Raises:
         HTTPException: If email is invalid
     """
-    with error_handler("Get user preferences", {
-        ValidationError: status.HTTP_400_BAD_REQUEST
-    }):
-        prefs = store.get_user_preferences(email)
-        return {"email": email, "preferences": prefs}
+    prefs = _prefs_cache.lookup(email)
+    if prefs is None:
+        prefs = await run_in_threadpool(_call_store, store.get_user_preferences, email)
+        _prefs_cache.update(email, prefs)
+    return {"email": email, "preferences": prefs}
 
 
 # -----------------------------------------------------------------------------
@@ -841,7 +1244,7 @@ def get_user_preferences(
 @app.post("/users/{email}/search", tags=["Search"], response_model=Dict[str, str])
 @log_api_call
 def add_search_history(
-    email: str,
+    email: ValidEmail,
     payload: UserSearchPayload,
     store: DataStore = Depends(get_data_store)
 ):
@@ -859,28 +1262,24 @@ def add_search_history(
     Raises:
         HTTPException: If email is invalid or search history cannot be saved
     """
-    with error_handler("Add search history", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        ok = store.add_search_history(email, payload.query, payload.results)
+    ok = store.add_search_history(email, payload.query, payload.results)
 
-        if not ok:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to add search history."
-            )
+    if not ok:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to add search history."
+        )
 
-        return {
-            "status": "success", 
-            "message": f"Search recorded for {email}"
-        }
+    return {
+        "status": "success", 
+        "message": f"Search recorded for {email}"
+    }
 
 
 @app.get("/users/{email}/search", tags=["Search"], response_model=SearchHistoryResponse)
 @log_api_call
 def get_search_history(
-    email: str,
+    email: ValidEmail,
     store: DataStore = Depends(get_data_store)
 ):
     """
@@ -896,11 +1295,8 @@ def get_search_history(
     Raises:
         HTTPException: If email is invalid
     """
-    with error_handler("Get search history", {
-        ValidationError: status.HTTP_400_BAD_REQUEST
-    }):
-        history = store.get_search_history(email)
-        return {"email": email, "history": history}
+    history = store.get_search_history(email)
+    return {"email": email, "history": history}
 
 
 # -----------------------------------------------------------------------------
@@ -908,9 +1304,12 @@ def get_search_history(
 # -----------------------------------------------------------------------------
 @app.get("/legislation", tags=["Legislation"], response_model=LegislationListResponse)
 @log_api_call
+@http_cache(max_age=60, stale_while_revalidate=30)
+@cached_response("leg:list", ttl_seconds=300)
+@single_flight("leg:list")
 def list_legislation(
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
     store: DataStore = Depends(get_data_store)
 ):
     """
@@ -927,27 +1326,19 @@ def list_legislation(
     Raises:
         HTTPException: If pagination parameters are invalid
     """
-    with error_handler("List legislation", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Validate pagination parameters
-        if limit < 1 or limit > 100:
-            raise ValidationError("Limit must be between 1 and 100")
-        if offset < 0:
-            raise ValidationError("Offset cannot be negative")
-
-        result = store.list_legislation(limit=limit, offset=offset)
-        return {
-            "count": result["total_count"], 
-            "items": result["items"],
-            "page_info": result.get("page_info", {})
-        }
+    result = store.list_legislation(limit=limit, offset=offset)
+    return msgspec_response(LegislationListStruct, {
+        "count": result["total_count"], 
+        "items": result["items"],
+        "page_info": result.get("page_info", {})
+    })
 
 
 @app.get("/legislation/{leg_id}", tags=["Legislation"])
 @log_api_call
-def get_legislation_detail(
+@http_cache(max_age=300)
+@cached_response("leg:{leg_id}", ttl_seconds=3600)
+async def get_legislation_detail(
     leg_id: int,
     store: DataStore = Depends(get_data_store)
 ):
@@ -955,6 +1346,10 @@ def get_legislation_detail(
     Retrieve a single legislation record with detail, including
     latest text and analysis if present.
 
+    With async database access the legislation row, latest text and latest
+    analysis are queried concurrently. Without it, or if the async driver
+    fails, the DataStore lookup runs in the threadpool instead.
+
     Args:
         leg_id: Legislation ID
         store: DataStore instance
@@ -965,26 +1360,32 @@ def get_legislation_detail(
     Raises:
         HTTPException: If legislation is not found or ID is invalid
     """
-    with error_handler("Get legislation details", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Validate legislation ID
-        if leg_id <= 0:
-            raise ValidationError("Legislation ID must be a positive integer")
+    # Validate legislation ID
+    if leg_id <= 0:
+        raise ValidationError("Legislation ID must be a positive integer")
 
-        details = store.get_legislation_details(leg_id)
-        if not details:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Legislation with ID {leg_id} not found"
-            )
+    details = None
+    use_sync = async_session_factory is None
+    if not use_sync:
+        try:
+            details = await fetch_legislation_details(async_session_factory, leg_id)
+        except ASYNC_DB_ERRORS as e:
+            logger.warning("Async detail query for legislation %s failed, using the sync DataStore: %s", leg_id, e)
+            use_sync = True
+    if use_sync:
+        details = await run_in_threadpool(_call_store, store.get_legislation_details, leg_id)
+    if not details:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Legislation with ID {leg_id} not found"
+        )
 
-        return details
+    return details
 
 
 @app.get("/legislation/search", tags=["Legislation"], response_model=LegislationListResponse)
 @log_api_call
+@cached_response("leg:list", ttl_seconds=300)
 def search_legislation(
     keywords: str,
     store: DataStore = Depends(get_data_store)
@@ -1003,34 +1404,30 @@ def search_legislation(
     Raises:
         HTTPException: If keywords are invalid
     """
-    with error_handler("Search legislation", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        if not keywords or not keywords.strip():
-            raise ValidationError("Keywords parameter cannot be empty")
-
-        # Parse keywords
-        kws = [kw.strip() for kw in keywords.split(",") if kw.strip()]
-        if not kws:
-            return {"count": 0, "items": [], "page_info": {}}
-
-        # Using the advanced_search method with keyword query
-        search_results = store.advanced_search(
-            query="",  # No text query
-            filters={"keywords": kws},
-            sort_by="date",
-            sort_dir="desc",
-            limit=50,
-            offset=0
-        )
+    if not keywords or not keywords.strip():
+        raise ValidationError("Keywords parameter cannot be empty")
+
+    # Parse keywords
+    kws = [kw.strip() for kw in keywords.split(",") if kw.strip()]
+    if not kws:
+        return {"count": 0, "items": [], "page_info": {}}
+
+    # Using the advanced_search method with keyword query
+    search_results = store.advanced_search(
+        query="",  # No text query
+        filters={"keywords": kws},
+        sort_by="date",
+        sort_dir="desc",
+        limit=50,
+        offset=0
+    )
 
-        return {
-            "count": search_results["count"], 
-            "items": search_results["items"],
-            "page_info": search_results.get("page_info", {}),
-            "facets": search_results.get("facets", {})
-        }
+    return msgspec_response(LegislationListStruct, {
+        "count": search_results["count"], 
+        "items": search_results["items"],
+        "page_info": search_results.get("page_info", {}),
+        "facets": search_results.get("facets", {})
+    })
 
 
 # -----------------------------------------------------------------------------
@@ -1038,14 +1435,15 @@ def search_legislation(
 # -----------------------------------------------------------------------------
 @app.get("/texas/health-legislation", tags=["Texas"], response_model=LegislationListResponse)
 @log_api_call
+@cached_response("leg:list", ttl_seconds=300)
 def list_texas_health_legislation(
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
     bill_status: Optional[str] = None,  # Changed from 'status' to 'bill_status'
     impact_level: Optional[str] = None,
-    introduced_after: Optional[str] = None,
+    introduced_after: Optional[date] = None,
     keywords: Optional[str] = None,
-    relevance_threshold: Optional[int] = None,
+    relevance_threshold: Optional[int] = Query(None, ge=0, le=100),
     store: DataStore = Depends(get_data_store)
 ):
     """
@@ -1068,65 +1466,46 @@ def list_texas_health_legislation(
     Raises:
         HTTPException: If filter parameters are invalid
     """
-    with error_handler("List Texas health legislation", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Validate pagination parameters
-        if limit < 1 or limit > 100:
-            raise ValidationError("Limit must be between 1 and 100")
-        if offset < 0:
-            raise ValidationError("Offset cannot be negative")
-
-        # Validate optional parameters
-        if bill_status and bill_status not in [s.value for s in BillStatusEnum]:
-            raise ValidationError(f"Invalid bill_status: {bill_status}")
-
-        if impact_level and impact_level not in [il.value for il in ImpactLevelEnum]:
-            raise ValidationError(f"Invalid impact_level: {impact_level}")
-
-        if introduced_after:
-            try:
-                datetime.fromisoformat(introduced_after)
-            except ValueError:
-                raise ValidationError(f"Invalid introduced_after date: {introduced_after}. Format should be YYYY-MM-DD")
+    # Validate optional parameters
+    if bill_status and bill_status not in _VALID_BILL_STATUSES:
+        raise ValidationError(f"Invalid bill_status: {bill_status}")
 
-        if relevance_threshold is not None and (relevance_threshold < 0 or relevance_threshold > 100):
-            raise ValidationError("Relevance threshold must be between 0 and 100")
+    if impact_level and impact_level not in _VALID_IMPACT_LEVELS:
+        raise ValidationError(f"Invalid impact_level: {impact_level}")
 
-        # Build filters
-        filters = {}
+    # Build filters
+    filters = {}
 
-        if bill_status:
-            filters["status"] = bill_status
-        if impact_level:
-            filters["impact_level"] = impact_level
-        if introduced_after:
-            filters["introduced_after"] = introduced_after
-        if keywords:
-            filters["keywords"] = [k.strip() for k in keywords.split(",") if k.strip()]
-        if relevance_threshold is not None:
-            filters["relevance_threshold"] = relevance_threshold
+    if bill_status:
+        filters["status"] = bill_status
+    if impact_level:
+        filters["impact_level"] = impact_level
+    if introduced_after:
+        filters["introduced_after"] = introduced_after.isoformat()
+    if keywords:
+        filters["keywords"] = [k.strip() for k in keywords.split(",") if k.strip()]
+    if relevance_threshold is not None:
+        filters["relevance_threshold"] = relevance_threshold
 
-        # Get legislation
-        legislation = store.get_texas_health_legislation(limit=limit, offset=offset, filters=filters)
+    # Get legislation
+    legislation = store.get_texas_health_legislation(limit=limit, offset=offset, filters=filters)
 
-        # Format as LegislationListResponse
-        return {"count": len(legislation), "items": legislation}
+    # Format as LegislationListResponse
+    return msgspec_response(LegislationListStruct, {"count": len(legislation), "items": legislation})
 
 
 @app.get("/texas/local-govt-legislation", tags=["Texas"], response_model=LegislationListResponse)
 @log_api_call
+@cached_response("leg:list", ttl_seconds=300)
 def list_texas_local_govt_legislation(
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
     bill_status: Optional[str] = None,  # Changed from 'status' to 'bill_status'
     impact_level: Optional[str] = None,
-    introduced_after: Optional[str] = None,
+    introduced_after: Optional[date] = None,
     keywords: Optional[str] = None,
-    municipality_type: Optional[str] = None,
-    relevance_threshold: Optional[int] = None,
+    municipality_type: Optional[MunicipalityType] = None,
+    relevance_threshold: Optional[int] = Query(None, ge=0, le=100),
     store: DataStore = Depends(get_data_store)
 ):
     """
@@ -1150,66 +1529,46 @@ def list_texas_local_govt_legislation(
     Raises:
         HTTPException: If filter parameters are invalid
     """
-    with error_handler("List Texas local government legislation", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Validate pagination parameters
-        if limit < 1 or limit > 100:
-            raise ValidationError("Limit must be between 1 and 100")
-        if offset < 0:
-            raise ValidationError("Offset cannot be negative")
-
-        # Validate optional parameters
-        if bill_status and bill_status not in [s.value for s in BillStatusEnum]:
-            raise ValidationError(f"Invalid bill_status: {bill_status}")
-
-        if impact_level and impact_level not in [il.value for il in ImpactLevelEnum]:
-            raise ValidationError(f"Invalid impact_level: {impact_level}")
-
-        if introduced_after:
-            try:
-                datetime.fromisoformat(introduced_after)
-            except ValueError:
-                raise ValidationError(f"Invalid introduced_after date: {introduced_after}. Format should be YYYY-MM-DD")
-
-        if municipality_type and municipality_type not in ["city", "county", "school", "special"]:
-            raise ValidationError(f"Invalid municipality_type: {municipality_type}. Must be one of: city, county, school, special")
-
-        if relevance_threshold is not None and (relevance_threshold < 0 or relevance_threshold > 100):
-            raise ValidationError("Relevance threshold must be between 0 and 100")
-
-        # Build filters
-        filters = {"focus": "local_govt"}  # Set focus to local government
-
-        if bill_status:
-            filters["status"] = bill_status
-        if impact_level:
-            filters["impact_level"] = impact_level
-        if introduced_after:
-            filters["introduced_after"] = introduced_after
-        if keywords:
-            filters["keywords"] = ",".join([k.strip() for k in keywords.split(",") if k.strip()])
-        if municipality_type:
-            filters["municipality_type"] = municipality_type
-        if relevance_threshold is not None:
-            filters["relevance_threshold"] = str(relevance_threshold)
-
-        # Get legislation
-        legislation = store.get_texas_health_legislation(limit=limit, offset=offset, filters=filters)
-
-        # Format as LegislationListResponse
-        return {"count": len(legislation), "items": legislation}
+    # Validate optional parameters
+    if bill_status and bill_status not in _VALID_BILL_STATUSES:
+        raise ValidationError(f"Invalid bill_status: {bill_status}")
+
+    if impact_level and impact_level not in _VALID_IMPACT_LEVELS:
+        raise ValidationError(f"Invalid impact_level: {impact_level}")
+
+    # Build filters
+    filters = {"focus": "local_govt"}  # Set focus to local government
+
+    if bill_status:
+        filters["status"] = bill_status
+    if impact_level:
+        filters["impact_level"] = impact_level
+    if introduced_after:
+        filters["introduced_after"] = introduced_after.isoformat()
+    if keywords:
+        filters["keywords"] = [k.strip() for k in keywords.split(",") if k.strip()]
+    if municipality_type:
+        filters["municipality_type"] = municipality_type
+    if relevance_threshold is not None:
+        filters["relevance_threshold"] = relevance_threshold
+
+    # Get legislation
+    legislation = store.get_texas_health_legislation(limit=limit, offset=offset, filters=filters)
+
+    # Format as LegislationListResponse
+    return msgspec_response(LegislationListStruct, {"count": len(legislation), "items": legislation})
 
 # -----------------------------------------------------------------------------
 # Dashboard Analytics
 # -----------------------------------------------------------------------------
 @app.get("/dashboard/impact-summary", tags=["Dashboard"])
 @log_api_call
+@http_cache(max_age=60, stale_while_revalidate=30)
+@cached_response("dashboard:impact", ttl_seconds=1800)
+@single_flight("dashboard:impact")
 def get_impact_summary(
-    impact_type: str = "public_health",
-    time_period: str = "current",
+    impact_type: ImpactType = "public_health",
+    time_period: TimePeriod = "current",
     store: DataStore = Depends(get_data_store)
 ):
     """
@@ -1226,29 +1585,18 @@ def get_impact_summary(
     Raises:
         HTTPException: If parameters are invalid
     """
-    with error_handler("Get impact summary", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Validate parameters
-        valid_impact_types = ["public_health", "local_gov", "economic", "environmental", "education"]
-        if impact_type not in valid_impact_types:
-            raise ValidationError(f"Invalid impact_type: {impact_type}. Must be one of: {', '.join(valid_impact_types)}")
-
-        valid_time_periods = ["current", "past_month", "past_year", "all"]
-        if time_period not in valid_time_periods:
-            raise ValidationError(f"Invalid time_period: {time_period}. Must be one of: {', '.join(valid_time_periods)}")
-
-        # Get summary data
-        return store.get_impact_summary(impact_type=impact_type, time_period=time_period)
+    # impact_type and time_period are validated by their Literal types
+    return orjson_response(store.get_impact_summary(impact_type=impact_type, time_period=time_period))
 
 
 # Ensure the store dependency is correctly provided and setup
 @app.get("/dashboard/recent-activity", tags=["Dashboard"])
 @log_api_call
+@cached_response("dashboard:recent", ttl_seconds=120)
+@single_flight("dashboard:recent")
 def get_recent_activity(
-    days: int = 30,
-    limit: int = 10,
+    days: int = Query(30, ge=1, le=365),
+    limit: int = Query(10, ge=1, le=100),
     store: DataStore = Depends(get_data_store)
 ):
     """
@@ -1272,42 +1620,37 @@ def get_recent_activity(
             detail="Database session is not initialized. Please try again later."
         )
 
-    with error_handler("Get recent activity", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Validate parameters
-        if days < 1 or days > 365:
-            raise ValidationError("Days must be between 1 and 365")
-        if limit < 1 or limit > 100:
-            raise ValidationError("Limit must be between 1 and 100")
-
-        # Calculate cutoff date
-        cutoff_date = datetime.now() - timedelta(days=days)
-
-        try:
-            # Use the store's db_session to query for recently updated legislation
-            recent_legs = store.db_session.query(Legislation).filter(
-                Legislation.updated_at >= cutoff_date
-            ).order_by(Legislation.updated_at.desc()).limit(limit).all()
-
-            # Format response
-            activity = []
-            for leg in recent_legs:
-                activity.append({
-                    "id": leg.id,
-                    "bill_number": leg.bill_number,
-                    "title": leg.title,
-                    "status": leg.bill_status if leg.bill_status else None,
-                    "updated_at": leg.updated_at.isoformat() if leg.updated_at else None,
-                    "govt_type": leg.govt_type if leg.govt_type else None
-                })
-
-            return {"recent_legislation": activity, "time_period_days": days}
-        except Exception as e:
-            logger.error(f"Error getting recent activity: {e}", exc_info=True)
-            raise
+    try:
+        # Select only the returned columns (no ORM objects) and let the
+        # database compute the cutoff from its own clock
+        rows = store.db_session.execute(
+            select(
+                Legislation.id,
+                Legislation.bill_number,
+                Legislation.title,
+                Legislation.bill_status,
+                Legislation.updated_at,
+                Legislation.govt_type
+            )
+            .where(Legislation.updated_at >= func.now() - timedelta(days=days))
+            .order_by(Legislation.updated_at.desc())
+            .limit(limit)
+        ).mappings()
+
+        # Format response
+        activity = [{
+            "id": row["id"],
+            "bill_number": row["bill_number"],
+            "title": row["title"],
+            "status": row["bill_status"] if row["bill_status"] else None,
+            "updated_at": row["updated_at"].isoformat() if row["updated_at"] else None,
+            "govt_type": row["govt_type"] if row["govt_type"] else None
+        } for row in rows]
+
+        return {"recent_legislation": activity, "time_period_days": days}
+    except Exception as e:
+        logger.error(f"Error getting recent activity: {e}", exc_info=True)
+        raise
 
 
 # -----------------------------------------------------------------------------
@@ -1332,29 +1675,25 @@ def advanced_search(
     Raises:
         HTTPException: If search parameters are invalid
     """
-    with error_handler("Advanced search", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Convert filters to dict, excluding None values
-        filters_dict = search_params.filters.dict(exclude_none=True)
-
-        # Execute search
-        result = store.advanced_search(
-            query=search_params.query,
-            filters=filters_dict,
-            sort_by=search_params.sort_by,
-            sort_dir=search_params.sort_dir,
-            limit=search_params.limit,
-            offset=search_params.offset
-        )
+    # Convert filters to dict, excluding None values
+    filters_dict = search_params.filters.model_dump(exclude_none=True)
+
+    # Execute search
+    result = store.advanced_search(
+        query=search_params.query,
+        filters=filters_dict,
+        sort_by=search_params.sort_by,
+        sort_dir=search_params.sort_dir,
+        limit=search_params.limit,
+        offset=search_params.offset
+    )
 
-        return {
-            "count": result["count"], 
-            "items": result["items"],
-            "page_info": result.get("page_info", {}),
-            "facets": result.get("facets", {})
-        }
+    return msgspec_response(LegislationListStruct, {
+        "count": result["count"], 
+        "items": result["items"],
+        "page_info": result.get("page_info", {}),
+        "facets": result.get("facets", {})
+    })
 
 
 # -----------------------------------------------------------------------------
@@ -1383,79 +1722,124 @@ def analyze_legislation_ai(
     Raises:
         HTTPException: If legislation is not found or analysis fails
     """
-    with error_handler("AI analysis", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Validate legislation ID
-        if leg_id <= 0:
-            raise ValidationError("Legislation ID must be a positive integer")
-
-        # Check if db_session is available and retrieve the legislation
-        if store.db_session is None:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE, 
-                detail="Database session is not initialized. Please try again later."
-            )
+    # Validate legislation ID
+    if leg_id <= 0:
+        raise ValidationError("Legislation ID must be a positive integer")
+
+    # Check if db_session is available and retrieve the legislation
+    if store.db_session is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, 
+            detail="Database session is not initialized. Please try again later."
+        )
 
-        # Check if legislation exists
-        leg_obj = store.db_session.query(Legislation).filter_by(id=leg_id).first()
-        if not leg_obj:
+    # Set default options if none provided
+    if options is None:
+        options = AnalysisOptions(deep_analysis=False, texas_focus=True, focus_areas=None, model_name=None)
+
+    # Deferred analysis would report a missing bill only after responding,
+    # so check the id exists first. Synchronous analysis loads the row
+    # itself and raises ValueError (404 below) if it is missing.
+    if options.deep_analysis:
+        if store.db_session.query(Legislation.id).filter_by(id=leg_id).first() is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, 
                 detail=f"Legislation with ID {leg_id} not found"
             )
 
-        # Set default options if none provided
-        if options is None:
-            options = AnalysisOptions(deep_analysis=False, texas_focus=True, focus_areas=None, model_name=None)
+    # Deep analysis goes to the task queue when one is configured, so the
+    # LLM calls run in a worker process instead of this one
+    if options.deep_analysis and HAS_CELERY:
+        result = analyze_bill.delay(leg_id, options.model_dump(exclude_none=True))
+        return {
+            "status": "queued",
+            "message": f"Analysis queued. Check /legislation/{leg_id}/analysis/status/{result.id} for progress.",
+            "legislation_id": leg_id,
+            "task_id": result.id
+        }
 
-        # Create AIAnalysis instance on demand
-        ai_analyzer = AIAnalysis(db_session=store.db_session)
+    # Create AIAnalysis instance on demand
+    ai_analyzer = AIAnalysis(db_session=store.db_session)
 
-        # Asynchronous processing if requested and background_tasks available
-        if options.deep_analysis:
-            async def run_analysis_task():
-                try:
-                    ai_analyzer.analyze_legislation(legislation_id=leg_id)
-                except Exception as e:
-                    logger.error(f"Error in background analysis task for legislation ID={leg_id}: {e}", exc_info=True)
-
-            # Add task to background tasks
-            background_tasks.add_task(run_analysis_task)
-
-            return {
-                "status": "processing", 
-                "message": "Analysis started in the background. Check back later.",
-                "legislation_id": leg_id
-            }
+    # Otherwise fall back to in-process background tasks
+    if options.deep_analysis:
+        # A plain def runs in the threadpool, keeping the blocking LLM calls
+        # off the event loop
+        def run_analysis_task():
+            try:
+                ai_analyzer.analyze_legislation(legislation_id=leg_id)
+                invalidate_tags(f"leg:{leg_id}", "leg:list", "dashboard")
+            except Exception as e:
+                logger.error(f"Error in background analysis task for legislation ID={leg_id}: {e}", exc_info=True)
+            finally:
+                store.release_session()
 
-        # Synchronous processing
-        try:
-            # Set model parameters if needed
-            if hasattr(options, "model_name") and options.model_name:
-                ai_analyzer.model_name = options.get("model_name", "default_model") if isinstance(options, dict) else "default_model"  # type: ignore
-
-            # Run analysis
-            analysis_obj = ai_analyzer.analyze_legislation(legislation_id=leg_id)
-
-            return {
-                "status": "completed",
-                "legislation_id": leg_id,
-                "analysis_id": analysis_obj.id,
-                "analysis_version": analysis_obj.analysis_version,
-                "analysis_date": analysis_obj.analysis_date.isoformat() if analysis_obj.analysis_date else None
-            }
-        except ValueError as ve:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(ve))
-        except Exception as e:
-            logger.error(f"Error analyzing legislation ID={leg_id} with AI: {e}", exc_info=True)
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="AI analysis failed.")
+        # Add task to background tasks
+        background_tasks.add_task(run_analysis_task)
+
+        return {
+            "status": "processing", 
+            "message": "Analysis started in the background. Check back later.",
+            "legislation_id": leg_id
+        }
+
+    # Synchronous processing
+    try:
+        # Set model parameters if needed
+        if hasattr(options, "model_name") and options.model_name:
+            ai_analyzer.model_name = options.get("model_name", "default_model") if isinstance(options, dict) else "default_model"  # type: ignore
+
+        # Run analysis
+        analysis_obj = ai_analyzer.analyze_legislation(legislation_id=leg_id)
+        invalidate_tags(f"leg:{leg_id}", "leg:list", "dashboard")
+
+        return {
+            "status": "completed",
+            "legislation_id": leg_id,
+            "analysis_id": analysis_obj.id,
+            "analysis_version": analysis_obj.analysis_version,
+            "analysis_date": analysis_obj.analysis_date.isoformat() if analysis_obj.analysis_date else None
+        }
+    except AIAnalysisError:
+        # Mapped to a status by ai_analysis_exception_handler
+        raise
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(ve))
+    except Exception as e:
+        logger.error(f"Error analyzing legislation ID={leg_id} with AI: {e}", exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="AI analysis failed.")
+
+
+@app.get("/tasks/{task_id}/status", tags=["Analysis"], response_model=TaskStatusResponse)
+@app.get("/legislation/{leg_id}/analysis/status/{task_id}", tags=["Analysis"], response_model=TaskStatusResponse)
+@log_api_call
+def get_task_status(task_id: str, leg_id: Optional[int] = None):
+    """
+    Return the state of a queued analysis task.
+
+    Args:
+        task_id: Task queue ID returned when the analysis was queued
+        leg_id: Legislation ID, when called through the per-legislation route
+
+    Returns:
+        Task ID and its current state
+
+    Raises:
+        HTTPException: If no task queue is configured
+    """
+    state = get_task_state(task_id)
+    if state is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Task queue is not configured"
+        )
+    return {"task_id": task_id, "state": state}
 
 
 @app.get("/legislation/{leg_id}/analysis/history", tags=["Analysis"], response_model=AnalysisHistoryResponse)
 @log_api_call
+@http_cache(max_age=300)
+@cached_response("leg:{leg_id}:history", ttl_seconds=3600)
 def get_legislation_analysis_history(
     leg_id: int,
     store: DataStore = Depends(get_data_store)
@@ -1474,43 +1858,53 @@ def get_legislation_analysis_history(
     Raises:
         HTTPException: If legislation is not found or analysis history cannot be retrieved
     """
-    with error_handler("Get analysis history", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Validate legislation ID
-        if leg_id <= 0:
-            raise ValidationError("Legislation ID must be a positive integer")
-
-        # Check if legislation exists
-        leg = store.db_session.query(Legislation).filter_by(id=leg_id).first() if store.db_session else None
-        if not leg:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Legislation with ID {leg_id} not found"
-            )
+    # Validate legislation ID
+    if leg_id <= 0:
+        raise ValidationError("Legislation ID must be a positive integer")
+
+    if store.db_session is None:
+        raise DatabaseOperationError("No database session available")
+
+    # One query for both the existence check and the history: the outer
+    # join yields a single all-NULL analysis row for a bill without
+    # analyses, and no rows at all for an unknown bill
+    rows = store.db_session.execute(
+        select(
+            LegislationAnalysis.id,
+            LegislationAnalysis.analysis_version,
+            LegislationAnalysis.analysis_date,
+            LegislationAnalysis.summary,
+            LegislationAnalysis.impact_category,
+            LegislationAnalysis.impact,
+            LegislationAnalysis.model_version
+        )
+        .select_from(Legislation)
+        .outerjoin(LegislationAnalysis, LegislationAnalysis.legislation_id == Legislation.id)
+        .where(Legislation.id == leg_id)
+        .order_by(LegislationAnalysis.analysis_version)
+    ).all()
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Legislation with ID {leg_id} not found"
+        )
 
-        # Get and format analyses
-        analyses = []
-        sorted_analyses = sorted(leg.analyses, key=lambda a: a.analysis_version)
-
-        for analysis in sorted_analyses:
-            analyses.append({
-                "id": analysis.id,
-                "version": analysis.analysis_version,
-                "date": analysis.analysis_date.isoformat() if analysis.analysis_date else None,
-                "summary": analysis.summary,
-                "impact_category": analysis.impact_category.value if analysis.impact_category else None,
-                "impact_level": analysis.impact.value if hasattr(analysis, 'impact') and analysis.impact else None,
-                "model_version": analysis.model_version
-            })
+    # Format analyses
+    analyses = [{
+        "id": row.id,
+        "version": row.analysis_version,
+        "date": row.analysis_date.isoformat() if row.analysis_date else None,
+        "summary": row.summary,
+        "impact_category": row.impact_category.value if row.impact_category else None,
+        "impact_level": row.impact.value if row.impact else None,
+        "model_version": row.model_version
+    } for row in rows if row.id is not None]
 
-        return {
-            "legislation_id": leg_id,
-            "analysis_count": len(analyses),
-            "analyses": analyses
-        }
+    return msgspec_response(AnalysisHistoryStruct, {
+        "legislation_id": leg_id,
+        "analysis_count": len(analyses),
+        "analyses": analyses
+    })
 
 
 # -----------------------------------------------------------------------------
@@ -1537,57 +1931,49 @@ def update_priority(
     Raises:
         HTTPException: If legislation is not found or priority cannot be updated
     """
-    with error_handler("Update priority", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Validate legislation ID
-        if leg_id <= 0:
-            raise ValidationError("Legislation ID must be a positive integer")
+    # Validate legislation ID
+    if leg_id <= 0:
+        raise ValidationError("Legislation ID must be a positive integer")
 
+    try:
+        # Check if LegislationPriority model is available
         try:
-            # Check if legislation exists
-            leg = store.db_session.query(Legislation).filter_by(id=leg_id).first() if store.db_session else None
-            if not leg:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Legislation with ID {leg_id} not found"
-                )
-
-            # Check if LegislationPriority model is available
-            try:
-                from models import LegislationPriority
-                has_priority_model = True
-            except ImportError:
-                has_priority_model = False
-                raise HTTPException(
-                    status_code=status.HTTP_501_NOT_IMPLEMENTED,
-                    detail="Priority updates not supported: LegislationPriority model not available"
-                )
-
-            # Use the DataStore method to update priority
-            update_data = payload.model_dump(exclude_unset=True)
-            updated_priority = store.update_legislation_priority(leg_id, update_data)
-
-            if not updated_priority:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to update priority"
-                )
-
-            return {
-                "status": "success",
-                "message": f"Priority updated for legislation ID {leg_id}",
-                "priority": updated_priority
-            }
+            from models import LegislationPriority
+            has_priority_model = True
+        except ImportError:
+            has_priority_model = False
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Priority updates not supported: LegislationPriority model not available"
+            )
 
-        except HTTPException:
-            # Re-raise HTTP exceptions
-            raise
-        except Exception as e:
-            logger.error(f"Error updating priority for legislation {leg_id}: {e}", exc_info=True)
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+        # Use the DataStore method to update priority
+        update_data = payload.model_dump(exclude_unset=True)
+        updated_priority = store.update_legislation_priority(leg_id, update_data)
+
+        if not updated_priority:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to update priority"
+            )
+
+        invalidate_tags(f"leg:{leg_id}", "leg:list", "dashboard")
+
+        return {
+            "status": "success",
+            "message": f"Priority updated for legislation ID {leg_id}",
+            "priority": updated_priority
+        }
+
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+    except NotFoundError as e:
+        # Raised by the store's own lookup, so no separate existence query
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error updating priority for legislation {leg_id}: {e}", exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
 # -----------------------------------------------------------------------------
@@ -1595,6 +1981,8 @@ def update_priority(
 # -----------------------------------------------------------------------------
 @app.get("/sync/status", tags=["Sync"], response_model=SyncStatusResponse)
 @log_api_call
+@http_cache(max_age=60, stale_while_revalidate=30)
+@cached_response("sync", ttl_seconds=60)
 def get_sync_status(
     store: DataStore = Depends(get_data_store)
 ):
@@ -1610,22 +1998,17 @@ def get_sync_status(
     Raises:
         HTTPException: If sync history cannot be retrieved
     """
-    with error_handler("Get sync status", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        try:
-            # Get sync history from data store
-            sync_history = store.get_sync_history(limit=10)
+    try:
+        # Get sync history from data store
+        sync_history = store.get_sync_history(limit=10)
 
-            return {
-                "sync_history": sync_history,
-                "count": len(sync_history)
-            }
-        except Exception as e:
-            logger.error(f"Error retrieving sync history: {e}", exc_info=True)
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+        return {
+            "sync_history": sync_history,
+            "count": len(sync_history)
+        }
+    except Exception as e:
+        logger.error(f"Error retrieving sync history: {e}", exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
 # -----------------------------------------------------------------------------
@@ -1654,40 +2037,39 @@ def trigger_sync(
     Raises:
         HTTPException: If sync fails or API is unavailable
     """
-    with error_handler("Trigger sync", {
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        if background:
-            # Run sync in background
-            async def run_sync_task():
-                try:
-                    api.run_sync(sync_type="manual")
-                except Exception as e:
-                    logger.error(f"Error in background sync task: {e}", exc_info=True)
-
-            # Add task to background tasks
-            background_tasks.add_task(run_sync_task)
-
-            return {
-                "status": "processing",
-                "message": "Sync operation started in the background"
-            }
-        else:
-            # Run sync synchronously
-            result = api.run_sync(sync_type="manual")
-
-            return {
-                "status": "success",
-                "message": "Sync operation completed successfully",
-                "details": {
-                    "new_bills": result["new_bills"],
-                    "bills_updated": result["bills_updated"],
-                    "error_count": len(result["errors"]),
-                    "start_time": result["start_time"].isoformat() if result["start_time"] else None,
-                    "end_time": result["end_time"].isoformat() if result["end_time"] else None
-                }
+    if background:
+        # Run sync in background
+        async def run_sync_task():
+            try:
+                api.run_sync(sync_type="manual")
+                invalidate_tags("leg", "dashboard", "sync")
+            except Exception as e:
+                logger.error(f"Error in background sync task: {e}", exc_info=True)
+
+        # Add task to background tasks
+        background_tasks.add_task(run_sync_task)
+
+        return {
+            "status": "processing",
+            "message": "Sync operation started in the background"
+        }
+    else:
+        # Run sync synchronously
+        result = api.run_sync(sync_type="manual")
+        # A sync can rewrite any legislation row
+        invalidate_tags("leg", "dashboard", "sync")
+
+        return {
+            "status": "success",
+            "message": "Sync operation completed successfully",
+            "details": {
+                "new_bills": result["new_bills"],
+                "bills_updated": result["bills_updated"],
+                "error_count": len(result["errors"]),
+                "start_time": result["start_time"].isoformat() if result["start_time"] else None,
+                "end_time": result["end_time"].isoformat() if result["end_time"] else None
             }
+        }
 
 
 @app.get("/")
@@ -1708,7 +2090,7 @@ async def get_bills(
     """
     try:
         bills = store.get_bills(state=state, keyword=keyword, limit=limit, offset=offset)
-        return bills
+        return msgspec_response(List[BillSummaryStruct], bills)
     except Exception as e:
         logger.error(f"Error retrieving bills: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error retrieving bills: {str(e)}")
@@ -1722,7 +2104,7 @@ async def get_bill(bill_id: int):
         bill = bill_store.get_bill(bill_id)
         if not bill:
             raise HTTPException(status_code=404, detail=f"Bill with ID {bill_id} not found")
-        return bill
+        return msgspec_response(BillDetailStruct, bill)
     except HTTPException:
         raise
     except Exception as e:
@@ -1802,7 +2184,8 @@ async def refresh_data(state: Optional[str] = None):
 async def analyze_legislation_ai_async(
     leg_id: int,
     options: Optional[AnalysisOptions] = None,
-    store: DataStore = Depends(get_data_store)
+    store: DataStore = Depends(get_data_store),
+    session: Optional[AsyncSession] = Depends(get_async_session)
 ):
     """
     Trigger an asynchronous AI-based structured analysis for the specified Legislation ID.
@@ -1811,58 +2194,62 @@ async def analyze_legislation_ai_async(
         leg_id: Legislation ID to analyze
         options: Optional analysis parameters
         store: DataStore = Depends(get_data_store)
+        session: AsyncSession for the existence check, if async access is available
 
     Returns:
         Analysis status and results
     """
-    with error_handler("Async AI analysis", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        # Validate legislation ID
-        if leg_id <= 0:
-            raise ValidationError("Legislation ID must be a positive integer")
-
-        # Query the legislation object
-        leg_obj = store.db_session.query(Legislation).filter_by(id=leg_id).first() if store.db_session else None
-        if not leg_obj:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, 
-                detail=f"Legislation with ID {leg_id} not found"
-            )
+    # Validate legislation ID
+    if leg_id <= 0:
+        raise ValidationError("Legislation ID must be a positive integer")
+
+    # Check the legislation exists without blocking the event loop
+    if session is not None:
+        result = await session.execute(select(Legislation.id).where(Legislation.id == leg_id))
+        exists = result.scalar_one_or_none() is not None
+    else:
+        exists = await run_in_threadpool(_call_store, store.legislation_exists, leg_id)
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, 
+            detail=f"Legislation with ID {leg_id} not found"
+        )
 
-        # Set default options if none provided
-        if options is None:
-            options = AnalysisOptions(
-                deep_analysis=False,
-                texas_focus=True,
-                focus_areas=None,
-                model_name=None
-            )
+    # Set default options if none provided
+    if options is None:
+        options = AnalysisOptions(
+            deep_analysis=False,
+            texas_focus=True,
+            focus_areas=None,
+            model_name=None
+        )
 
-        # Create AIAnalysis instance on demand
-        ai_analyzer = AIAnalysis(db_session=store.db_session)
+    # Create AIAnalysis instance on demand
+    ai_analyzer = AIAnalysis(db_session=store.db_session)
 
-        try:
-            if hasattr(options, "model_name") and options.model_name:
-                ai_analyzer.model_name = options.get("model_name", "default_model") if isinstance(options, dict) else "default_model"  # type: ignore
-
-            # Run analysis asynchronously
-            analysis_obj = await ai_analyzer.analyze_legislation_async(legislation_id=leg_id)
-
-            return {
-                "status": "completed",
-                "legislation_id": leg_id,
-                "analysis_id": analysis_obj.id,
-                "analysis_version": analysis_obj.analysis_version,
-                "analysis_date": analysis_obj.analysis_date.isoformat() if analysis_obj.analysis_date else None
-            }
-        except ValueError as ve:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(ve))
-        except Exception as e:
-            logger.error(f"Error analyzing legislation ID={leg_id} with AI: {e}", exc_info=True)
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Async AI analysis failed.")
+    try:
+        if hasattr(options, "model_name") and options.model_name:
+            ai_analyzer.model_name = options.get("model_name", "default_model") if isinstance(options, dict) else "default_model"  # type: ignore
+
+        # Run analysis asynchronously
+        analysis_obj = await ai_analyzer.analyze_legislation_async(legislation_id=leg_id)
+        await run_in_threadpool(invalidate_tags, f"leg:{leg_id}", "leg:list", "dashboard")
+
+        return {
+            "status": "completed",
+            "legislation_id": leg_id,
+            "analysis_id": analysis_obj.id,
+            "analysis_version": analysis_obj.analysis_version,
+            "analysis_date": analysis_obj.analysis_date.isoformat() if analysis_obj.analysis_date else None
+        }
+    except AIAnalysisError:
+        # Mapped to a status by ai_analysis_exception_handler
+        raise
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(ve))
+    except Exception as e:
+        logger.error(f"Error analyzing legislation ID={leg_id} with AI: {e}", exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Async AI analysis failed.")
 
 @app.post("/legislation/batch-analyze", tags=["Analysis"], response_model=dict)
 @log_api_call
@@ -1882,27 +2269,29 @@ async def batch_analyze_legislation(
     Returns:
         Results of batch analysis
     """
-    with error_handler("Batch analyze legislation", {
-        ValidationError: status.HTTP_400_BAD_REQUEST,
-        DatabaseOperationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        Exception: status.HTTP_500_INTERNAL_SERVER_ERROR
-    }):
-        if not legislation_ids:
-            raise ValidationError("No legislation IDs provided")
+    if not legislation_ids:
+        raise ValidationError("No legislation IDs provided")
 
-        if len(legislation_ids) > 50:  # Set a reasonable limit
-            raise ValidationError("Too many legislation IDs (maximum 50)")
+    if len(legislation_ids) > 50:  # Set a reasonable limit
+        raise ValidationError("Too many legislation IDs (maximum 50)")
 
-        # Create AIAnalysis instance on demand
-        ai_analyzer = AIAnalysis(db_session=store.db_session)
+    # Create AIAnalysis instance on demand
+    ai_analyzer = AIAnalysis(db_session=store.db_session)
 
-        # Run batch analysis
-        try:
-            results = await ai_analyzer.batch_analyze_async(legislation_ids, max_concurrent)
-            return results
-        except Exception as e:
-            logger.error(f"Error in batch analysis: {e}", exc_info=True)
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Batch analysis failed: {str(e)}"
-            )
\ No newline at end of file
+    # Run batch analysis
+    try:
+        results = await ai_analyzer.batch_analyze_async(legislation_ids, max_concurrent)
+        analyzed = [f"leg:{leg_id}" for leg_id, item in results["analyses"].items()
+                    if item["status"] == "success"]
+        if analyzed:
+            await run_in_threadpool(invalidate_tags, *analyzed, "leg:list", "dashboard")
+        return results
+    except AIAnalysisError:
+        # Mapped to a status by ai_analysis_exception_handler
+        raise
+    except Exception as e:
+        logger.error(f"Error in batch analysis: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch analysis failed: {str(e)}"
+        )
\ No newline at end of file
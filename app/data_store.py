@@ -21,15 +21,16 @@ Usage Example:
         result = ds.list_legislation(limit=50, offset=0)
 """
 
+import asyncio
 import logging
 import time
 import re
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, TypedDict, Callable, TypeVar, cast, Union, Set
 
-from sqlalchemy.exc import OperationalError, SQLAlchemyError, IntegrityError
-from sqlalchemy import or_, and_, text, func, desc, asc
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.exc import DBAPIError, OperationalError, SQLAlchemyError, IntegrityError
+from sqlalchemy import or_, and_, text, func, desc, asc, select
+from sqlalchemy.orm import Session, joinedload, scoped_session, selectinload
 
 # Import models and DB initialization function
 from app.models import (
@@ -61,9 +62,25 @@ try:
 except ImportError:
     HAS_IMPACT_MODELS = False
 
+try:
+    import asyncpg
+    HAS_ASYNCPG = True
+except ImportError:
+    HAS_ASYNCPG = False
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Errors from the async driver (connecting or running a query) that callers
+# of fetch_legislation_details() handle by falling back to the sync DataStore
+ASYNC_DB_ERRORS: tuple = (DBAPIError, OSError)
+if HAS_ASYNCPG:
+    ASYNC_DB_ERRORS += (asyncpg.PostgresError, asyncpg.InterfaceError)
+
+# Words usable in a to_tsquery() expression; operators and punctuation in
+# user input are dropped rather than passed through
+_SEARCH_WORD_RE = re.compile(r"\w+")
+
 # -----------------------------------------------------------------------------
 # TypedDicts for better return type documentation
 # -----------------------------------------------------------------------------
@@ -115,6 +132,10 @@ class DatabaseOperationError(DataStoreError):
     """Raised when a database operation fails."""
     pass
 
+class NotFoundError(ValidationError):
+    """Raised when a referenced record does not exist."""
+    pass
+
 # Type variable for decorators
 F = TypeVar('F', bound=Callable[..., Any])
 
@@ -166,6 +187,133 @@ def validate_inputs(validation_func: Callable) -> Callable[[F], F]:
     return decorator
 
 
+def _legislation_details_dict(leg: Legislation,
+                              latest_text: Optional[LegislationText],
+                              latest_analysis: Optional[LegislationAnalysis]) -> Dict[str, Any]:
+    """
+    Build the detail record for a legislation row.
+
+    The sponsor, priority and impact relationships of leg must already be
+    loaded when it comes from an async session.
+
+    Args:
+        leg: The legislation row
+        latest_text: Its most recent text version, if any
+        latest_analysis: Its most recent analysis, if any
+
+    Returns:
+        Detailed record as returned by DataStore.get_legislation_details()
+    """
+    # Build the base details dictionary
+    details = {
+        "id": leg.id,
+        "external_id": leg.external_id,
+        "govt_type": leg.govt_type.value if leg.govt_type else None,
+        "govt_source": leg.govt_source,
+        "bill_number": leg.bill_number,
+        "title": leg.title,
+        "description": leg.description,
+        "bill_status": leg.bill_status.value if leg.bill_status else None,
+        "bill_introduced_date": leg.bill_introduced_date.isoformat() if leg.bill_introduced_date else None,
+        "bill_last_action_date": leg.bill_last_action_date.isoformat() if leg.bill_last_action_date else None,
+        "bill_status_date": leg.bill_status_date.isoformat() if leg.bill_status_date else None,
+        "last_api_check": leg.last_api_check.isoformat() if leg.last_api_check else None,
+        "created_at": leg.created_at.isoformat() if leg.created_at else None,
+        "updated_at": leg.updated_at.isoformat() if leg.updated_at else None,
+        "url": leg.url,
+        "state_link": leg.state_link,
+        "sponsors": [
+            {
+                "name": sponsor.sponsor_name,
+                "party": sponsor.sponsor_party,
+                "state": sponsor.sponsor_state,
+                "type": sponsor.sponsor_type
+            }
+            for sponsor in leg.sponsors
+        ],
+        "latest_text": None,
+        "analysis": None
+    }
+
+    # Add latest text if available
+    if latest_text:
+        # Check if text content is binary (store metadata about type if available)
+        is_binary = False
+        if hasattr(latest_text, 'text_metadata') and latest_text.text_metadata:
+            is_binary = latest_text.text_metadata.get('is_binary', False)
+
+        details["latest_text"] = {
+            "id": latest_text.id,
+            "text_type": latest_text.text_type,
+            "text_date": latest_text.text_date.isoformat() if latest_text.text_date else None,
+            "text_content": None if is_binary else latest_text.text_content,
+            "is_binary": is_binary,
+            "version_num": latest_text.version_num,
+            "text_hash": latest_text.text_hash
+        }
+
+    # Add analysis if available
+    if latest_analysis:
+        details["analysis"] = {
+            "id": latest_analysis.id,
+            "analysis_version": latest_analysis.analysis_version,
+            "summary": latest_analysis.summary,
+            "key_points": latest_analysis.key_points,
+            "created_at": latest_analysis.created_at.isoformat() if latest_analysis.created_at else None,
+            "analysis_date": latest_analysis.analysis_date.isoformat() if latest_analysis.analysis_date else None,
+            "public_health_impacts": latest_analysis.public_health_impacts,
+            "local_gov_impacts": latest_analysis.local_gov_impacts,
+            "economic_impacts": latest_analysis.economic_impacts,
+            "impact_category": latest_analysis.impact_category.value if latest_analysis.impact_category else None,
+            "impact_level": (latest_analysis.impact.value 
+                             if hasattr(latest_analysis, 'impact') and latest_analysis.impact else None),
+        }
+
+    # Add priority data if available
+    if HAS_PRIORITY_MODEL and hasattr(leg, 'priority') and leg.priority:
+        details["priority"] = {
+            "public_health_relevance": leg.priority.public_health_relevance,
+            "local_govt_relevance": leg.priority.local_govt_relevance,
+            "overall_priority": leg.priority.overall_priority,
+            "manually_reviewed": leg.priority.manually_reviewed,
+            "reviewer_notes": leg.priority.reviewer_notes,
+            "review_date": leg.priority.review_date.isoformat() if leg.priority.review_date else None
+        }
+
+    # Add impact ratings if available
+    if HAS_IMPACT_MODELS and hasattr(leg, 'impact_ratings') and leg.impact_ratings:
+        details["impact_ratings"] = [
+            {
+                "id": rating.id,
+                "category": rating.impact_category.value if rating.impact_category else None,
+                "level": rating.impact_level.value if rating.impact_level else None,
+                "description": rating.impact_description,
+                "confidence": rating.confidence_score,
+                "is_ai_generated": rating.is_ai_generated,
+                "reviewed_by": rating.reviewed_by,
+                "review_date": rating.review_date.isoformat() if rating.review_date else None
+            }
+            for rating in leg.impact_ratings
+        ]
+
+    # Add implementation requirements if available
+    if HAS_IMPACT_MODELS and hasattr(leg, 'implementation_requirements') and leg.implementation_requirements:
+        details["implementation_requirements"] = [
+            {
+                "id": req.id,
+                "requirement_type": req.requirement_type,
+                "description": req.description,
+                "estimated_cost": req.estimated_cost,
+                "funding_provided": req.funding_provided,
+                "implementation_deadline": req.implementation_deadline.isoformat() if req.implementation_deadline else None,
+                "entity_responsible": req.entity_responsible
+            }
+            for req in leg.implementation_requirements
+        ]
+
+    return details
+
+
 class DataStore:
     """
     DataStore centralizes database operations for the legislative tracking system,
@@ -174,6 +322,10 @@ class DataStore:
 
     The class provides robust handling of database connections, transactions, and
     error recovery to ensure data integrity even in failure scenarios.
+
+    db_session is a thread-local scoped_session, so API endpoints running on
+    different threadpool threads never share a Session. Call release_session()
+    on the same thread when a request is done with it.
     """
 
     def __init__(self, max_retries: int = 3) -> None:
@@ -190,7 +342,7 @@ class DataStore:
             raise ValidationError("max_retries must be a positive integer")
 
         self.max_retries = max_retries
-        self.db_session: Optional[Session] = None
+        self.db_session: Optional[scoped_session] = None
         self._init_db_connection()
 
         # Cache for frequently accessed data
@@ -217,7 +369,7 @@ class DataStore:
         while attempt < self.max_retries:
             try:
                 session_factory = init_db(max_retries=1)  # init_db may have its own retry logic
-                self.db_session = session_factory()
+                self.db_session = scoped_session(session_factory)
                 # Verify connection works by executing a simple query
                 self.db_session.execute(text("SELECT 1"))
                 logger.info("Database session established successfully.")
@@ -291,13 +443,21 @@ class DataStore:
 
         return self.db_session.begin()  # SQLAlchemy's built-in transactional context
 
+    def release_session(self) -> None:
+        """
+        Close the calling thread's session, returning its connection to the pool.
+        The thread gets a fresh session on its next database call.
+        """
+        if self.db_session is not None:
+            self.db_session.remove()
+
     def close(self) -> None:
         """
         Close the database session to free resources.
         """
         if self.db_session:
             try:
-                self.db_session.close()
+                self.db_session.remove()
                 self.db_session = None
                 logger.info("Database session closed.")
             except Exception as e:
@@ -559,7 +719,12 @@ class DataStore:
             ValidationError: If email format is invalid
         """
         try:
-            user = self.db_session.query(User).filter_by(email=email).first() if self.db_session else None
+            user = (
+                self.db_session.query(User)
+                .options(joinedload(User.preferences))
+                .filter_by(email=email)
+                .first()
+            ) if self.db_session else None
             if user and user.preferences:
                 prefs = {"keywords": user.preferences.keywords or []}
                 for field in ['health_focus', 'local_govt_focus', 'regions']:
@@ -771,6 +936,27 @@ class DataStore:
             logger.error(error_msg, exc_info=True)
             return {"total_count": 0, "items": [], "page_info": {"current_page": 1, "total_pages": 0}}
 
+    @ensure_connection
+    def legislation_exists(self, legislation_id: int) -> bool:
+        """
+        Check whether a legislation record exists, without loading it.
+
+        Args:
+            legislation_id: The ID of the legislation.
+
+        Returns:
+            True if the record exists
+
+        Raises:
+            DatabaseOperationError: On database errors
+        """
+        try:
+            return self.db_session.query(Legislation.id).filter_by(id=legislation_id).first() is not None
+        except SQLAlchemyError as e:
+            error_msg = f"Database error checking legislation {legislation_id}: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise DatabaseOperationError(error_msg)
+
     @ensure_connection
     def get_legislation_details(self, legislation_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -816,114 +1002,7 @@ class DataStore:
             latest_text = leg.latest_text
             latest_analysis = leg.latest_analysis
 
-            # Build the base details dictionary
-            details = {
-                "id": leg.id,
-                "external_id": leg.external_id,
-                "govt_type": leg.govt_type.value if leg.govt_type else None,
-                "govt_source": leg.govt_source,
-                "bill_number": leg.bill_number,
-                "title": leg.title,
-                "description": leg.description,
-                "bill_status": leg.bill_status.value if leg.bill_status else None,
-                "bill_introduced_date": leg.bill_introduced_date.isoformat() if leg.bill_introduced_date else None,
-                "bill_last_action_date": leg.bill_last_action_date.isoformat() if leg.bill_last_action_date else None,
-                "bill_status_date": leg.bill_status_date.isoformat() if leg.bill_status_date else None,
-                "last_api_check": leg.last_api_check.isoformat() if leg.last_api_check else None,
-                "created_at": leg.created_at.isoformat() if leg.created_at else None,
-                "updated_at": leg.updated_at.isoformat() if leg.updated_at else None,
-                "url": leg.url,
-                "state_link": leg.state_link,
-                "sponsors": [
-                    {
-                        "name": sponsor.sponsor_name,
-                        "party": sponsor.sponsor_party,
-                        "state": sponsor.sponsor_state,
-                        "type": sponsor.sponsor_type
-                    }
-                    for sponsor in leg.sponsors
-                ],
-                "latest_text": None,
-                "analysis": None
-            }
-
-            # Add latest text if available
-            if latest_text:
-                # Check if text content is binary (store metadata about type if available)
-                is_binary = False
-                if hasattr(latest_text, 'text_metadata') and latest_text.text_metadata:
-                    is_binary = latest_text.text_metadata.get('is_binary', False)
-
-                details["latest_text"] = {
-                    "id": latest_text.id,
-                    "text_type": latest_text.text_type,
-                    "text_date": latest_text.text_date.isoformat() if latest_text.text_date else None,
-                    "text_content": None if is_binary else latest_text.text_content,
-                    "is_binary": is_binary,
-                    "version_num": latest_text.version_num,
-                    "text_hash": latest_text.text_hash
-                }
-
-            # Add analysis if available
-            if latest_analysis:
-                details["analysis"] = {
-                    "id": latest_analysis.id,
-                    "analysis_version": latest_analysis.analysis_version,
-                    "summary": latest_analysis.summary,
-                    "key_points": latest_analysis.key_points,
-                    "created_at": latest_analysis.created_at.isoformat() if latest_analysis.created_at else None,
-                    "analysis_date": latest_analysis.analysis_date.isoformat() if latest_analysis.analysis_date else None,
-                    "public_health_impacts": latest_analysis.public_health_impacts,
-                    "local_gov_impacts": latest_analysis.local_gov_impacts,
-                    "economic_impacts": latest_analysis.economic_impacts,
-                    "impact_category": latest_analysis.impact_category.value if latest_analysis.impact_category else None,
-                    "impact_level": (latest_analysis.impact.value 
-                                     if hasattr(latest_analysis, 'impact') and latest_analysis.impact else None),
-                }
-
-            # Add priority data if available
-            if HAS_PRIORITY_MODEL and hasattr(leg, 'priority') and leg.priority:
-                details["priority"] = {
-                    "public_health_relevance": leg.priority.public_health_relevance,
-                    "local_govt_relevance": leg.priority.local_govt_relevance,
-                    "overall_priority": leg.priority.overall_priority,
-                    "manually_reviewed": leg.priority.manually_reviewed,
-                    "reviewer_notes": leg.priority.reviewer_notes,
-                    "review_date": leg.priority.review_date.isoformat() if leg.priority.review_date else None
-                }
-
-            # Add impact ratings if available
-            if HAS_IMPACT_MODELS and hasattr(leg, 'impact_ratings') and leg.impact_ratings:
-                details["impact_ratings"] = [
-                    {
-                        "id": rating.id,
-                        "category": rating.impact_category.value if rating.impact_category else None,
-                        "level": rating.impact_level.value if rating.impact_level else None,
-                        "description": rating.impact_description,
-                        "confidence": rating.confidence_score,
-                        "is_ai_generated": rating.is_ai_generated,
-                        "reviewed_by": rating.reviewed_by,
-                        "review_date": rating.review_date.isoformat() if rating.review_date else None
-                    }
-                    for rating in leg.impact_ratings
-                ]
-
-            # Add implementation requirements if available
-            if HAS_IMPACT_MODELS and hasattr(leg, 'implementation_requirements') and leg.implementation_requirements:
-                details["implementation_requirements"] = [
-                    {
-                        "id": req.id,
-                        "requirement_type": req.requirement_type,
-                        "description": req.description,
-                        "estimated_cost": req.estimated_cost,
-                        "funding_provided": req.funding_provided,
-                        "implementation_deadline": req.implementation_deadline.isoformat() if req.implementation_deadline else None,
-                        "entity_responsible": req.entity_responsible
-                    }
-                    for req in leg.implementation_requirements
-                ]
-
-            return details
+            return _legislation_details_dict(leg, latest_text, latest_analysis)
 
         except SQLAlchemyError as e:
             error_msg = f"Database error loading details for legislation {legislation_id}: {e}"
@@ -1169,12 +1248,14 @@ class DataStore:
             # Apply pagination
             query = query.limit(limit).offset(offset)
 
-            # Eager load related models for efficiency
-            query = query.options(
-                joinedload(Legislation.analyses),
-                joinedload(Legislation.texts),
-                joinedload(Legislation.priority) if HAS_PRIORITY_MODEL else None
-            )
+            # Eager load related models for efficiency. Analyses are
+            # collections, so selectinload fetches them in one extra IN query
+            # instead of multiplying the LIMITed rows in a JOIN. Texts are not
+            # used below and are not loaded.
+            eager_options = [selectinload(Legislation.analyses)]
+            if HAS_PRIORITY_MODEL:
+                eager_options.append(joinedload(Legislation.priority))
+            query = query.options(*eager_options)
 
             # Execute query
             results = query.all()
@@ -1496,22 +1577,10 @@ class DataStore:
                 logger.error("Database session is not initialized or database query is None")
                 raise DatabaseOperationError("No valid database session or query could be initiated")
 
-            # Rest of the method utilizing `query_obj` safely
-            if query:
-                if hasattr(Legislation, 'search_vector'):
-                    # Use PostgreSQL full-text search if available
-                    search_terms = ' & '.join(query.split())
-                    query_obj = query_obj.filter(Legislation.search_vector.match(search_terms))
-                else:
-                    # Fallback to ILIKE search for each term
-                    for term in query.split():
-                        pattern = f"%{term}%"
-                        query_obj = query_obj.filter(
-                            or_(
-                                func.lower(Legislation.title).like(func.lower(pattern)),
-                                func.lower(Legislation.description).like(func.lower(pattern))
-                            )
-                        )
+            # Free-text query and keywords both go through the GIN-indexed
+            # search_vector (title weighted A, description B)
+            search_words = _SEARCH_WORD_RE.findall(query) if query else []
+
             # Handle keywords filter specifically (for compatibility with search_legislation)
             if 'keywords' in filters and filters['keywords']:
                 keywords = filters['keywords']
@@ -1521,13 +1590,27 @@ class DataStore:
                     raise ValidationError(f"Keywords must be a string or list, got {type(keywords).__name__}")
 
                 for keyword in keywords:
-                    pattern = f"%{keyword}%"
-                    query_obj = query_obj.filter(
-                        or_(
-                            func.lower(Legislation.title).like(func.lower(pattern)),
-                            func.lower(Legislation.description).like(func.lower(pattern))
+                    search_words.extend(_SEARCH_WORD_RE.findall(keyword))
+
+            ts_query = None
+            if search_words:
+                # Every word must match, as a prefix so "health" still finds
+                # "healthcare"
+                ts_query = func.to_tsquery('english', ' & '.join(f"{w}:*" for w in search_words))
+                if self.db_session.scalar(select(func.numnode(ts_query))):
+                    query_obj = query_obj.filter(Legislation.search_vector.op('@@')(ts_query))
+                else:
+                    # Only stop words (e.g. "the", "of"): the tsquery is
+                    # empty and would match nothing, so fall back to ILIKE
+                    ts_query = None
+                    for word in search_words:
+                        pattern = f"%{word}%"
+                        query_obj = query_obj.filter(
+                            or_(
+                                func.lower(Legislation.title).like(func.lower(pattern)),
+                                func.lower(Legislation.description).like(func.lower(pattern))
+                            )
                         )
-                    )
 
             # Apply bill status filters
             if 'bill_status' in filters and filters['bill_status']:
@@ -1655,8 +1738,11 @@ class DataStore:
                         Legislation.id == LegislationPriority.legislation_id
                     )
                 sort_field = LegislationPriority.overall_priority
+            elif sort_by == "relevance" and ts_query is not None:
+                # Rank full-text matches by weighted term density
+                sort_field = func.ts_rank_cd(Legislation.search_vector, ts_query)
             else:
-                # Default sort by ID if sort_by is "relevance" or unknown
+                # Default sort by ID if sort_by is "relevance" without a query, or unknown
                 sort_field = Legislation.id
 
             # Apply sort direction
@@ -1676,9 +1762,9 @@ class DataStore:
             query_obj = query_obj.limit(limit).offset(offset)
 
             # Execute query
-            results = query_obj.options(
-                joinedload(Legislation.priority) if HAS_PRIORITY_MODEL else None
-            ).all()
+            if HAS_PRIORITY_MODEL:
+                query_obj = query_obj.options(joinedload(Legislation.priority))
+            results = query_obj.all()
 
             # Format the results
             items = []
@@ -1857,6 +1943,7 @@ class DataStore:
             Updated priority data or None if not updated
 
         Raises:
+            NotFoundError: If the legislation does not exist
             ValidationError: If inputs are invalid
             DatabaseOperationError: On database errors
         """
@@ -1875,7 +1962,7 @@ class DataStore:
             legislation = self.db_session.query(Legislation).filter_by(id=legislation_id).first()
             if not legislation:
                 logger.warning(f"Legislation with ID {legislation_id} not found")
-                raise ValidationError(f"Legislation with ID {legislation_id} not found")
+                raise NotFoundError(f"Legislation with ID {legislation_id} not found")
 
             # Create transaction for update
             with self.transaction():
@@ -2123,6 +2210,69 @@ class DataStore:
             logger.error(error_msg, exc_info=True)
             return []
 
+
+async def fetch_legislation_details(session_factory: Callable[[], Any],
+                                    legislation_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Async counterpart of DataStore.get_legislation_details().
+
+    The legislation row (with sponsors, priority and impact data), its latest
+    text and its latest analysis are fetched concurrently. An AsyncSession
+    runs one statement at a time, so each query gets its own session and
+    connection.
+
+    Args:
+        session_factory: async_sessionmaker from init_async_db()
+        legislation_id: The ID of the legislation.
+
+    Returns:
+        Optional[Dict[str, Any]]: Detailed record, or None if not found.
+
+    Raises:
+        ValidationError: If legislation_id is invalid
+        ASYNC_DB_ERRORS: If the async driver cannot connect or run the queries
+        DatabaseOperationError: On other database errors
+    """
+    if not isinstance(legislation_id, int) or legislation_id <= 0:
+        raise ValidationError(f"legislation_id must be a positive integer, got {legislation_id}")
+
+    async def first(stmt):
+        async with session_factory() as session:
+            return (await session.execute(stmt)).scalars().first()
+
+    # Relationships read by _legislation_details_dict(); lazy loads are not
+    # available once the async session is closed
+    leg_options = [selectinload(Legislation.sponsors)]
+    if HAS_PRIORITY_MODEL:
+        leg_options.append(selectinload(Legislation.priority))
+    if HAS_IMPACT_MODELS:
+        leg_options.append(selectinload(Legislation.impact_ratings))
+        leg_options.append(selectinload(Legislation.implementation_requirements))
+
+    try:
+        leg, latest_text, latest_analysis = await asyncio.gather(
+            first(select(Legislation).options(*leg_options).where(Legislation.id == legislation_id)),
+            first(select(LegislationText)
+                  .where(LegislationText.legislation_id == legislation_id)
+                  .order_by(desc(LegislationText.version_num))
+                  .limit(1)),
+            first(select(LegislationAnalysis)
+                  .where(LegislationAnalysis.legislation_id == legislation_id)
+                  .order_by(desc(LegislationAnalysis.analysis_version))
+                  .limit(1))
+        )
+    except ASYNC_DB_ERRORS:
+        raise
+    except SQLAlchemyError as e:
+        error_msg = f"Database error loading details for legislation {legislation_id}: {e}"
+        logger.error(error_msg, exc_info=True)
+        raise DatabaseOperationError(error_msg)
+
+    if not leg:
+        return None
+    return _legislation_details_dict(leg, latest_text, latest_analysis)
+
+
 @ensure_connection
 def get_all_priorities(self) -> List[Dict[str, Any]]:
     """
@@ -0,0 +1,278 @@
+"""
+response_cache.py
+
+Caching of read-only API responses: Redis-backed server-side caching, and
+ETag / Cache-Control headers for clients and reverse proxies.
+
+Cached bodies are stored under keys of the form "<tag>:<digest>", where the
+tag is formatted from the endpoint's arguments (e.g. "leg:{leg_id}") and the
+digest covers the remaining query parameters. Writes invalidate by tag with
+invalidate_tags(), which deletes every key under "<tag>:".
+
+Redis is optional. Caching is enabled only when redis is installed and
+REDIS_URL is set; otherwise cached_response() leaves endpoints unchanged.
+Redis errors are logged and treated as cache misses.
+
+http_cache() is independent of Redis: it tags each response with an ETag
+over its body and answers a matching If-None-Match with 304.
+
+single_flight() coalesces identical concurrent calls so that only one of them
+runs the endpoint and the rest share its result.
+"""
+
+import os
+import json
+import inspect
+import hashlib
+import logging
+from datetime import date
+from functools import wraps
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from starlette.concurrency import run_in_threadpool
+
+try:
+    import redis
+    HAS_REDIS_LIB = True
+except ImportError:
+    HAS_REDIS_LIB = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+HAS_REDIS = HAS_REDIS_LIB and bool(REDIS_URL)
+
+# Argument types that identify a request; DataStore, Request etc. are skipped
+_KEY_ARG_TYPES = (str, int, float, bool, date, type(None))
+
+_client = redis.Redis.from_url(REDIS_URL) if HAS_REDIS else None
+
+
+def _cache_key(tag: str, kwargs: dict) -> str:
+    """Build "<tag>:<digest>" from the endpoint's simple keyword arguments."""
+    params = sorted((k, v) for k, v in kwargs.items() if isinstance(v, _KEY_ARG_TYPES))
+    digest = hashlib.sha1(repr(params).encode("utf-8")).hexdigest()
+    return f"{tag}:{digest}"
+
+
+def _encode(result: Any) -> bytes:
+    """Return the JSON body for an endpoint result."""
+    if isinstance(result, Response):
+        return result.body
+    data = jsonable_encoder(result)
+    return orjson.dumps(data) if HAS_ORJSON else json.dumps(data).encode("utf-8")
+
+
+def _read(key: str) -> Optional[bytes]:
+    """Return the cached body for a key, or None on a miss or Redis error."""
+    try:
+        return _client.get(key)
+    except redis.RedisError as e:
+        logger.warning("Response cache read failed for %s: %s", key, e)
+        return None
+
+
+def _write(key: str, result: Any, ttl_seconds: int) -> None:
+    """Store an endpoint result's body under a key, logging Redis errors."""
+    try:
+        _client.set(key, _encode(result), ex=ttl_seconds)
+    except redis.RedisError as e:
+        logger.warning("Response cache write failed for %s: %s", key, e)
+
+
+def cached_response(tag: str, ttl_seconds: int) -> Callable:
+    """
+    Decorator to cache a read-only endpoint's JSON body in Redis.
+
+    Hits return the stored bytes directly, skipping the endpoint and its
+    serialization. Apply it below log_api_call so cached calls are still
+    logged. For async endpoints the Redis calls run in the threadpool.
+
+    Args:
+        tag: Invalidation tag, formatted with the endpoint's keyword
+            arguments (e.g. "leg:{leg_id}")
+        ttl_seconds: Time in seconds before a cached body expires
+
+    Returns:
+        Decorator for the endpoint function
+    """
+    def decorator(func: Callable) -> Callable:
+        if not HAS_REDIS:
+            return func
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = _cache_key(tag.format(**kwargs), kwargs)
+                body = await run_in_threadpool(_read, key)
+                if body is not None:
+                    return Response(content=body, media_type="application/json")
+
+                result = await func(*args, **kwargs)
+                await run_in_threadpool(_write, key, result, ttl_seconds)
+                return result
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _cache_key(tag.format(**kwargs), kwargs)
+            body = _read(key)
+            if body is not None:
+                return Response(content=body, media_type="application/json")
+
+            result = func(*args, **kwargs)
+            _write(key, result, ttl_seconds)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    Delete every cached response under the given tags.
+
+    Matching is by key prefix, so a leading part of a tag clears everything
+    below it (e.g. "leg" clears "leg:list" and every "leg:{leg_id}").
+
+    Args:
+        *tags: Tags as used in cached_response(), already formatted
+    """
+    if not HAS_REDIS:
+        return
+    try:
+        for tag in tags:
+            keys = list(_client.scan_iter(match=f"{tag}:*", count=500))
+            if keys:
+                _client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning("Response cache invalidation failed for %s: %s", tags, e)
+
+
+def _etag_response(body: bytes, request: Request, cache_control: str) -> Response:
+    """Return body with ETag and Cache-Control headers, or 304 if it matches If-None-Match."""
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or
+                          etag in (t.strip() for t in if_none_match.split(","))):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def http_cache(max_age: int, stale_while_revalidate: int = 0) -> Callable:
+    """
+    Decorator adding ETag and Cache-Control headers to a GET endpoint.
+
+    The ETag is a BLAKE2b digest of the JSON body. A request whose
+    If-None-Match lists it gets an empty 304. A Request parameter is added to
+    the endpoint's signature so FastAPI passes it in; the endpoint itself is
+    called without it.
+
+    Args:
+        max_age: Shared-cache lifetime in seconds (s-maxage)
+        stale_while_revalidate: Seconds a proxy may serve a stale copy while
+            it revalidates
+
+    Returns:
+        Decorator for the endpoint function
+    """
+    cache_control = f"public, s-maxage={max_age}"
+    if stale_while_revalidate:
+        cache_control += f", stale-while-revalidate={stale_while_revalidate}"
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, _http_cache_request: Request, **kwargs):
+                body = _encode(await func(*args, **kwargs))
+                return _etag_response(body, _http_cache_request, cache_control)
+        else:
+            @wraps(func)
+            def wrapper(*args, _http_cache_request: Request, **kwargs):
+                body = _encode(func(*args, **kwargs))
+                return _etag_response(body, _http_cache_request, cache_control)
+
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("_http_cache_request", inspect.Parameter.KEYWORD_ONLY,
+                              annotation=Request)
+        ])
+        return wrapper
+
+    return decorator
+
+
+class _InflightCall:
+    """Result slot for a call that other threads may be waiting on."""
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+_inflight: Dict[str, _InflightCall] = {}
+_inflight_lock = Lock()
+
+
+def single_flight(tag: str) -> Callable:
+    """
+    Decorator to coalesce identical concurrent calls of a sync endpoint.
+
+    Calls with the same tag and simple arguments that arrive while one is
+    running wait for it and return its result (or raise its exception)
+    instead of repeating the work. Results are shared, so the endpoint must
+    not return objects that callers mutate.
+
+    Args:
+        tag: Key prefix, formatted with the endpoint's keyword arguments
+
+    Returns:
+        Decorator for the endpoint function
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _cache_key(tag.format(**kwargs), kwargs)
+            with _inflight_lock:
+                call = _inflight.get(key)
+                leader = call is None
+                if leader:
+                    call = _inflight[key] = _InflightCall()
+
+            if not leader:
+                call.done.wait()
+                if call.error is not None:
+                    raise call.error
+                return call.result
+
+            try:
+                call.result = func(*args, **kwargs)
+                return call.result
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with _inflight_lock:
+                    del _inflight[key]
+                call.done.set()
+
+        return wrapper
+
+    return decorator
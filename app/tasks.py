@@ -0,0 +1,116 @@
+"""
+tasks.py
+
+Celery tasks for long-running work that should not run inside the API
+process. AI analysis can take minutes of LLM I/O; queuing it here keeps the
+uvicorn workers free for incoming requests.
+
+Celery is optional. Tasks are only registered when celery is installed and
+CELERY_BROKER_URL is set; otherwise HAS_CELERY is False and the API falls
+back to in-process background tasks.
+
+Run a worker:
+   celery -A app.tasks:celery_app worker --loglevel=INFO
+"""
+
+import os
+import logging
+from typing import Any, Dict, Optional
+
+try:
+    from celery import Celery
+    from celery.result import AsyncResult
+    HAS_CELERY_LIB = True
+except ImportError:
+    HAS_CELERY_LIB = False
+
+logger = logging.getLogger(__name__)
+
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
+CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", CELERY_BROKER_URL)
+
+HAS_CELERY = HAS_CELERY_LIB and bool(CELERY_BROKER_URL)
+
+# Session factory for worker processes, created on first task
+_session_factory = None
+
+
+def _get_session():
+    """Return a new database session for a task, creating the factory once."""
+    global _session_factory
+    if _session_factory is None:
+        from app.models import init_db
+        _session_factory = init_db()
+    return _session_factory()
+
+
+if HAS_CELERY:
+    celery_app = Celery("policypulse",
+                        broker=CELERY_BROKER_URL,
+                        backend=CELERY_RESULT_BACKEND)
+    celery_app.conf.update(
+        task_serializer="json",
+        result_serializer="json",
+        accept_content=["json"],
+        task_acks_late=True,
+        worker_prefetch_multiplier=1,
+        result_expires=24 * 60 * 60,
+    )
+
+    @celery_app.task(name="policypulse.analyze_bill")
+    def analyze_bill(legislation_id: int,
+                     options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run AI analysis for a legislation record in a worker process.
+
+        Args:
+            legislation_id: ID of the legislation to analyze
+            options: AnalysisOptions fields as a dict; model_name selects the
+                model when set
+
+        Returns:
+            Summary of the stored analysis
+        """
+        from app.ai_analysis import AIAnalysis
+        from app.response_cache import invalidate_tags
+
+        session = _get_session()
+        try:
+            analyzer_kwargs = {}
+            if options and options.get("model_name"):
+                analyzer_kwargs["model_name"] = options["model_name"]
+            analysis_obj = AIAnalysis(db_session=session, **analyzer_kwargs).analyze_legislation(
+                legislation_id=legislation_id)
+            invalidate_tags(f"leg:{legislation_id}", "leg:list", "dashboard")
+            return {
+                "legislation_id": legislation_id,
+                "analysis_id": analysis_obj.id,
+                "analysis_version": analysis_obj.analysis_version,
+                "analysis_date": analysis_obj.analysis_date.isoformat()
+                if analysis_obj.analysis_date else None
+            }
+        except Exception as e:
+            logger.error("Error in queued analysis for legislation ID=%s: %s",
+                         legislation_id, e, exc_info=True)
+            raise
+        finally:
+            session.close()
+else:
+    celery_app = None
+    analyze_bill = None
+
+
+def get_task_state(task_id: str) -> Optional[str]:
+    """
+    Look up the state of a queued task.
+
+    Args:
+        task_id: Celery task ID
+
+    Returns:
+        Celery state name (PENDING, STARTED, SUCCESS, FAILURE, ...), or None
+        if no task queue is configured
+    """
+    if not HAS_CELERY:
+        return None
+    return AsyncResult(task_id, app=celery_app).state
@@ -334,6 +334,7 @@ CREATE TABLE sync_errors (
 CREATE INDEX idx_legislation_status ON legislation(bill_status);
 CREATE INDEX idx_legislation_dates ON legislation(bill_introduced_date, bill_last_action_date);
 CREATE INDEX idx_legislation_change ON legislation(change_hash);
+CREATE INDEX idx_legislation_updated_at ON legislation(updated_at);
 CREATE INDEX idx_legislation_search ON legislation USING gin(search_vector);
 CREATE INDEX idx_amendments_legislation ON amendments(legislation_id);
 CREATE INDEX idx_amendments_date ON amendments(amendment_date);